@@ -0,0 +1,113 @@
+"""Size vs. throughput of artifact compression codecs on a synthetic assessment summary.
+
+Usage:
+    python benchmarks/bench_compression.py --findings 20000
+    python benchmarks/bench_compression.py --findings 100000 --levels gzip:1,6,9 zstd:1,3,10,19
+
+The summary is assessed once, then written with `write_json` and read back with `read_json`
+for each codec and level (plus uncompressed). Throughput is reported in MB/s of uncompressed
+JSON so rows compare directly (both include JSON encoding/decoding, as the CLI pays it);
+`ratio` is compressed size / uncompressed size. zstd rows are skipped when zstandard is not
+installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from msb.io.artifacts import CODECS, read_json, with_codec_suffix, write_json
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import assess_fixture_pack
+from msb.synthetic import SyntheticPackConfig, write_synthetic_pack
+
+FINDINGS_PER_TARGET = 100
+DEFAULT_LEVELS = "gzip:1,6,9 zstd:1,3,10,19"
+
+
+def parse_levels(spec: str) -> list[tuple[str | None, int | None]]:
+    runs: list[tuple[str | None, int | None]] = [(None, None)]
+    for part in spec.split():
+        codec, _, levels = part.partition(":")
+        if codec not in CODECS:
+            raise SystemExit(f"Unknown codec {codec!r} (supported: {sorted(CODECS)})")
+        if codec == "zstd" and importlib.util.find_spec("zstandard") is None:
+            print("zstandard not installed; skipping zstd")
+            continue
+        runs.extend((codec, int(level)) for level in levels.split(",") if level.strip())
+    return runs
+
+
+def _best_of(repeat: int, fn: Any) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+    findings: int, runs: list[tuple[str | None, int | None]], work: Path, repeat: int
+) -> list[dict[str, Any]]:
+    config = SyntheticPackConfig(
+        targets=max(1, findings // FINDINGS_PER_TARGET),
+        findings_per_target=min(findings, FINDINGS_PER_TARGET),
+    )
+    write_synthetic_pack(work / "pack", config)
+    summary = assess_fixture_pack(load_fixture_pack(work / "pack")).model_dump(mode="json")
+    raw_mb = len(json.dumps(summary, indent=2, sort_keys=True).encode("utf-8")) / (1024 * 1024)
+
+    rows: list[dict[str, Any]] = []
+    for codec, level in runs:
+        path = with_codec_suffix(work / f"summary-{codec}-{level}.json", codec)
+        write_s = _best_of(repeat, lambda p=path, lv=level: write_json(p, summary, level=lv))
+        read_s = _best_of(repeat, lambda p=path: read_json(p))
+        size_mb = path.stat().st_size / (1024 * 1024)
+        rows.append(
+            {
+                "codec": codec or "none",
+                "level": level,
+                "size_mb": round(size_mb, 3),
+                "ratio": round(size_mb / raw_mb, 4),
+                "write_mb_s": round(raw_mb / write_s, 1),
+                "read_mb_s": round(raw_mb / read_s, 1),
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--findings", type=int, default=20_000)
+    parser.add_argument(
+        "--levels", default=DEFAULT_LEVELS, help="Space-separated codec:level,level,... groups."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions per run.")
+    parser.add_argument("--json", type=Path, help="Also write results to this file.")
+    args = parser.parse_args(argv)
+
+    runs = parse_levels(args.levels)
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as tmp:
+        rows = run(args.findings, runs, Path(tmp), args.repeat)
+    print(
+        f"{'codec':<6} {'level':>5} {'size MB':>9} {'ratio':>7} {'write MB/s':>11} {'read MB/s':>10}"
+    )
+    for r in rows:
+        level = "-" if r["level"] is None else str(r["level"])
+        print(
+            f"{r['codec']:<6} {level:>5} {r['size_mb']:>9.3f} {r['ratio']:>7.3f} "
+            f"{r['write_mb_s']:>11.1f} {r['read_mb_s']:>10.1f}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
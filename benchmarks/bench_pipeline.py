@@ -0,0 +1,189 @@
+"""Per-stage time and peak-memory benchmark of the assessment pipeline on synthetic packs.
+
+Usage:
+    python benchmarks/bench_pipeline.py --sizes 1000,10000 --check
+    python benchmarks/bench_pipeline.py --sizes 1000,100000,1000000
+
+Each size generates a deterministic pack (see `msb.synthetic`) in a temp directory and runs
+load -> assess -> coverage -> plan -> serialize -> compare -> render, recording wall time and
+tracemalloc peak per stage. `--check` fails (exit 1) when a stage is slower or larger than the
+stored baseline beyond the tolerance; sizes without a baseline entry are reported only.
+Timings include tracemalloc overhead, so compare them only against baselines taken the same
+way on similar hardware (100k+ findings need several GB of RAM under tracing).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from msb.compare import compare_summaries
+from msb.io.artifacts import write_csv, write_json
+from msb.io.fixtures import load_fixture_pack
+from msb.prioritization import build_backlog_and_roadmap
+from msb.reporting import render_html_report, render_markdown_report
+from msb.scoring import assess_fixture_pack, build_coverage_aggregator
+from msb.synthetic import SyntheticPackConfig, write_synthetic_pack
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+FINDINGS_PER_TARGET = 100
+
+
+def _measure(results: dict[str, dict[str, float]], stage: str, fn: Callable[[], Any]) -> Any:
+    tracemalloc.reset_peak()
+    start_current, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    results[stage] = {
+        "seconds": round(elapsed, 4),
+        "peak_mb": round(max(0, peak - start_current) / (1024 * 1024), 2),
+    }
+    return value
+
+
+def run_size(findings: int, work: Path) -> dict[str, dict[str, float]]:
+    config = SyntheticPackConfig(
+        targets=max(1, findings // FINDINGS_PER_TARGET),
+        findings_per_target=min(findings, FINDINGS_PER_TARGET),
+    )
+    pack_dir = work / f"pack-{findings}"
+    write_synthetic_pack(pack_dir, config)
+    out = work / f"out-{findings}"
+    out.mkdir()
+
+    results: dict[str, dict[str, float]] = {}
+    tracemalloc.start()
+    try:
+        pack = _measure(results, "load", lambda: load_fixture_pack(pack_dir))
+        assessment = _measure(results, "assess", lambda: assess_fixture_pack(pack))
+        coverage = _measure(
+            results,
+            "coverage",
+            lambda: build_coverage_aggregator(assessment.mapped_findings, assessment.targets),
+        )
+        backlog, roadmap = _measure(
+            results, "plan", lambda: build_backlog_and_roadmap(assessment.mapped_findings)
+        )
+
+        def _serialize() -> dict[str, Any]:
+            summary: dict[str, Any] = assessment.model_dump(mode="json")
+            write_json(out / "summary.json", summary)
+            table = coverage.to_table()
+            write_csv(out / "controls_coverage.csv", table.to_rows(), table.headers)
+            write_csv(out / "remediation_backlog.csv", backlog.to_rows(), backlog.headers)
+            write_csv(out / "roadmap.csv", roadmap.to_rows(), roadmap.headers)
+            return summary
+
+        summary = _measure(results, "serialize", _serialize)
+        comparison = _measure(results, "compare", lambda: compare_summaries(summary, summary))
+
+        def _render() -> None:
+            kwargs: dict[str, Any] = {
+                "title": "Benchmark",
+                "author": None,
+                "compare_obj": comparison,
+                "remediation_backlog_csv_path": out / "remediation_backlog.csv",
+                "roadmap_csv_path": out / "roadmap.csv",
+                "controls_coverage_csv_path": out / "controls_coverage.csv",
+            }
+            render_markdown_report(**kwargs)
+            render_html_report(**kwargs)
+
+        _measure(results, "render", _render)
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def check_against_baseline(
+    current: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    *,
+    time_tolerance: float,
+    memory_tolerance: float,
+    time_slack: float,
+) -> list[str]:
+    failures: list[str] = []
+    for size, stages in current.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if base is None:
+                continue
+            # Short stages are dominated by noise, so an absolute slack applies on top.
+            time_limit = max(base["seconds"] * (1.0 + time_tolerance), base["seconds"] + time_slack)
+            mem_limit = max(base["peak_mb"] * (1.0 + memory_tolerance), base["peak_mb"] + 1.0)
+            if metrics["seconds"] > time_limit:
+                failures.append(
+                    f"{size}/{stage}: {metrics['seconds']:.3f}s > {time_limit:.3f}s "
+                    f"(baseline {base['seconds']:.3f}s)"
+                )
+            if metrics["peak_mb"] > mem_limit:
+                failures.append(
+                    f"{size}/{stage}: {metrics['peak_mb']:.1f}MB > {mem_limit:.1f}MB "
+                    f"(baseline {base['peak_mb']:.1f}MB)"
+                )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument(
+        "--sizes", default="1000,100000,1000000", help="Comma-separated finding counts."
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--check", action="store_true", help="Fail on regressions vs baseline.")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--time-slack", type=float, default=0.25, help="Seconds.")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--json", type=Path, help="Also write results to this file.")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    current: dict[str, dict[str, dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory(prefix="msb-bench-") as tmp:
+        for size in sizes:
+            current[str(size)] = run_size(size, Path(tmp))
+            for stage, m in current[str(size)].items():
+                print(f"{size:>9} {stage:<10} {m['seconds']:>9.3f}s {m['peak_mb']:>9.1f}MB")
+
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    baseline: dict[str, dict[str, dict[str, float]]] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    if args.update_baseline:
+        baseline.update(current)
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if args.check:
+        failures = check_against_baseline(
+            current,
+            baseline,
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+            time_slack=args.time_slack,
+        )
+        for f in failures:
+            print(f"REGRESSION {f}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from msb.models import Asset, Finding, MappedFinding, Target
+
+# (target_id, asset_id): asset ids are only unique within their target's inventory.
+AssetKey = tuple[str, str]
+Label = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class AssetWeights:
+    """Blast-radius weight per asset: the largest weight among its matching labels.
+
+    `default` applies only to assets with no weighted label, so a label can also lower an
+    asset's weight (e.g. `tier=dev` at 0.5).
+    """
+
+    default: float = 1.0
+    labels: dict[Label, float] = field(
+        default_factory=lambda: {("privileged", "true"): 3.0, ("tier", "prod"): 2.0}
+    )
+
+    def weight(self, asset: Asset) -> float:
+        matched = [self.labels[label] for label in asset.labels.items() if label in self.labels]
+        return max(matched) if matched else self.default
+
+    @classmethod
+    def from_obj(cls, obj: dict[str, Any]) -> AssetWeights:
+        labels: dict[Label, float] = {}
+        for spec, weight in obj.get("labels", {}).items():
+            key, sep, value = spec.partition("=")
+            if not sep or not key:
+                raise ValueError(f"Asset weight label must be 'key=value', got: {spec!r}")
+            if float(weight) < 0:
+                raise ValueError(f"Asset weight for {spec!r} must be >= 0")
+            labels[(key, value)] = float(weight)
+        return cls(default=float(obj.get("default", 1.0)), labels=labels)
+
+    @classmethod
+    def load(cls, path: Path) -> AssetWeights:
+        return cls.from_obj(json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass(frozen=True)
+class AssetRisk:
+    target_id: str
+    asset_id: str
+    asset_type: str
+    name: str
+    risk: float
+    finding_count: int
+
+
+@dataclass(frozen=True, eq=False)
+class AssetIndex:
+    by_key: dict[AssetKey, Asset]
+    by_label: dict[Label, frozenset[AssetKey]]
+
+    @classmethod
+    def build(cls, targets: Iterable[Target]) -> AssetIndex:
+        by_key: dict[AssetKey, Asset] = {}
+        by_label: dict[Label, set[AssetKey]] = {}
+        for target in targets:
+            for asset in target.assets:
+                key = (target.target_id, asset.asset_id)
+                if key in by_key:
+                    raise ValueError(
+                        f"Duplicate asset_id {asset.asset_id!r} in target {target.target_id!r}"
+                    )
+                by_key[key] = asset
+                for label in asset.labels.items():
+                    by_label.setdefault(label, set()).add(key)
+        return cls(by_key=by_key, by_label={k: frozenset(v) for k, v in by_label.items()})
+
+    def get(self, target_id: str, asset_id: str) -> Asset | None:
+        return self.by_key.get((target_id, asset_id))
+
+    def with_label(self, key: str, value: str) -> frozenset[AssetKey]:
+        return self.by_label.get((key, value), frozenset())
+
+    def unknown_assets(self, findings: Iterable[Finding]) -> list[tuple[str, str]]:
+        """(finding_id, asset_id) for every affected asset missing from its target's inventory."""
+        return [
+            (f.finding_id, a)
+            for f in findings
+            for a in f.affected_assets
+            if (f.target_id, a) not in self.by_key
+        ]
+
+    def validate(self, findings: Iterable[Finding]) -> None:
+        unknown = self.unknown_assets(findings)
+        if unknown:
+            shown = ", ".join(f"{fid}->{aid}" for fid, aid in unknown[:20])
+            more = f" (+{len(unknown) - 20} more)" if len(unknown) > 20 else ""
+            raise ValueError(f"Findings reference unknown asset_id(s): {shown}{more}")
+
+    def blast_radius(self, finding: Finding, weights: AssetWeights | None = None) -> float:
+        # Without weights every listed asset counts once, matching len(affected_assets).
+        if weights is None:
+            return float(len(finding.affected_assets))
+        total = 0.0
+        for asset_id in finding.affected_assets:
+            asset = self.by_key.get((finding.target_id, asset_id))
+            total += weights.weight(asset) if asset is not None else weights.default
+        return total
+
+    def risk_by_asset(
+        self, mapped_findings: Iterable[MappedFinding], *, n: int | None = None
+    ) -> list[AssetRisk]:
+        """Assets ranked by the total risk of findings touching them (one pass over findings)."""
+        risk: dict[AssetKey, float] = {}
+        counts: dict[AssetKey, int] = {}
+        for mf in mapped_findings:
+            target_id = mf.finding.target_id
+            for asset_id in mf.finding.affected_assets:
+                key = (target_id, asset_id)
+                risk[key] = risk.get(key, 0.0) + mf.risk_score
+                counts[key] = counts.get(key, 0) + 1
+
+        ranked = sorted(risk.items(), key=lambda kv: (-kv[1], kv[0]))
+        if n is not None:
+            ranked = ranked[:n]
+        out: list[AssetRisk] = []
+        for (target_id, asset_id), total in ranked:
+            asset = self.by_key.get((target_id, asset_id))
+            out.append(
+                AssetRisk(
+                    target_id=target_id,
+                    asset_id=asset_id,
+                    asset_type=asset.asset_type if asset is not None else "",
+                    name=asset.name if asset is not None else "",
+                    risk=total,
+                    finding_count=counts[(target_id, asset_id)],
+                )
+            )
+        return out
@@ -1,32 +1,75 @@
 from __future__ import annotations
 
 import json
+import tracemalloc
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from msb.compare import compare_summaries
-from msb.demo_flow import run_demo
 from msb.io.artifacts import (
+    CODECS,
+    check_level,
     ensure_dir,
-    write_csv,
+    find_artifact,
+    read_json,
+    read_text,
+    with_codec_suffix,
     write_json,
     write_text,
 )
-from msb.io.fixtures import load_fixture_pack
-from msb.reporting import render_html_report, render_markdown_report
-from msb.scoring import assess_fixture_pack, compute_controls_coverage
+from msb.utils.instrumentation import span, start_collecting
 from msb.utils.logging import configure_logging
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.console import Console
+
+    from msb.models import EstimateBand, MappedFinding
+    from msb.scoring.profile import CompiledScoringProfile
+    from msb.utils.instrumentation import SpanCollector
+
+# Keep this module's imports light: the CLI is spawned many times from CI fan-out, so pydantic
+# models, Jinja2 and rich are imported inside the commands that use them. See
+# tests/test_cli_startup.py for the enforced import-time budget.
+
 app = typer.Typer(no_args_is_help=True, add_completion=False)
-console = Console()
+
+
+@cache
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+def _note_output_dir(path: Path) -> None:
+    from msb.utils.profiling import note_output_dir
+
+    note_output_dir(path)
+
+
+def _artifact_paths(
+    out: Path, compress: str | None, level: int | None = None
+) -> Callable[[str], Path]:
+    # Output file names gain .gz/.zst with --compress; the codec follows from the suffix.
+    if compress is not None and compress not in CODECS:
+        raise typer.BadParameter(f"must be one of {sorted(CODECS)}", param_hint="--compress")
+    if level is not None:
+        if compress is None:
+            raise typer.BadParameter("requires --compress", param_hint="--compress-level")
+        try:
+            check_level(compress, level)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--compress-level") from exc
+    return lambda name: with_codec_suffix(out / name, compress)
 
 
 @app.callback()
 def _global(
+    ctx: typer.Context,
     json_logs: bool = typer.Option(
         False,
         "--json-logs/--no-json-logs",
@@ -39,50 +82,640 @@ def _global(
         envvar="MSB_LOG_LEVEL",
         help="Logging level (DEBUG, INFO, WARNING, ERROR).",
     ),
+    timings: bool = typer.Option(
+        False,
+        "--timings/--no-timings",
+        envvar="MSB_TIMINGS",
+        help="Print a per-stage timing/memory table when the command finishes.",
+    ),
+    trace_memory: bool = typer.Option(
+        False,
+        "--trace-memory",
+        envvar="MSB_TRACE_MEMORY",
+        help="Record tracemalloc peaks per stage (slower; also via MSB_TRACE_MEMORY=1).",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        envvar="MSB_PROFILE",
+        help="Profile the command: writes .pstats + collapsed stacks and prints hot functions.",
+    ),
+    profile_dir: Path | None = typer.Option(
+        None,
+        "--profile-dir",
+        help="Where to write profile files (default: the command's output directory).",
+    ),
 ) -> None:
     configure_logging(json_logs=json_logs, level=log_level)
+    if profile:
+        from msb.utils.profiling import start_profiling
+
+        command = ctx.invoked_subcommand or "msb"
+        ctx.call_on_close(lambda: _write_profile(command, profile_dir))
+        start_profiling()
+    if trace_memory:
+        tracemalloc.start()
+    if timings:
+        collector = start_collecting()
+        ctx.call_on_close(lambda: _print_timings(collector))
+
+
+def _write_profile(command: str, profile_dir: Path | None) -> None:
+    from rich.table import Table
+
+    from msb.utils.profiling import finish_profiling
+
+    session = finish_profiling()
+    if session is None:
+        return
+    out_dir = profile_dir or session.output_dir or Path.cwd()
+    pstats_path, collapsed_path = session.write(out_dir, f"msb-{command}.profile")
+
+    table = Table(title=f"Hot Functions (msb {command})")
+    table.add_column("Function")
+    table.add_column("Calls", justify="right")
+    table.add_column("Self s", justify="right")
+    table.add_column("Cumulative s", justify="right")
+    for hot in session.hot_functions():
+        table.add_row(
+            hot.function,
+            str(hot.calls),
+            f"{hot.self_seconds:.4f}",
+            f"{hot.cumulative_seconds:.4f}",
+        )
+    console = _console()
+    console.print(table)
+    console.print(f"Wrote: {pstats_path}")
+    console.print(f"Wrote: {collapsed_path}")
+
+
+def _print_timings(collector: SpanCollector) -> None:
+    from rich.table import Table
+
+    table = Table(title="Stage Timings")
+    table.add_column("Stage")
+    table.add_column("ms", justify="right")
+    table.add_column("Records", justify="right")
+    table.add_column("Records/s", justify="right")
+    table.add_column("Peak RSS MB", justify="right")
+    table.add_column("Traced peak MB", justify="right")
+    for row in collector.summary_rows():
+        table.add_row(*row)
+    _console().print(table)
+
+
+_SCORING_PROFILE_OPTION = typer.Option(
+    None,
+    "--scoring-profile",
+    exists=True,
+    dir_okay=False,
+    help="Scoring profile JSON (weights, normalization, planner thresholds); default: built-in.",
+)
+_COMPRESS_OPTION = typer.Option(
+    None,
+    "--compress",
+    help="Compress JSON/CSV outputs: gzip (.gz) or zstd (.zst, needs zstandard).",
+)
+_COMPRESS_LEVEL_OPTION = typer.Option(
+    None, "--compress-level", help="Codec level (gzip 1-9, default 6; zstd 1-22, default 3)."
+)
+_PARQUET_OPTION = typer.Option(
+    False, "--parquet", help="Also write typed, columnar Parquet tables (needs pyarrow)."
+)
 
 
 @app.command()
 def assess(
-    input: Path = typer.Option(..., "--input", exists=True, file_okay=False, dir_okay=True),
+    input: list[Path] = typer.Option(
+        ...,
+        "--input",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Fixture pack directory (repeatable; several packs are loaded concurrently).",
+    ),
     out: Path = typer.Option(..., "--out"),
+    load_concurrency: int = typer.Option(
+        8, "--load-concurrency", min=1, help="Fixture packs read and validated at once."
+    ),
+    framework: list[str] | None = typer.Option(
+        None,
+        "--framework",
+        help="Framework key to map against (repeatable; default: all registered frameworks).",
+    ),
+    rules: Path | None = typer.Option(
+        None,
+        "--rules",
+        exists=True,
+        dir_okay=False,
+        help="Mapping rules JSON replacing the packaged tag/evidence rules.",
+    ),
+    weight_assets: bool = typer.Option(
+        False,
+        "--weight-assets",
+        help="Weight blast radius by asset labels (privileged=true x3, tier=prod x2).",
+    ),
+    asset_weights: Path | None = typer.Option(
+        None,
+        "--asset-weights",
+        exists=True,
+        dir_okay=False,
+        help='Custom label weights JSON, e.g. {"default": 1, "labels": {"tier=prod": 2}}.',
+    ),
+    scoring_mode: str = typer.Option(
+        "raw",
+        "--scoring-mode",
+        help="raw: every finding counts toward the org score; correlated: repeated findings "
+        "across targets count once.",
+    ),
+    scoring_profile: Path | None = _SCORING_PROFILE_OPTION,
+    uncertainty_draws: int = typer.Option(
+        0,
+        "--uncertainty-draws",
+        min=0,
+        help="Monte Carlo draws for posture confidence bands (0 disables; needs numpy).",
+    ),
+    confidence: float = typer.Option(0.9, "--confidence", min=0.5, max=0.999),
+    rollup: list[str] | None = typer.Option(
+        None,
+        "--rollup",
+        help="Precompute a posture rollup (repeatable), e.g. provider, provider/environment, "
+        "label.business_unit/label.account.",
+    ),
+    seed: int = typer.Option(
+        0, "--seed", help="Random seed for --uncertainty-draws and --approximate sampling."
+    ),
+    approximate: bool = typer.Option(
+        False,
+        "--approximate",
+        help="Estimate posture, coverage and top assets from a stratified sample, with "
+        "error bounds at --confidence.",
+    ),
+    sample_per_stratum: int = typer.Option(
+        8,
+        "--sample-per-stratum",
+        min=2,
+        help="Findings sampled per (target, category) for --approximate.",
+    ),
+    checkpoint_dir: Path | None = typer.Option(
+        None,
+        "--checkpoint-dir",
+        file_okay=False,
+        help="Checkpoint progress here; rerunning the same command resumes an interrupted run.",
+    ),
+    checkpoint_every: int = typer.Option(
+        10_000, "--checkpoint-every", min=1, help="Findings processed between checkpoints."
+    ),
+    parquet: bool = _PARQUET_OPTION,
+    compress: str | None = _COMPRESS_OPTION,
+    compress_level: int | None = _COMPRESS_LEVEL_OPTION,
+    partitioned: bool = typer.Option(
+        False,
+        "--partitioned",
+        help="Also write summary/index.json plus one shard per target for selective reads.",
+    ),
 ) -> None:
-    """Assess a fixture pack (targets + findings) and write summary artifacts."""
-    fixture_pack = load_fixture_pack(input)
-    assessment = assess_fixture_pack(fixture_pack)
-    coverage = compute_controls_coverage(assessment.mapped_findings)
+    """Assess one or more fixture packs (targets + findings) and write summary artifacts."""
+    from rich.table import Table
 
-    ensure_dir(out)
-    write_json(out / "summary.json", assessment.model_dump(mode="json"))
-    write_csv(out / "controls_coverage.csv", coverage.to_rows(), coverage.headers)
+    from msb.assets import AssetWeights
+    from msb.io.artifacts import write_csv
+    from msb.io.fixtures import (
+        FixtureValidationError,
+        load_fixture_pack,
+        load_fixture_packs,
+        merge_fixture_packs,
+    )
+    from msb.mappings import load_rule_set
+    from msb.models import ScoringMode
+    from msb.scoring import (
+        assess_fixture_pack,
+        build_coverage_aggregator,
+        estimate_posture_uncertainty,
+        load_scoring_profile,
+        parse_rollup,
+    )
+
+    _note_output_dir(out)
+    artifact = _artifact_paths(out, compress, compress_level)
+    modes = [m.value for m in ScoringMode]
+    if scoring_mode not in modes:
+        raise typer.BadParameter(f"must be one of {modes}", param_hint="--scoring-mode")
+
+    try:
+        rollups = [parse_rollup(spec) for spec in rollup or []]
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--rollup") from exc
+    profile = load_scoring_profile(scoring_profile) if scoring_profile is not None else None
+    weights = None
+    if asset_weights is not None:
+        weights = AssetWeights.load(asset_weights)
+    elif weight_assets:
+        weights = AssetWeights()
+
+    if approximate:
+        incompatible = {
+            "--checkpoint-dir": checkpoint_dir is not None,
+            "--partitioned": partitioned,
+            "--parquet": parquet,
+            "--uncertainty-draws": bool(uncertainty_draws),
+            "--rollup": bool(rollups),
+            "--scoring-mode": scoring_mode != ScoringMode.raw.value,
+        }
+        for flag, used in incompatible.items():
+            if used:
+                raise typer.BadParameter("cannot be combined with --approximate", param_hint=flag)
+        _approximate_assess(
+            input,
+            out,
+            artifact,
+            compress_level,
+            sample_per_stratum=sample_per_stratum,
+            confidence=confidence,
+            seed=seed,
+            frameworks=framework or None,
+            rules=load_rule_set(rules) if rules is not None else None,
+            asset_weights=weights,
+            profile=profile,
+        )
+        return
+
+    try:
+        if len(input) == 1:
+            fixture_pack = load_fixture_pack(input[0])
+        else:
+            fixture_pack = merge_fixture_packs(
+                load_fixture_packs(input, concurrency=load_concurrency)
+            )
+    except FixtureValidationError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--input") from exc
+    options: dict[str, Any] = {
+        "frameworks": framework or None,
+        "rules": load_rule_set(rules) if rules is not None else None,
+        "asset_weights": weights,
+        "scoring_mode": ScoringMode(scoring_mode),
+        "profile": profile,
+        "rollups": rollups,
+    }
+    aggregator = None
+    if checkpoint_dir is None:
+        assessment = assess_fixture_pack(fixture_pack, **options)
+    else:
+        from msb.scoring.checkpoint import assess_with_checkpoints, fingerprint_inputs
+
+        inputs = [
+            find_artifact(p / name) for p in input for name in ("targets.json", "findings.json")
+        ]
+        if rules is not None:
+            inputs.append(rules)
+        fingerprint = fingerprint_inputs(
+            inputs,
+            frameworks=sorted(framework or []),
+            asset_weights=weights,
+            scoring_mode=scoring_mode,
+            profile=profile.digest if profile is not None else None,
+        )
+        assessment, aggregator = assess_with_checkpoints(
+            fixture_pack,
+            checkpoint_dir,
+            fingerprint=fingerprint,
+            every=checkpoint_every,
+            **options,
+        )
+    if uncertainty_draws:
+        with span("uncertainty", records=len(assessment.mapped_findings), draws=uncertainty_draws):
+            try:
+                bands = estimate_posture_uncertainty(
+                    assessment, profile, draws=uncertainty_draws, confidence=confidence, seed=seed
+                )
+            except (RuntimeError, ValueError) as exc:
+                raise typer.BadParameter(str(exc), param_hint="--uncertainty-draws") from exc
+        assessment = assessment.model_copy(update={"uncertainty": bands})
+    asset_risk = fixture_pack.asset_index.risk_by_asset(assessment.mapped_findings)
+    if aggregator is None:
+        aggregator = build_coverage_aggregator(assessment.mapped_findings, assessment.targets)
+    coverage = aggregator.to_table()
+    pivot = aggregator.to_pivot_table()
+
+    with span("serialize", records=len(assessment.mapped_findings)):
+        ensure_dir(out)
+        write_json(
+            artifact("summary.json"), assessment.model_dump(mode="json"), level=compress_level
+        )
+        write_csv(
+            artifact("controls_coverage.csv"),
+            coverage.to_rows(),
+            coverage.headers,
+            level=compress_level,
+        )
+        write_csv(
+            artifact("controls_coverage_pivot.csv"),
+            pivot.to_rows(),
+            pivot.headers,
+            level=compress_level,
+        )
+        write_csv(
+            artifact("asset_risk.csv"),
+            (
+                [
+                    a.target_id,
+                    a.asset_id,
+                    a.asset_type,
+                    a.name,
+                    f"{a.risk:.2f}",
+                    str(a.finding_count),
+                ]
+                for a in asset_risk
+            ),
+            ["target_id", "asset_id", "asset_type", "name", "risk_score", "finding_count"],
+            level=compress_level,
+        )
+    if partitioned:
+        from msb.io.partitioned import write_partitioned_summary
+
+        write_partitioned_summary(out / "summary", assessment)
+    if parquet:
+        from msb.io.columnar import write_mapped_findings_parquet
+
+        with span("serialize", records=len(assessment.mapped_findings), format="parquet"):
+            try:
+                write_mapped_findings_parquet(out, assessment.mapped_findings)
+            except RuntimeError as exc:
+                raise typer.BadParameter(str(exc), param_hint="--parquet") from exc
 
     table = Table(title="Assessment Summary")
     table.add_column("Metric")
     table.add_column("Value", justify="right")
     table.add_row("Org posture score", f"{assessment.org.posture_score:.1f}")
+    if assessment.uncertainty is not None:
+        band = assessment.uncertainty.org
+        table.add_row(
+            f"{assessment.uncertainty.confidence:.0%} interval",
+            f"{band.lower:.1f} - {band.upper:.1f}",
+        )
     table.add_row("Targets assessed", str(len(assessment.targets)))
     table.add_row("Findings", str(len(assessment.mapped_findings)))
-    console.print(table)
+    if assessment.correlated_findings:
+        table.add_row("Correlated findings", str(len(assessment.correlated_findings)))
+    _console().print(table)
+
+
+def _approximate_assess(
+    input: list[Path],
+    out: Path,
+    artifact: Callable[[str], Path],
+    compress_level: int | None,
+    **options: Any,
+) -> None:
+    from rich.table import Table
+
+    from msb.io.artifacts import write_csv
+    from msb.io.fixtures import FixtureValidationError
+    from msb.scoring import approximate_assess
+
+    try:
+        estimate = approximate_assess(input, **options)
+    except FixtureValidationError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--input") from exc
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--approximate") from exc
+
+    def band(b: EstimateBand) -> list[str]:
+        return [f"{b.estimate:.2f}", f"{b.lower:.2f}", f"{b.upper:.2f}"]
+
+    with span("serialize", records=estimate.findings_sampled):
+        ensure_dir(out)
+        write_json(
+            artifact("approximate_summary.json"),
+            estimate.model_dump(mode="json"),
+            level=compress_level,
+        )
+        write_csv(
+            artifact("controls_coverage_estimate.csv"),
+            ([c.framework, c.control_theme, *band(c.finding_count)] for c in estimate.coverage),
+            ["framework", "control_theme", "finding_count", "lower", "upper"],
+            level=compress_level,
+        )
+        write_csv(
+            artifact("top_assets_estimate.csv"),
+            ([a.target_id, a.asset_id, *band(a.finding_count)] for a in estimate.top_assets),
+            ["target_id", "asset_id", "finding_count", "lower", "upper"],
+            level=compress_level,
+        )
+
+    table = Table(title="Approximate Assessment")
+    table.add_column("Metric")
+    table.add_column("Estimate", justify="right")
+    table.add_column(f"{estimate.confidence:.0%} interval", justify="right")
+    table.add_row(
+        "Org posture score",
+        f"{estimate.org.estimate:.1f}",
+        f"{estimate.org.lower:.1f} - {estimate.org.upper:.1f}",
+    )
+    for domain, b in estimate.domains.items():
+        table.add_row(f"  {domain}", f"{b.estimate:.1f}", f"{b.lower:.1f} - {b.upper:.1f}")
+    table.add_row("Targets assessed", str(len(estimate.targets)), "")
+    table.add_row(
+        "Findings sampled",
+        f"{estimate.findings_sampled} of {estimate.findings_total}",
+        f"{estimate.strata} strata",
+    )
+    _console().print(table)
 
 
 @app.command()
 def compare(
-    before: Path = typer.Option(..., "--before", exists=True, file_okay=True, dir_okay=False),
-    after: Path = typer.Option(..., "--after", exists=True, file_okay=True, dir_okay=False),
+    before: Path = typer.Option(
+        ...,
+        "--before",
+        exists=True,
+        help="summary.json, or a partitioned summary directory (assess --partitioned).",
+    ),
+    after: Path = typer.Option(..., "--after", exists=True),
     out: Path = typer.Option(..., "--out"),
+    scoring_profile: Path | None = _SCORING_PROFILE_OPTION,
+    compress: str | None = _COMPRESS_OPTION,
+    compress_level: int | None = _COMPRESS_LEVEL_OPTION,
+    target: list[str] | None = typer.Option(
+        None,
+        "--target",
+        help="Partitioned summaries only: add new/resolved findings for this target (repeatable).",
+    ),
 ) -> None:
     """Compare two assessment summaries and compute posture deltas."""
-    before_obj = json.loads(before.read_text(encoding="utf-8"))
-    after_obj = json.loads(after.read_text(encoding="utf-8"))
-    comparison = compare_summaries(before_obj, after_obj)
+    from msb.compare import compare_partitioned_summaries, compare_summaries
+    from msb.io.partitioned import is_partitioned_summary
+    from msb.scoring import load_scoring_profile
 
-    ensure_dir(out)
-    write_json(out / "compare.json", comparison)
+    _note_output_dir(out)
+    artifact = _artifact_paths(out, compress, compress_level)
+    digest = load_scoring_profile(scoring_profile).digest if scoring_profile else None
+    before_root, after_root = _partitioned_root(before), _partitioned_root(after)
+    if before.is_dir() or after.is_dir():
+        if not (is_partitioned_summary(before_root) and is_partitioned_summary(after_root)):
+            raise typer.BadParameter(
+                "directories must both hold a partitioned summary (index.json)",
+                param_hint="--before/--after",
+            )
+        try:
+            comparison = compare_partitioned_summaries(
+                before_root, after_root, targets=target or [], scoring_profile=digest
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    else:
+        if target:
+            raise typer.BadParameter("needs partitioned summaries", param_hint="--target")
+        before_obj = read_json(before)
+        after_obj = read_json(after)
+        try:
+            comparison = compare_summaries(before_obj, after_obj, scoring_profile=digest)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--scoring-profile") from exc
+
+    with span("serialize"):
+        ensure_dir(out)
+        write_json(artifact("compare.json"), comparison, level=compress_level)
 
     delta = comparison["org"]["posture"]["delta"]
     pct = comparison["org"]["posture"]["percent_change"]
-    console.print(f"[bold]Org posture delta:[/bold] {delta:+.1f} points ({pct:+.1f}%)")
+    _console().print(f"[bold]Org posture delta:[/bold] {delta:+.1f} points ({pct:+.1f}%)")
+    if not comparison["scoring_profile"]["consistent"]:
+        _console().print("[yellow]Warning:[/yellow] summaries were scored with different profiles")
+    if "targets" in comparison:
+        changed = sum(1 for r in comparison["targets"] if r["changed"])
+        _console().print(f"{changed} of {len(comparison['targets'])} targets changed")
+
+
+def _partitioned_root(path: Path) -> Path:
+    # Accept either the partitioned summary itself or the assess output directory holding it.
+    if path.is_dir() and not (path / "index.json").is_file() and (path / "summary").is_dir():
+        return path / "summary"
+    return path
+
+
+@app.command()
+def plan(
+    input: Path = typer.Option(..., "--input", exists=True, file_okay=True, dir_okay=False),
+    out: Path = typer.Option(..., "--out"),
+    scoring_profile: Path | None = _SCORING_PROFILE_OPTION,
+    parquet: bool = _PARQUET_OPTION,
+    compress: str | None = _COMPRESS_OPTION,
+    compress_level: int | None = _COMPRESS_LEVEL_OPTION,
+    sort_memory_mb: int | None = typer.Option(
+        None,
+        "--sort-memory-mb",
+        min=1,
+        help="Sort the backlog on disk in runs of about this many MB (for very large backlogs).",
+    ),
+    spill_dir: Path | None = typer.Option(
+        None,
+        "--spill-dir",
+        file_okay=False,
+        help="Directory for --sort-memory-mb run files (default: the system temp directory).",
+    ),
+) -> None:
+    """Build the remediation backlog and roadmap from an assessment summary."""
+    from msb.io.artifacts import write_csv
+    from msb.models import AssessmentSummary
+    from msb.prioritization import backlog_and_roadmap_tables, build_backlog_records
+    from msb.scoring import default_scoring_profile, load_scoring_profile
+
+    if spill_dir is not None and sort_memory_mb is None:
+        raise typer.BadParameter("requires --sort-memory-mb", param_hint="--spill-dir")
+    _note_output_dir(out)
+    artifact = _artifact_paths(out, compress, compress_level)
+    with span("load", path=str(input)):
+        summary = AssessmentSummary.model_validate_json(read_text(input))
+    profile = load_scoring_profile(scoring_profile) if scoring_profile is not None else None
+    # Stored risk scores only combine with the blast, effort and phase settings they were
+    # scored with, on both the in-memory and the spilled path.
+    digest = (profile or default_scoring_profile()).digest
+    if summary.scoring_profile is not None and summary.scoring_profile != digest:
+        raise typer.BadParameter(
+            f"Summary was scored with profile {summary.scoring_profile}, not {digest}",
+            param_hint="--scoring-profile",
+        )
+    if sort_memory_mb is not None:
+        _plan_spilled(
+            summary.mapped_findings,
+            profile,
+            out,
+            artifact,
+            compress_level,
+            memory_budget=sort_memory_mb * 1024 * 1024,
+            spill_dir=spill_dir,
+            parquet=parquet,
+        )
+        return
+    records = build_backlog_records(summary.mapped_findings, profile)
+    backlog, roadmap = backlog_and_roadmap_tables(records)
+
+    with span("serialize", records=len(backlog.rows)):
+        ensure_dir(out)
+        write_csv(
+            artifact("remediation_backlog.csv"),
+            backlog.to_rows(),
+            backlog.headers,
+            level=compress_level,
+        )
+        write_csv(artifact("roadmap.csv"), roadmap.to_rows(), roadmap.headers, level=compress_level)
+    if parquet:
+        from msb.io.columnar import write_backlog_parquet
+
+        with span("serialize", records=len(records), format="parquet"):
+            try:
+                write_backlog_parquet(out / "remediation_backlog.parquet", records)
+            except RuntimeError as exc:
+                raise typer.BadParameter(str(exc), param_hint="--parquet") from exc
+    _console().print(f"Wrote {len(backlog.rows)} backlog items to: {out}")
+
+
+def _plan_spilled(
+    mapped_findings: list[MappedFinding],
+    profile: CompiledScoringProfile | None,
+    out: Path,
+    artifact: Callable[[str], Path],
+    compress_level: int | None,
+    *,
+    memory_budget: int,
+    spill_dir: Path | None,
+    parquet: bool,
+) -> None:
+    from msb.io.artifacts import write_csv
+    from msb.prioritization import RoadmapBuilder, iter_backlog_rows, spill_backlog_records
+    from msb.prioritization.planner import BACKLOG_HEADERS
+
+    if spill_dir is not None:
+        ensure_dir(spill_dir)
+    with spill_backlog_records(
+        mapped_findings, profile, memory_budget=memory_budget, spill_dir=spill_dir
+    ) as records:
+        roadmap = RoadmapBuilder()
+        with span("serialize", records=len(records)) as s:
+            ensure_dir(out)
+            write_csv(
+                artifact("remediation_backlog.csv"),
+                iter_backlog_rows(records, roadmap),
+                BACKLOG_HEADERS,
+                level=compress_level,
+            )
+            table = roadmap.table()
+            write_csv(artifact("roadmap.csv"), table.to_rows(), table.headers, level=compress_level)
+            # Iterating spilled the last buffer, so the count is final only now.
+            s.fields["spilled_runs"] = records.spilled_runs
+        if parquet:
+            from msb.io.columnar import write_backlog_parquet
+
+            # A second merge pass over the spilled runs.
+            with span("serialize", records=len(records), format="parquet"):
+                try:
+                    write_backlog_parquet(out / "remediation_backlog.parquet", records)
+                except RuntimeError as exc:
+                    raise typer.BadParameter(str(exc), param_hint="--parquet") from exc
+        _console().print(
+            f"Wrote {len(records)} backlog items to: {out} ({records.spilled_runs} sorted runs spilled)"
+        )
 
 
 @app.command()
@@ -93,11 +726,14 @@ def report(
     author: str | None = typer.Option("Cloud Security / DevSecOps Consultant", "--author"),
 ) -> None:
     """Generate executive-friendly Markdown + HTML report from compare artifacts."""
-    compare_path = input / "compare.json"
+    from msb.reporting import render_html_report, render_markdown_report
+
+    _note_output_dir(out)
+    compare_path = find_artifact(input / "compare.json")
     if not compare_path.exists():
         raise typer.BadParameter(f"Missing compare.json at {compare_path}")
 
-    compare_obj: dict[str, Any] = json.loads(compare_path.read_text(encoding="utf-8"))
+    compare_obj: dict[str, Any] = read_json(compare_path)
     ensure_dir(out)
 
     backlog_csv = input / "remediation_backlog.csv"
@@ -121,17 +757,279 @@ def report(
         controls_coverage_csv_path=controls_csv,
     )
 
-    write_text(out / "report.md", md)
-    write_text(out / "report.html", html)
+    with span("serialize"):
+        write_text(out / "report.md", md)
+        write_text(out / "report.html", html)
+    console = _console()
     console.print(f"Wrote: {out / 'report.md'}")
     console.print(f"Wrote: {out / 'report.html'}")
 
 
+@app.command()
+def simulate(
+    input: Path = typer.Option(..., "--input", exists=True, file_okay=True, dir_okay=False),
+    phase: list[int] | None = typer.Option(
+        None,
+        "--phase",
+        min=0,
+        max=3,
+        help="Complete every backlog item in this phase (repeatable).",
+    ),
+    complete: list[str] | None = typer.Option(
+        None, "--complete", help="Complete a backlog item, finding_id:action_id (repeatable)."
+    ),
+    remove: list[str] | None = typer.Option(
+        None, "--remove", help="Treat a finding as fully resolved (repeatable)."
+    ),
+    scenarios: Path | None = typer.Option(
+        None,
+        "--scenarios",
+        exists=True,
+        dir_okay=False,
+        help='JSON list of {"name", "phases", "complete", "remove"} scenarios to evaluate.',
+    ),
+    out: Path | None = typer.Option(None, "--out", help="Write scenario results as JSON."),
+    scoring_profile: Path | None = _SCORING_PROFILE_OPTION,
+) -> None:
+    """Project org posture after completing phases, backlog items or resolving findings."""
+    import time
+
+    from rich.table import Table
+
+    from msb.models import AssessmentSummary
+    from msb.scoring import PostureSimulator, load_scoring_profile
+    from msb.scoring.profile import PHASES
+
+    with span("load", path=str(input)):
+        summary = AssessmentSummary.model_validate_json(read_text(input))
+    profile = load_scoring_profile(scoring_profile) if scoring_profile is not None else None
+    try:
+        simulator = PostureSimulator(summary, profile)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--input") from exc
+
+    specs: list[dict[str, Any]] = []
+    if scenarios is not None:
+        specs.extend(json.loads(scenarios.read_text(encoding="utf-8")))
+    if phase or complete or remove or not specs:
+        specs.append({"name": "cli", "phases": phase or [], "complete": complete or []})
+        specs[-1]["remove"] = remove or []
+
+    baseline = simulator.baseline().org_posture
+    results: list[dict[str, Any]] = []
+    started = time.perf_counter()
+    with span("simulate", records=len(specs)):
+        for i, spec in enumerate(specs):
+            try:
+                phases = spec.get("phases", [])
+                bad = [p for p in phases if not isinstance(p, int) or not 0 <= p < len(PHASES)]
+                if bad:
+                    raise ValueError(f"phases must be 0-{len(PHASES) - 1}, got {bad}")
+                items = simulator.items_in_phases(PHASES[p] for p in phases)
+                result = simulator.simulate(
+                    remove=spec.get("remove", []), complete=[*items, *spec.get("complete", [])]
+                )
+            except ValueError as exc:
+                raise typer.BadParameter(f"scenario {spec.get('name', i)}: {exc}") from exc
+            results.append(
+                {
+                    "name": spec.get("name", f"scenario-{i}"),
+                    "org_posture": result.org_posture,
+                    "delta": result.org_posture - baseline,
+                    "domain_posture": result.domain_posture,
+                    "target_posture": result.target_posture,
+                    "findings_changed": result.findings_changed,
+                }
+            )
+    elapsed = time.perf_counter() - started
+
+    if out is not None:
+        ensure_dir(out.parent)
+        write_json(out, {"baseline_org_posture": baseline, "scenarios": results})
+
+    table = Table(title="What-if Scenarios")
+    table.add_column("Scenario")
+    table.add_column("Findings changed", justify="right")
+    table.add_column("Org posture", justify="right")
+    table.add_column("Delta", justify="right")
+    table.add_row("baseline", "0", f"{baseline:.1f}", "")
+    for r in results[:50]:
+        table.add_row(
+            str(r["name"]),
+            str(r["findings_changed"]),
+            f"{r['org_posture']:.1f}",
+            f"{r['delta']:+.1f}",
+        )
+    console = _console()
+    console.print(table)
+    if len(results) > 50:
+        console.print(f"... {len(results) - 50} more scenarios")
+    rate = len(results) / elapsed if elapsed > 0 else float("inf")
+    console.print(
+        f"Evaluated {len(results)} scenario(s) in {elapsed * 1000:.1f} ms ({rate:,.0f}/s)"
+    )
+
+
+@app.command()
+def migrate(
+    input: Path = typer.Option(..., "--input", exists=True, file_okay=True, dir_okay=False),
+    out: Path | None = typer.Option(
+        None, "--out", dir_okay=False, help="Output file (default: rewrite --input in place)."
+    ),
+    validate: bool = typer.Option(
+        True, "--validate/--no-validate", help="Validate every upgraded record."
+    ),
+) -> None:
+    """Stream a findings.json file into the current finding schema version."""
+    from msb.io.schema import CURRENT_FINDING_SCHEMA, migrate_findings_file
+
+    target = out or input
+    with span("migrate", path=str(input)) as s:
+        try:
+            stats = migrate_findings_file(input, target, validate=validate)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--input") from exc
+        s.records = stats.records
+    _console().print(
+        f"Migrated {stats.records} findings ({stats.upgraded} upgraded) to schema "
+        f"{CURRENT_FINDING_SCHEMA} in {stats.seconds:.2f}s: "
+        f"{stats.records_per_second:,.0f} records/s, {stats.mb_per_second:.1f} MB/s -> {target}"
+    )
+
+
+@app.command()
+def synth(
+    out: Path = typer.Option(..., "--out"),
+    targets: int = typer.Option(10, "--targets", min=1),
+    findings_per_target: int = typer.Option(100, "--findings-per-target", min=0),
+    actions_per_finding: int = typer.Option(2, "--actions-per-finding", min=1),
+    assets_per_target: int = typer.Option(20, "--assets-per-target", min=0),
+    assets_per_finding: int = typer.Option(3, "--assets-per-finding", min=0),
+    seed: int = typer.Option(0, "--seed"),
+) -> None:
+    """Generate a deterministic synthetic fixture pack for scale testing."""
+    from msb.synthetic import SyntheticPackConfig, write_synthetic_pack
+
+    _note_output_dir(out)
+    config = SyntheticPackConfig(
+        targets=targets,
+        findings_per_target=findings_per_target,
+        actions_per_finding=actions_per_finding,
+        assets_per_target=assets_per_target,
+        assets_per_finding=assets_per_finding,
+        seed=seed,
+    )
+    write_synthetic_pack(out, config)
+    _console().print(f"Wrote {config.finding_count} findings across {targets} targets to: {out}")
+
+
+@app.command()
+def gate(
+    input: Path = typer.Option(..., "--input", exists=True, file_okay=False, dir_okay=True),
+    require: list[str] = typer.Option(
+        ...,
+        "--require",
+        "-r",
+        help="Condition that must hold, e.g. 'org.posture >= 60', 'target.*.posture > 40', "
+        "'domain.IAM.posture >= 50', 'count.severity.critical == 0' (repeatable).",
+    ),
+    scoring_profile: Path | None = _SCORING_PROFILE_OPTION,
+    fail_fast: bool = typer.Option(
+        True, "--fail-fast/--no-fail-fast", help="Stop reading at the first certain failure."
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Print the result as JSON."),
+) -> None:
+    """Exit non-zero when posture thresholds are not met (0 pass, 1 fail, 2 usage, 3 input).
+
+    Streams findings and scores them without control mapping or artifact writes.
+    """
+    from msb.gate import GateExit, evaluate_gate, parse_condition
+    from msb.scoring import load_scoring_profile
+
+    try:
+        conditions = [parse_condition(text) for text in require]
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(GateExit.usage_error) from exc
+    try:
+        profile = load_scoring_profile(scoring_profile) if scoring_profile is not None else None
+        result = evaluate_gate(input, conditions, profile=profile, fail_fast=fail_fast)
+    except ValueError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(GateExit.input_error) from exc
+
+    if json_output:
+        typer.echo(json.dumps(result.to_dict(), indent=2))
+    else:
+        status = {True: "PASS", False: "FAIL", None: "UNDECIDED"}
+        for r in result.conditions:
+            subject = f" [{r.subject}]" if r.subject else ""
+            typer.echo(f"{status[r.passed]}  {r.condition}{subject}  (value {r.value:g})")
+        stopped = " (stopped early)" if result.early_exit else ""
+        typer.echo(
+            f"Gate {'passed' if result.passed else 'failed'}: "
+            f"{result.findings_scanned} findings read{stopped}"
+        )
+    raise typer.Exit(result.exit_code)
+
+
+@app.command()
+def watch(
+    fixtures: Path = typer.Option(
+        Path("fixtures"), "--fixtures", exists=True, file_okay=False, help="Holds before/ + after/."
+    ),
+    out: Path = typer.Option(Path("artifacts"), "--out"),
+    rules: Path | None = typer.Option(
+        None, "--rules", exists=True, dir_okay=False, help="Mapping rules JSON to watch and use."
+    ),
+    interval: float = typer.Option(0.5, "--interval", min=0.05, help="Polling interval (s)."),
+    debounce: float = typer.Option(
+        0.3, "--debounce", min=0.0, help="Quiet period after a change before rerunning (s)."
+    ),
+) -> None:
+    """Rerun the demo pipeline whenever fixtures, mapping data or templates change."""
+    import time
+
+    from msb.watch import PollingWatcher, WatchPipeline
+
+    _note_output_dir(out)
+    console = _console()
+    pipeline = WatchPipeline(fixtures, out, rules)
+    watcher = PollingWatcher(pipeline.watch_groups(), interval=interval, debounce=debounce)
+    pending: set[str] = set()
+    iteration = 0
+    console.print(f"Watching {', '.join(pipeline.watch_groups())} (Ctrl-C to stop)")
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                stages = pipeline.run(pending)
+            except Exception as exc:
+                # Usually a half-finished edit (bad JSON, a missing key, a template syntax
+                # error); keep the changes pending and wait for the next one.
+                console.print(f"[red]Error:[/red] {type(exc).__name__}: {exc}")
+            else:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                changed = ", ".join(sorted(pending)) or "initial run"
+                console.print(
+                    f"[{iteration}] {changed}: {' -> '.join(stages)} in {elapsed_ms:.1f} ms"
+                )
+                pending.clear()
+                iteration += 1
+            pending |= watcher.wait()
+    except KeyboardInterrupt:
+        console.print("Stopped watching.")
+
+
 @app.command()
 def demo() -> None:
     """Run the full offline demo end-to-end (before/after assessment, compare, roadmap, report)."""
+    from msb.demo_flow import run_demo
+
     base = Path("artifacts")
+    _note_output_dir(base)
 
+    console = _console()
     console.rule("Demo (offline fixtures → artifacts)")
     run_demo(fixtures_dir=Path("fixtures"), artifacts_dir=base)
 
@@ -145,3 +1043,45 @@ def demo() -> None:
         f"[bold]Org posture:[/bold] {org_before:.1f} → {org_after:.1f} ({delta:+.1f}, {pct:+.1f}%)"
     )
     console.print(f"Artifacts written under: {base.resolve()}")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host"),
+    port: int = typer.Option(8765, "--port", min=0, max=65535),
+    socket: Path | None = typer.Option(
+        None, "--socket", dir_okay=False, help="Listen on a Unix socket instead of TCP."
+    ),
+    workers: int = typer.Option(4, "--workers", min=1, help="Requests handled concurrently."),
+    backlog: int = typer.Option(
+        16, "--backlog", min=0, help="Accepted connections queued beyond --workers."
+    ),
+    input_root: Path = typer.Option(
+        Path("."),
+        "--input-root",
+        exists=True,
+        file_okay=False,
+        help='Directory that "input" paths in requests must resolve inside.',
+    ),
+) -> None:
+    """Serve assess/compare/plan/report as a JSON API with warm caches."""
+    from msb.server import create_server, server_address
+
+    try:
+        server = create_server(
+            host=host,
+            port=port,
+            unix_socket=socket,
+            workers=workers,
+            backlog=backlog,
+            input_root=input_root,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--socket") from exc
+    _console().print(f"Serving on {server_address(server)} (workers={workers})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,9 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Any
 
+from msb.io.partitioned import read_summary_index, read_target_shards
+from msb.models import SummaryShard
+from msb.utils.instrumentation import span
 
-def compare_summaries(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+
+def compare_summaries(
+    before: dict[str, Any], after: dict[str, Any], *, scoring_profile: str | None = None
+) -> dict[str, Any]:
+    """Posture deltas between two summaries.
+
+    With `scoring_profile` (a profile digest), both summaries must have been scored with that
+    profile; otherwise a mismatch is only reported in the result.
+    """
+    if scoring_profile is not None:
+        for side, summary in (("before", before), ("after", after)):
+            found = summary.get("scoring_profile")
+            if found != scoring_profile:
+                raise ValueError(
+                    f"{side} summary was scored with profile {found}, expected {scoring_profile}"
+                )
+    with span("compare"):
+        return _compare_summaries(before, after)
+
+
+def _compare_summaries(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
     b_org = float(before["org"]["posture_score"])
     a_org = float(after["org"]["posture_score"])
     delta = a_org - b_org
@@ -28,14 +53,167 @@ def compare_summaries(before: dict[str, Any], after: dict[str, Any]) -> dict[str
 
     domain_rows.sort(key=lambda r: r["delta"], reverse=True)
 
-    return {
+    result: dict[str, Any] = {
         "org": {
             "posture": {
                 "before": b_org,
                 "after": a_org,
                 "delta": delta,
                 "percent_change": pct,
+                "before_band": _org_band(before),
+                "after_band": _org_band(after),
             },
             "domain_posture_deltas": domain_rows,
-        }
+        },
+        "scoring_profile": {
+            "before": before.get("scoring_profile"),
+            "after": after.get("scoring_profile"),
+            "consistent": before.get("scoring_profile") == after.get("scoring_profile"),
+        },
+    }
+    if before.get("rollups") or after.get("rollups"):
+        result["rollups"] = _compare_rollups(before, after)
+    return result
+
+
+def _compare_rollups(before: dict[str, Any], after: dict[str, Any]) -> list[dict[str, Any]]:
+    # Group deltas at every level of each precomputed rollup; a group present on one side
+    # only has None for the other side's posture.
+    def _index(summary: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        return {r["name"]: r for r in summary.get("rollups") or []}
+
+    b_rollups, a_rollups = _index(before), _index(after)
+    out: list[dict[str, Any]] = []
+    for name in sorted(set(b_rollups) | set(a_rollups)):
+        rollup = a_rollups.get(name) or b_rollups[name]
+        b_groups = {tuple(g["path"]): g for g in b_rollups.get(name, {}).get("groups", [])}
+        a_groups = {tuple(g["path"]): g for g in a_rollups.get(name, {}).get("groups", [])}
+        rows: list[dict[str, Any]] = []
+        for path in sorted(set(b_groups) | set(a_groups)):
+            b, a = b_groups.get(path), a_groups.get(path)
+            rows.append(
+                {
+                    "path": list(path),
+                    "level": rollup["levels"][len(path) - 1],
+                    "before": b["posture_score"] if b else None,
+                    "after": a["posture_score"] if a else None,
+                    "delta": a["posture_score"] - b["posture_score"] if a and b else None,
+                    # Summed penalties saturate for large groups; the mean target still moves.
+                    "mean_target_before": _mean_target(b),
+                    "mean_target_after": _mean_target(a),
+                    "findings_before": b["finding_count"] if b else 0,
+                    "findings_after": a["finding_count"] if a else 0,
+                    "targets_before": b["target_count"] if b else 0,
+                    "targets_after": a["target_count"] if a else 0,
+                }
+            )
+        out.append({"name": name, "levels": rollup["levels"], "groups": rows})
+    return out
+
+
+def _mean_target(group: dict[str, Any] | None) -> float | None:
+    if not group or not group["target_count"]:
+        return None
+    return float(group["posture_sum"]) / int(group["target_count"])
+
+
+def _org_band(summary: dict[str, Any]) -> dict[str, Any] | None:
+    uncertainty = summary.get("uncertainty")
+    if not uncertainty:
+        return None
+    return {"confidence": uncertainty["confidence"], **uncertainty["org"]}
+
+
+def compare_partitioned_summaries(
+    before_root: Path,
+    after_root: Path,
+    *,
+    targets: Sequence[str] = (),
+    scoring_profile: str | None = None,
+) -> dict[str, Any]:
+    """`compare_summaries` for partitioned summaries, plus a per-target posture table.
+
+    Per-target deltas come from the two indexes alone. Shards are read only for the targets
+    named in `targets`, which get finding-level detail (new and resolved findings).
+    """
+    before = read_summary_index(before_root)
+    after = read_summary_index(after_root)
+    result = compare_summaries(
+        before.model_dump(mode="json"),
+        after.model_dump(mode="json"),
+        scoring_profile=scoring_profile,
+    )
+
+    with span("compare", layout="partitioned"):
+        b_refs = {r.target_id: r for r in before.targets}
+        a_refs = {r.target_id: r for r in after.targets}
+        rows: list[dict[str, Any]] = []
+        for tid in sorted(set(b_refs) | set(a_refs)):
+            b, a = b_refs.get(tid), a_refs.get(tid)
+            rows.append(
+                {
+                    "target_id": tid,
+                    "before": b.posture_score if b else None,
+                    "after": a.posture_score if a else None,
+                    "delta": a.posture_score - b.posture_score if a and b else None,
+                    "findings_before": b.finding_count if b else 0,
+                    "findings_after": a.finding_count if a else 0,
+                    "changed": b is None or a is None or b.sha256 != a.sha256,
+                }
+            )
+        result["targets"] = rows
+
+        if targets:
+            unknown = sorted(set(targets) - set(b_refs) - set(a_refs))
+            if unknown:
+                raise ValueError(f"Unknown target_id(s): {unknown}")
+            b_shards = {
+                s.target.target_id: s
+                for s in read_target_shards(before_root, _present(targets, b_refs), index=before)
+            }
+            a_shards = {
+                s.target.target_id: s
+                for s in read_target_shards(after_root, _present(targets, a_refs), index=after)
+            }
+            result["target_detail"] = {
+                tid: _target_detail(b_shards.get(tid), a_shards.get(tid)) for tid in targets
+            }
+    return result
+
+
+def _present(targets: Sequence[str], refs: dict[str, Any]) -> list[str]:
+    return [t for t in targets if t in refs]
+
+
+def _target_detail(before: SummaryShard | None, after: SummaryShard | None) -> dict[str, Any]:
+    def _findings(shard: SummaryShard | None) -> dict[str, str]:
+        if shard is None:
+            return {}
+        return {mf.finding.finding_id: mf.finding.title for mf in shard.mapped_findings}
+
+    def _domains(shard: SummaryShard | None) -> dict[str, float]:
+        if shard is None:
+            return {}
+        return {d.domain: d.posture_0_to_100 for d in shard.target.domain_maturity}
+
+    b_findings, a_findings = _findings(before), _findings(after)
+    b_domains, a_domains = _domains(before), _domains(after)
+    return {
+        "resolved_findings": [
+            {"finding_id": fid, "title": b_findings[fid]}
+            for fid in sorted(set(b_findings) - set(a_findings))
+        ],
+        "new_findings": [
+            {"finding_id": fid, "title": a_findings[fid]}
+            for fid in sorted(set(a_findings) - set(b_findings))
+        ],
+        "domain_posture_deltas": [
+            {
+                "domain": dom,
+                "before": b_domains.get(dom, 0.0),
+                "after": a_domains.get(dom, 0.0),
+                "delta": a_domains.get(dom, 0.0) - b_domains.get(dom, 0.0),
+            }
+            for dom in sorted(set(b_domains) | set(a_domains))
+        ],
     }
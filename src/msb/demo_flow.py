@@ -1,70 +1,89 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 from msb.compare import compare_summaries
 from msb.io.artifacts import ensure_dir, write_csv, write_json, write_text
-from msb.io.fixtures import load_fixture_pack
+from msb.io.fixtures import FixturePack, load_fixture_pack
+from msb.mappings import CompiledRuleSet
+from msb.models import AssessmentSummary
 from msb.prioritization import build_backlog_and_roadmap
 from msb.reporting import render_html_report, render_markdown_report
-from msb.scoring import assess_fixture_pack, compute_controls_coverage
+from msb.scoring import CoverageAggregator, assess_fixture_pack, build_coverage_aggregator
+from msb.utils.instrumentation import span
+
+REPORT_TITLE = "Multi-Cloud Security Baseline Report (Demo)"
+REPORT_AUTHOR = "Cloud Security / DevSecOps Consultant"
 
 
 def run_demo(*, fixtures_dir: Path, artifacts_dir: Path) -> None:
-    before_out = artifacts_dir / "before"
-    after_out = artifacts_dir / "after"
-    compare_out = artifacts_dir / "compare"
-    report_out = artifacts_dir / "report"
+    before = assess_stage(load_fixture_pack(fixtures_dir / "before"), artifacts_dir / "before")
+    after = assess_stage(load_fixture_pack(fixtures_dir / "after"), artifacts_dir / "after")
+    comparison = compare_stage(before, after, artifacts_dir / "compare")
+    report_stage(comparison, artifacts_dir / "compare", artifacts_dir / "report")
 
-    fixture_before = load_fixture_pack(fixtures_dir / "before")
-    assessment_before = assess_fixture_pack(fixture_before)
-    coverage_before = compute_controls_coverage(assessment_before.mapped_findings)
-    ensure_dir(before_out)
-    write_json(before_out / "summary.json", assessment_before.model_dump(mode="json"))
-    write_csv(
-        before_out / "controls_coverage.csv", coverage_before.to_rows(), coverage_before.headers
-    )
 
-    fixture_after = load_fixture_pack(fixtures_dir / "after")
-    assessment_after = assess_fixture_pack(fixture_after)
-    coverage_after = compute_controls_coverage(assessment_after.mapped_findings)
-    ensure_dir(after_out)
-    write_json(after_out / "summary.json", assessment_after.model_dump(mode="json"))
-    write_csv(after_out / "controls_coverage.csv", coverage_after.to_rows(), coverage_after.headers)
+def assess_stage(
+    pack: FixturePack, out: Path, rules: CompiledRuleSet | None = None
+) -> tuple[AssessmentSummary, CoverageAggregator]:
+    """Assess one pack and write its summary.json and coverage tables to `out`."""
+    assessment = assess_fixture_pack(pack, rules=rules)
+    coverage = build_coverage_aggregator(assessment.mapped_findings, assessment.targets)
+    with span("serialize", records=len(assessment.mapped_findings)):
+        ensure_dir(out)
+        write_json(out / "summary.json", assessment.model_dump(mode="json"))
+        _write_coverage(out, coverage)
+    return assessment, coverage
 
+
+def compare_stage(
+    before: tuple[AssessmentSummary, CoverageAggregator],
+    after: tuple[AssessmentSummary, CoverageAggregator],
+    out: Path,
+) -> dict[str, Any]:
+    """Write compare.json, the backlog/roadmap for `after`, and its coverage tables to `out`."""
+    assessment_after, coverage_after = after
     comparison = compare_summaries(
-        assessment_before.model_dump(mode="json"),
+        before[0].model_dump(mode="json"),
         assessment_after.model_dump(mode="json"),
     )
-    ensure_dir(compare_out)
-    write_json(compare_out / "compare.json", comparison)
-
     backlog, roadmap = build_backlog_and_roadmap(assessment_after.mapped_findings)
-    write_csv(compare_out / "remediation_backlog.csv", backlog.to_rows(), backlog.headers)
-    write_csv(compare_out / "roadmap.csv", roadmap.to_rows(), roadmap.headers)
-    combined_coverage = compute_controls_coverage(assessment_after.mapped_findings)
-    write_csv(
-        compare_out / "controls_coverage.csv",
-        combined_coverage.to_rows(),
-        combined_coverage.headers,
-    )
+    with span("serialize", records=len(backlog.rows)):
+        ensure_dir(out)
+        write_json(out / "compare.json", comparison)
+        write_csv(out / "remediation_backlog.csv", backlog.to_rows(), backlog.headers)
+        write_csv(out / "roadmap.csv", roadmap.to_rows(), roadmap.headers)
+        _write_coverage(out, coverage_after)
+    return comparison
+
 
+def report_stage(comparison: dict[str, Any], compare_out: Path, report_out: Path) -> None:
+    """Render report.md and report.html from `compare_stage` outputs."""
     ensure_dir(report_out)
     md = render_markdown_report(
-        title="Multi-Cloud Security Baseline Report (Demo)",
-        author="Cloud Security / DevSecOps Consultant",
+        title=REPORT_TITLE,
+        author=REPORT_AUTHOR,
         compare_obj=comparison,
         remediation_backlog_csv_path=compare_out / "remediation_backlog.csv",
         roadmap_csv_path=compare_out / "roadmap.csv",
         controls_coverage_csv_path=compare_out / "controls_coverage.csv",
     )
     html = render_html_report(
-        title="Multi-Cloud Security Baseline Report (Demo)",
-        author="Cloud Security / DevSecOps Consultant",
+        title=REPORT_TITLE,
+        author=REPORT_AUTHOR,
         compare_obj=comparison,
         remediation_backlog_csv_path=compare_out / "remediation_backlog.csv",
         roadmap_csv_path=compare_out / "roadmap.csv",
         controls_coverage_csv_path=compare_out / "controls_coverage.csv",
     )
-    write_text(report_out / "report.md", md)
-    write_text(report_out / "report.html", html)
+    with span("serialize"):
+        write_text(report_out / "report.md", md)
+        write_text(report_out / "report.html", html)
+
+
+def _write_coverage(out: Path, aggregator: CoverageAggregator) -> None:
+    table = aggregator.to_table()
+    pivot = aggregator.to_pivot_table()
+    write_csv(out / "controls_coverage.csv", table.to_rows(), table.headers)
+    write_csv(out / "controls_coverage_pivot.csv", pivot.to_rows(), pivot.headers)
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import operator
+import re
+from array import array
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+from msb.io.artifacts import find_artifact, open_text, read_json
+from msb.io.jsonstream import iter_json_array
+from msb.io.schema import needs_upgrade, upgrade_finding
+from msb.models import Finding, FindingCategory, Severity, Target
+from msb.scoring.assess import posture_score_from_penalty
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
+from msb.scoring.risk import domain_for_category
+from msb.utils.instrumentation import span
+
+
+class GateExit(IntEnum):
+    """`msb gate` exit codes."""
+
+    passed = 0
+    failed = 1
+    usage_error = 2
+    input_error = 3
+
+
+_OPS: dict[str, Callable[[float, float], bool]] = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_EXPR = re.compile(
+    r"^\s*(?P<metric>\S.*?)\s*(?P<op>>=|<=|==|!=|>|<)\s*(?P<value>-?\d+(?:\.\d+)?)\s*$"
+)
+_DOMAINS = {domain_for_category(c) for c in FindingCategory}
+
+
+@dataclass(frozen=True)
+class GateCondition:
+    """One requirement such as `org.posture >= 60` or `count.severity.critical == 0`.
+
+    Metrics: `org.posture`, `target.<id|*>.posture`, `domain.<name|*>.posture`, `count.total`,
+    `count.severity.<severity>`, `count.category.<category>`.
+    """
+
+    text: str
+    kind: str
+    key: str
+    op: str
+    threshold: float
+
+    @property
+    def decreasing(self) -> bool:
+        # Postures only fall as findings are added; counts only rise.
+        return self.kind != "count"
+
+    @property
+    def can_fail_early(self) -> bool:
+        return self.op in ((">=", ">", "==") if self.decreasing else ("<=", "<", "=="))
+
+    def holds(self, value: float) -> bool:
+        return _OPS[self.op](value, self.threshold)
+
+    def certainly_fails(self, value: float) -> bool:
+        """True when no further findings could make the condition hold again."""
+        if not self.can_fail_early or self.holds(value):
+            return False
+        if self.op == "==":
+            return value < self.threshold if self.decreasing else value > self.threshold
+        return True
+
+    def certainly_holds(self, value: float) -> bool:
+        """True when no further findings could make the condition fail."""
+        return self.holds(value) and not self.can_fail_early and self.op != "!="
+
+
+def parse_condition(text: str) -> GateCondition:
+    m = _EXPR.match(text)
+    if m is None:
+        raise ValueError(f"Cannot parse gate condition {text!r}; expected '<metric> <op> <number>'")
+    metric, op, threshold = m["metric"], m["op"], float(m["value"])
+    kind, _, rest = metric.partition(".")
+    if kind == "org" and rest == "posture":
+        return GateCondition(text, "org", "", op, threshold)
+    if kind in ("target", "domain") and rest.endswith(".posture"):
+        key = rest.removesuffix(".posture")
+        if kind == "domain" and key != "*" and key not in _DOMAINS:
+            raise ValueError(f"Unknown domain {key!r} in {text!r}; known: {sorted(_DOMAINS)}")
+        if key:
+            return GateCondition(text, kind, key, op, threshold)
+    if kind == "count":
+        dimension, _, value = rest.partition(".")
+        if rest == "total":
+            return GateCondition(text, "count", "total", op, threshold)
+        allowed = {
+            "severity": [s.value for s in Severity],
+            "category": [c.value for c in FindingCategory],
+        }.get(dimension)
+        if allowed is not None:
+            if value not in allowed:
+                raise ValueError(f"Unknown {dimension} {value!r} in {text!r}; known: {allowed}")
+            return GateCondition(text, "count", f"{dimension}:{value}", op, threshold)
+    raise ValueError(f"Unknown gate metric {metric!r} in {text!r}")
+
+
+@dataclass
+class ConditionResult:
+    condition: str
+    passed: bool | None
+    value: float | None
+    # The target or domain that decided a wildcard condition.
+    subject: str | None = None
+
+
+@dataclass
+class GateResult:
+    passed: bool
+    findings_scanned: int
+    early_exit: bool
+    conditions: list[ConditionResult] = field(default_factory=list)
+
+    @property
+    def exit_code(self) -> GateExit:
+        return GateExit.passed if self.passed else GateExit.failed
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "passed": self.passed,
+            "exit_code": int(self.exit_code),
+            "findings_scanned": self.findings_scanned,
+            "early_exit": self.early_exit,
+            "conditions": [vars(c) for c in self.conditions],
+        }
+
+
+class _GateState:
+    """Running penalty sums plus what is needed to redo them in assessment order.
+
+    `msb assess` adds penalties target by target, so org and domain float sums depend on
+    that order. The running sums (in stream order) screen for early failures; every reported
+    value and every early exit uses `_replay`, which repeats the assessment's additions from
+    one penalty and one domain code kept per finding. Targets are already summed in order.
+    """
+
+    def __init__(self, target_ids: Sequence[str], norm: float) -> None:
+        self.norm = norm
+        self.org_penalty = 0.0
+        self.target_penalty = dict.fromkeys(target_ids, 0.0)
+        self.domain_penalty = dict.fromkeys(sorted(_DOMAINS), 0.0)
+        self.counts: Counter[str] = Counter()
+        self._domain_codes = {d: i for i, d in enumerate(self.domain_penalty)}
+        self._log = {tid: (array("B"), array("d")) for tid in target_ids}
+        self._added = 0
+        self._replayed: tuple[int, float, dict[str, float]] | None = None
+
+    def add(self, target_id: str, domain: str, penalty: float) -> None:
+        self.org_penalty += penalty
+        self.target_penalty[target_id] += penalty
+        self.domain_penalty[domain] += penalty
+        codes, penalties = self._log[target_id]
+        codes.append(self._domain_codes[domain])
+        penalties.append(penalty)
+        self._added += 1
+
+    def _replay(self) -> tuple[float, dict[str, float]]:
+        if self._replayed is None or self._replayed[0] != self._added:
+            names = list(self.domain_penalty)
+            # Domains in first-seen order, as the assessment's org sum walks them.
+            domains: dict[str, float] = {}
+            for codes, penalties in self._log.values():
+                for code, penalty in zip(codes, penalties, strict=True):
+                    domains[names[code]] = domains.get(names[code], 0.0) + penalty
+            self._replayed = (self._added, sum(domains.values()), domains)
+        return self._replayed[1], self._replayed[2]
+
+    def value(self, kind: str, key: str, *, exact: bool = True) -> float:
+        """The metric's value; `exact=False` reads the cheaper running sums."""
+        if kind == "count":
+            return float(self.counts[key])
+        if kind == "target":
+            penalty = self.target_penalty[key]
+        else:
+            org, domains = self._replay() if exact else (self.org_penalty, self.domain_penalty)
+            penalty = org if kind == "org" else domains.get(key, 0.0)
+        return posture_score_from_penalty(penalty, self.norm)
+
+    def subjects(self, c: GateCondition) -> list[str]:
+        if c.key != "*":
+            return [c.key]
+        return list(self.target_penalty if c.kind == "target" else self.domain_penalty)
+
+
+def evaluate_gate(
+    pack_dir: Path,
+    conditions: Sequence[GateCondition],
+    *,
+    profile: CompiledScoringProfile | None = None,
+    fail_fast: bool = True,
+) -> GateResult:
+    """Evaluate `conditions` over a fixture pack in one streaming pass, without control mapping.
+
+    Findings are scored (risk x blast multiplier, unweighted assets) and accumulated as they
+    are parsed. Postures can only fall and counts only rise, so with `fail_fast` the pass
+    stops at the first finding after which some condition can no longer hold.
+    """
+    profile = profile or default_scoring_profile()
+    targets_path = find_artifact(pack_dir / "targets.json")
+    findings_path = find_artifact(pack_dir / "findings.json")
+    for path in (targets_path, findings_path):
+        if not path.exists():
+            raise ValueError(f"Missing fixtures file: {path}")
+    with span("load", path=str(targets_path)):
+        targets_obj = read_json(targets_path)
+        target_ids = [Target.model_validate(t).target_id for t in targets_obj["targets"]]
+    unknown = sorted(
+        {c.key for c in conditions if c.kind == "target" and c.key != "*"} - set(target_ids)
+    )
+    if unknown:
+        raise ValueError(f"Gate conditions reference unknown target_id(s): {unknown}")
+
+    state = _GateState(target_ids, profile.posture_normalization)
+    watched = [c for c in conditions if c.can_fail_early]
+    scanned = 0
+    early_exit = False
+    with span("gate", path=str(findings_path)) as s, open_text(findings_path) as f:
+        for obj in iter_json_array(f, "findings"):
+            finding = Finding.model_validate(upgrade_finding(obj) if needs_upgrade(obj) else obj)
+            if finding.target_id not in state.target_penalty:
+                raise ValueError(f"Findings reference unknown target_id(s): {[finding.target_id]}")
+            domain = domain_for_category(finding.category)
+            penalty = profile.risk(finding) * profile.blast_multiplier(
+                float(len(finding.affected_assets))
+            )
+            state.add(finding.target_id, domain, penalty)
+            touched = {
+                ("org", ""),
+                ("target", finding.target_id),
+                ("domain", domain),
+                ("count", "total"),
+                ("count", f"severity:{finding.severity.value}"),
+                ("count", f"category:{finding.category.value}"),
+            }
+            state.counts.update(key for kind, key in touched if kind == "count")
+            scanned += 1
+            candidates = [
+                (c, key)
+                for c in watched
+                for kind, key in touched
+                if kind == c.kind and c.key in ("*", key)
+            ]
+            # Screen with the running sums, then confirm with the exact, replayed values.
+            if (
+                fail_fast
+                and any(
+                    c.certainly_fails(state.value(c.kind, k, exact=False)) for c, k in candidates
+                )
+                and any(c.certainly_fails(state.value(c.kind, k)) for c, k in candidates)
+            ):
+                early_exit = True
+                break
+        s.records = scanned
+    return _result(state, conditions, scanned, early_exit=early_exit)
+
+
+def _evaluate(
+    state: _GateState, conditions: Sequence[GateCondition]
+) -> list[tuple[GateCondition, str, float]]:
+    # Each condition with its deciding subject: the first failing one, else the first.
+    out: list[tuple[GateCondition, str, float]] = []
+    for c in conditions:
+        values = [(subject, state.value(c.kind, subject)) for subject in state.subjects(c)]
+        if not values:  # a wildcard over no targets
+            values = [("", 100.0)]
+        subject, value = next(((s, v) for s, v in values if not c.holds(v)), values[0])
+        out.append((c, subject, value))
+    return out
+
+
+def _result(
+    state: _GateState, conditions: Sequence[GateCondition], scanned: int, *, early_exit: bool
+) -> GateResult:
+    results: list[ConditionResult] = []
+    for c, subject, value in _evaluate(state, conditions):
+        passed: bool | None = c.holds(value)
+        if early_exit and not (c.certainly_fails(value) or c.certainly_holds(value)):
+            passed = None  # the unread findings could still change the outcome
+        results.append(
+            ConditionResult(
+                condition=c.text,
+                passed=passed,
+                value=value,
+                subject=subject if c.key == "*" else None,
+            )
+        )
+    return GateResult(
+        passed=all(r.passed for r in results),
+        findings_scanned=scanned,
+        early_exit=early_exit,
+        conditions=results,
+    )
@@ -1,26 +1,188 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import importlib
+import io
 import json
-from collections.abc import Iterable, Sequence
+import os
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, cast
+
+# Codec name -> file suffix. Output codecs come from the suffix (or an explicit `compression`);
+# inputs are recognised by their magic bytes, so a renamed file still reads correctly.
+CODECS = {"gzip": ".gz", "zstd": ".zst"}
+_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+LEVEL_RANGES = {"gzip": (1, 9), "zstd": (1, 22)}
 
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_json(path: Path, obj: Any) -> None:
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+def codec_for_path(path: Path) -> str | None:
+    for codec, suffix in CODECS.items():
+        if path.suffix == suffix:
+            return codec
+    return None
+
+
+def with_codec_suffix(path: Path, compression: str | None) -> Path:
+    """`summary.json` -> `summary.json.gz` for `compression="gzip"`; unchanged for None."""
+    if compression is None or codec_for_path(path) == compression:
+        return path
+    if compression not in CODECS:
+        raise ValueError(f"Unknown compression {compression!r} (supported: {sorted(CODECS)})")
+    return path.with_name(path.name + CODECS[compression])
+
+
+def find_artifact(path: Path) -> Path:
+    """`path` if it exists, else its first existing compressed variant (`.gz`, `.zst`)."""
+    if path.exists():
+        return path
+    for suffix in CODECS.values():
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def check_level(compression: str, level: int) -> None:
+    """Raise ValueError unless `level` is valid for `compression`."""
+    if compression not in CODECS:
+        raise ValueError(f"Unknown compression {compression!r} (supported: {sorted(CODECS)})")
+    low, high = LEVEL_RANGES[compression]
+    if not low <= level <= high:
+        raise ValueError(f"{compression} level must be {low}-{high}, got {level}")
+
+
+def _zstandard() -> Any:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "zstd artifacts need zstandard: pip install 'multicloud-security-baseline[zstd]'"
+        ) from exc
+
+
+def _sniff(path: Path) -> str | None:
+    with path.open("rb") as f:
+        head = f.read(4)
+    for magic, codec in _MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+@contextmanager
+def open_text(
+    path: Path,
+    mode: str = "r",
+    *,
+    compression: str | None = None,
+    level: int | None = None,
+    newline: str | None = None,
+) -> Iterator[TextIO]:
+    """Open `path` for streaming text I/O through gzip, zstd or no compression.
+
+    Writing uses `compression`, else the codec implied by the suffix; reading detects the
+    codec from the file's magic bytes. Data is (de)compressed incrementally, so large
+    artifacts never need to fit in memory twice. Writes go to a temporary file next to
+    `path` that replaces it only once complete, so a failed write never leaves a truncated
+    or empty artifact behind.
+    """
+    if mode not in ("r", "w"):
+        raise ValueError(f"Unsupported mode {mode!r}")
+    codec = _sniff(path) if mode == "r" else compression or codec_for_path(path)
+    if codec is not None and codec not in CODECS:
+        raise ValueError(f"Unknown compression {codec!r} (supported: {sorted(CODECS)})")
+    if mode == "r":
+        with _open_codec(path, mode, codec, level, newline) as f:
+            yield f
+        return
+
+    if codec is not None and level is not None:
+        check_level(codec, level)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with _open_codec(tmp, mode, codec, level, newline) as f:
+            yield f
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+@contextmanager
+def _open_codec(
+    path: Path, mode: str, codec: str | None, level: int | None, newline: str | None
+) -> Iterator[TextIO]:
+    if codec is None:
+        with path.open(mode, encoding="utf-8", newline=newline) as plain:
+            yield cast(TextIO, plain)
+    elif codec == "gzip":
+        level = DEFAULT_LEVELS[codec] if level is None else level
+        # No name or mtime in the header keeps output byte-identical across runs.
+        with (
+            path.open(mode + "b") as raw,
+            gzip.GzipFile(
+                filename="", fileobj=raw, mode=mode + "b", compresslevel=level, mtime=0
+            ) as gz,
+            io.TextIOWrapper(gz, encoding="utf-8", newline=newline) as f,
+        ):
+            yield f
+    else:
+        level = DEFAULT_LEVELS[codec] if level is None else level
+        zstd = _zstandard()
+        with (
+            path.open(mode + "b") as raw,
+            (
+                zstd.ZstdCompressor(level=level).stream_writer(raw)
+                if mode == "w"
+                else zstd.ZstdDecompressor().stream_reader(raw)
+            ) as stream,
+            io.TextIOWrapper(stream, encoding="utf-8", newline=newline) as f,
+        ):
+            yield f
+
+
+def read_text(path: Path) -> str:
+    with open_text(path) as f:
+        return f.read()
+
+
+def read_json(path: Path) -> Any:
+    with open_text(path) as f:
+        return json.load(f)
+
+
+def write_json(
+    path: Path, obj: Any, *, compression: str | None = None, level: int | None = None
+) -> None:
+    with open_text(path, "w", compression=compression, level=level) as f:
+        json.dump(obj, f, indent=2, sort_keys=True)
+        f.write("\n")
 
 
-def write_text(path: Path, content: str) -> None:
-    path.write_text(content, encoding="utf-8")
+def write_text(
+    path: Path, content: str, *, compression: str | None = None, level: int | None = None
+) -> None:
+    with open_text(path, "w", compression=compression, level=level) as f:
+        f.write(content)
 
 
-def write_csv(path: Path, rows: Iterable[Sequence[str]], headers: Sequence[str]) -> None:
-    with path.open("w", encoding="utf-8", newline="") as f:
+def write_csv(
+    path: Path,
+    rows: Iterable[Sequence[str]],
+    headers: Sequence[str],
+    *,
+    compression: str | None = None,
+    level: int | None = None,
+) -> None:
+    with open_text(path, "w", compression=compression, level=level, newline="") as f:
         writer = csv.writer(f)
         writer.writerow(list(headers))
         for row in rows:
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from msb.models import MappedFinding
+
+# Rows buffered per Parquet row group; each group is written as soon as it fills.
+ROW_GROUP_SIZE = 65_536
+
+_DICT = "dictionary"
+# (column, type) per table. Low-cardinality strings are dictionary-encoded so readers get
+# categorical columns and the files stay small; scores stay numeric.
+MAPPED_FINDING_COLUMNS: list[tuple[str, str]] = [
+    ("finding_id", "string"),
+    ("target_id", _DICT),
+    ("domain", _DICT),
+    ("category", _DICT),
+    ("severity", _DICT),
+    ("likelihood", _DICT),
+    ("impact", _DICT),
+    ("title", "string"),
+    ("detection_source", _DICT),
+    ("detected_at", "timestamp"),
+    ("risk_score", "float64"),
+    ("blast_radius", "float64"),
+    ("affected_asset_count", "int32"),
+    ("action_count", "int32"),
+    ("tags", "list<dictionary>"),
+]
+FINDING_CONTROL_COLUMNS: list[tuple[str, str]] = [
+    ("finding_id", "string"),
+    ("target_id", _DICT),
+    ("framework", _DICT),
+    ("control_id", _DICT),
+    ("control_name", _DICT),
+]
+BACKLOG_COLUMNS: list[tuple[str, str]] = [
+    ("item_id", "string"),
+    ("target_id", _DICT),
+    ("domain", _DICT),
+    ("finding_title", "string"),
+    ("action_title", "string"),
+    ("risk_score", "float64"),
+    ("impact_1_to_5", "int32"),
+    ("effort", _DICT),
+    ("dependencies", "string"),
+    ("owner", _DICT),
+    ("quick_win", "bool"),
+    ("phase", _DICT),
+    ("priority_score", "float64"),
+    ("rationale", "string"),
+]
+
+
+def _pyarrow(module: str = "pyarrow") -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "Parquet export needs pyarrow: pip install 'multicloud-security-baseline[columnar]'"
+        ) from exc
+
+
+def _schema(columns: list[tuple[str, str]]) -> Any:
+    pa = _pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    types: dict[str, Any] = {
+        "string": pa.string(),
+        _DICT: dictionary,
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "float64": pa.float64(),
+        "int32": pa.int32(),
+        "bool": pa.bool_(),
+        "list<dictionary>": pa.list_(dictionary),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+class ParquetTableWriter:
+    """Appends rows to a Parquet file, one row group per `row_group_size` rows.
+
+    Only the current row group is held in memory, so tables can be written while their rows
+    are still being produced.
+    """
+
+    def __init__(
+        self, path: Path, columns: list[tuple[str, str]], row_group_size: int = ROW_GROUP_SIZE
+    ) -> None:
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be >= 1")
+        self._schema = _schema(columns)
+        self._names = [name for name, _ in columns]
+        self._buffer: dict[str, list[Any]] = {name: [] for name in self._names}
+        self._pending = 0
+        self._row_group_size = row_group_size
+        self._writer = _pyarrow("pyarrow.parquet").ParquetWriter(
+            path, self._schema, compression="zstd"
+        )
+        self.rows_written = 0
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        for name in self._names:
+            self._buffer[name].append(row[name])
+        self._pending += 1
+        if self._pending >= self._row_group_size:
+            self._flush()
+
+    def extend(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def __enter__(self) -> ParquetTableWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        table = _pyarrow().Table.from_pydict(self._buffer, schema=self._schema)
+        self._writer.write_table(table, row_group_size=self._pending)
+        self.rows_written += self._pending
+        self._buffer = {name: [] for name in self._names}
+        self._pending = 0
+
+
+def mapped_finding_row(mf: MappedFinding) -> dict[str, Any]:
+    f = mf.finding
+    return {
+        "finding_id": f.finding_id,
+        "target_id": f.target_id,
+        "domain": mf.domain,
+        "category": f.category.value,
+        "severity": f.severity.value,
+        "likelihood": f.likelihood.value,
+        "impact": f.impact.value,
+        "title": f.title,
+        "detection_source": f.detection_source,
+        "detected_at": f.detected_at,
+        "risk_score": mf.risk_score,
+        "blast_radius": mf.blast_radius,
+        "affected_asset_count": len(f.affected_assets),
+        "action_count": len(f.recommended_actions),
+        "tags": f.tags,
+    }
+
+
+def finding_control_rows(mf: MappedFinding) -> list[dict[str, Any]]:
+    return [
+        {
+            "finding_id": mf.finding.finding_id,
+            "target_id": mf.finding.target_id,
+            "framework": c.framework,
+            "control_id": c.control_id,
+            "control_name": c.control_name,
+        }
+        for c in mf.controls
+    ]
+
+
+def write_mapped_findings_parquet(
+    out_dir: Path,
+    mapped_findings: Iterable[MappedFinding],
+    *,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """Write `mapped_findings.parquet` (one row per finding) and `finding_controls.parquet`
+    (one row per finding x mapped control) into `out_dir`. Returns the finding count."""
+    with (
+        ParquetTableWriter(
+            out_dir / "mapped_findings.parquet", MAPPED_FINDING_COLUMNS, row_group_size
+        ) as findings,
+        ParquetTableWriter(
+            out_dir / "finding_controls.parquet", FINDING_CONTROL_COLUMNS, row_group_size
+        ) as controls,
+    ):
+        for mf in mapped_findings:
+            findings.append(mapped_finding_row(mf))
+            controls.extend(finding_control_rows(mf))
+    return findings.rows_written
+
+
+def write_backlog_parquet(
+    path: Path,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """Write planner backlog records with numeric scores and a boolean `quick_win`."""
+    convert: dict[str, Callable[[Any], Any]] = {
+        "quick_win": lambda v: v == "yes",
+        "risk_score": float,
+        "priority_score": float,
+        "impact_1_to_5": int,
+    }
+    with ParquetTableWriter(path, BACKLOG_COLUMNS, row_group_size) as writer:
+        for r in records:
+            writer.append({k: convert[k](v) if k in convert else v for k, v in r.items()})
+    return writer.rows_written
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel, ValidationError
+
+from msb.assets import AssetIndex
+from msb.io.artifacts import find_artifact, read_json, read_text
+from msb.io.schema import needs_upgrade, upgrade_finding
 from msb.models import Finding, Target
+from msb.utils.instrumentation import span
+
+# How many of the collected record errors a FixtureValidationError message spells out.
+_ERRORS_IN_MESSAGE = 5
 
 
 @dataclass(frozen=True)
@@ -13,28 +27,192 @@ class FixturePack:
     targets: list[Target]
     findings: list[Finding]
 
+    @cached_property
+    def asset_index(self) -> AssetIndex:
+        return AssetIndex.build(self.targets)
 
-def _load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
 
+def pack_files(root: Path) -> tuple[Path, Path]:
+    """Return a fixture pack's targets and findings files, raising ValueError if missing.
 
-def load_fixture_pack(root: Path) -> FixturePack:
-    targets_path = root / "targets.json"
-    findings_path = root / "findings.json"
+    Either file may be gzip/zstd compressed (targets.json.gz, findings.json.zst, ...).
+    """
+    targets_path = find_artifact(root / "targets.json")
+    findings_path = find_artifact(root / "findings.json")
     if not targets_path.exists():
         raise ValueError(f"Missing fixtures file: {targets_path}")
     if not findings_path.exists():
         raise ValueError(f"Missing fixtures file: {findings_path}")
+    return targets_path, findings_path
+
+
+@dataclass(frozen=True)
+class RecordError:
+    # Position of the record in the findings array.
+    index: int
+    finding_id: str | None
+    message: str
+
+
+class FixtureValidationError(ValueError):
+    """Every invalid finding of a pack, with its record index, raised after a full pass."""
+
+    def __init__(self, errors: Sequence[RecordError], total: int) -> None:
+        self.errors = list(errors)
+        self.total = total
+        shown = "; ".join(
+            f"#{e.index} ({e.finding_id or '?'}): {e.message}"
+            for e in self.errors[:_ERRORS_IN_MESSAGE]
+        )
+        more = len(self.errors) - _ERRORS_IN_MESSAGE
+        super().__init__(
+            f"{len(self.errors)} of {total} findings failed validation: {shown}"
+            + (f"; ... and {more} more" if more > 0 else "")
+        )
+
+
+class _FindingsDocument(BaseModel):
+    findings: list[Finding]
+
+
+def load_fixture_pack(root: Path) -> FixturePack:
+    targets_path, findings_path = pack_files(root)
+
+    with span("load", path=str(root)):
+        targets_obj = read_json(targets_path)
+        findings_text = read_text(findings_path)
+
+    with span("validate") as s:
+        targets = [Target.model_validate(x) for x in targets_obj["targets"]]
+        findings = validate_findings_json(findings_text)
+        s.records = len(findings)
+    return _build_pack(targets, findings)
+
+
+def validate_findings_json(text: str) -> list[Finding]:
+    """Parse and validate a findings.json document.
 
-    targets_obj = _load_json(targets_path)
-    findings_obj = _load_json(findings_path)
+    Current-schema documents are parsed and validated in a single pass of pydantic-core's
+    JSON validator, without building intermediate dicts. Documents with older schema
+    versions or invalid records fall back to `validate_finding_records`.
+    """
+    try:
+        return _FindingsDocument.model_validate_json(text).findings
+    except ValidationError:
+        pass
+    return validate_finding_records(json.loads(text)["findings"])
 
-    targets = [Target.model_validate(x) for x in targets_obj["targets"]]
-    findings = [Finding.model_validate(x) for x in findings_obj["findings"]]
 
+def validate_finding_records(records: Sequence[Any]) -> list[Finding]:
+    """Validate parsed finding records in order, upgrading older schema versions.
+
+    Invalid records do not stop the pass; all of them are reported together, with their
+    indices, in a `FixtureValidationError`.
+    """
+    findings: list[Finding] = []
+    errors: list[RecordError] = []
+    for i, x in enumerate(records):
+        try:
+            findings.append(Finding.model_validate(upgrade_finding(x) if needs_upgrade(x) else x))
+        except ValidationError as exc:
+            errors.append(_record_error(i, x, _validation_message(exc)))
+        except ValueError as exc:
+            errors.append(_record_error(i, x, str(exc)))
+    if errors:
+        raise FixtureValidationError(errors, len(records))
+    return findings
+
+
+def _record_error(index: int, record: Any, message: str) -> RecordError:
+    finding_id = record.get("finding_id") if isinstance(record, dict) else None
+    return RecordError(index, str(finding_id) if finding_id is not None else None, message)
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return ", ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or '<record>'}: {e['msg']}" for e in exc.errors()
+    )
+
+
+def validate_fixture_objects(targets_obj: Any, findings_obj: Any) -> FixturePack:
+    """Validate already-parsed targets.json / findings.json documents into a FixturePack."""
+    with span("validate", records=len(findings_obj["findings"])):
+        targets = [Target.model_validate(x) for x in targets_obj["targets"]]
+        findings = validate_finding_records(findings_obj["findings"])
+    return _build_pack(targets, findings)
+
+
+def _build_pack(targets: list[Target], findings: list[Finding]) -> FixturePack:
     target_ids = {t.target_id for t in targets}
     unknown = sorted({f.target_id for f in findings} - target_ids)
     if unknown:
         raise ValueError(f"Findings reference unknown target_id(s): {unknown}")
 
+    pack = FixturePack(targets=targets, findings=findings)
+    pack.asset_index.validate(findings)
+    return pack
+
+
+def merge_fixture_packs(packs: Iterable[FixturePack]) -> FixturePack:
+    targets: list[Target] = []
+    findings: list[Finding] = []
+    seen: set[str] = set()
+    for pack in packs:
+        dupes = sorted({t.target_id for t in pack.targets} & seen)
+        if dupes:
+            raise ValueError(f"Duplicate target_id(s) across fixture packs: {dupes}")
+        seen.update(t.target_id for t in pack.targets)
+        targets.extend(pack.targets)
+        findings.extend(pack.findings)
     return FixturePack(targets=targets, findings=findings)
+
+
+async def load_fixture_pack_async(
+    root: Path,
+    *,
+    limit: asyncio.Semaphore | None = None,
+    executor: Executor | None = None,
+) -> FixturePack:
+    """Async `load_fixture_pack`: both files are read and parsed concurrently off the loop.
+
+    `limit` bounds how many packs are in flight; validation runs on `executor` (a process pool
+    spreads pydantic validation across cores) or the loop's default thread pool.
+    """
+    targets_path, findings_path = pack_files(root)
+
+    async with limit or contextlib.nullcontext():
+        with span("load", path=str(root)):
+            targets_obj, findings_obj = await asyncio.gather(
+                asyncio.to_thread(read_json, targets_path),
+                asyncio.to_thread(read_json, findings_path),
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, validate_fixture_objects, targets_obj, findings_obj
+        )
+
+
+async def load_fixture_packs_async(
+    roots: Sequence[Path],
+    *,
+    concurrency: int = 8,
+    executor: Executor | None = None,
+) -> list[FixturePack]:
+    """Load many packs with at most `concurrency` in flight; results keep the order of `roots`."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    limit = asyncio.Semaphore(concurrency)
+    return list(
+        await asyncio.gather(
+            *(load_fixture_pack_async(r, limit=limit, executor=executor) for r in roots)
+        )
+    )
+
+
+def load_fixture_packs(
+    roots: Sequence[Path],
+    *,
+    concurrency: int = 8,
+    executor: Executor | None = None,
+) -> list[FixturePack]:
+    return asyncio.run(load_fixture_packs_async(roots, concurrency=concurrency, executor=executor))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+_WHITESPACE = " \t\r\n"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class _Reader:
+    """Chunked cursor over a text stream for incremental `raw_decode` parsing."""
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON input, found {found!r}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.fill():
+                    continue
+                raise ValueError(f"Invalid JSON input: {exc.msg}") from exc
+            # A number cut by a chunk boundary ("12" | "3.5") decodes as a shorter number,
+            # so only trust it once the character after it has been read.
+            if (
+                isinstance(value, int | float)
+                and not isinstance(value, bool)
+                and (end == len(self.buf) or self.buf[end] in _NUMBER_CHARS)
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(
+    f: TextIO, key: str | None = "findings", *, chunk_size: int = 1 << 16
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time without parsing the whole document.
+
+    With `key`, the array is the value of that member of a top-level object (the
+    `{"findings": [...]}` layout of fixture packs); other members are parsed and skipped.
+    With `key=None` the document itself must be an array. Memory is bounded by the
+    largest single element plus `chunk_size`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    r = _Reader(f, chunk_size)
+    if key is not None:
+        r.expect("{")
+        while True:
+            if r.peek() == "}":
+                raise ValueError(f"JSON object has no {key!r} member")
+            name = r.decode()
+            r.expect(":")
+            if name == key:
+                break
+            r.decode()
+            if r.peek() == ",":
+                r.pos += 1
+    r.expect("[")
+    if r.peek() == "]":
+        return
+    while True:
+        yield r.decode()
+        if r.peek() == "]":
+            return
+        r.expect(",")
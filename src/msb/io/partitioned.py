@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from msb.models import (
+    AssessmentSummary,
+    MappedFinding,
+    SummaryIndex,
+    SummaryShard,
+    SummaryShardRef,
+)
+from msb.utils.instrumentation import span
+
+INDEX_FILE = "index.json"
+SHARD_DIR = "targets"
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def is_partitioned_summary(path: Path) -> bool:
+    return (path / INDEX_FILE).is_file()
+
+
+def write_partitioned_summary(root: Path, summary: AssessmentSummary) -> SummaryIndex:
+    """Write `summary` as `root/index.json` plus one `root/targets/<target>.json` per target.
+
+    Shards are written before the index, and the index is replaced atomically, so readers
+    never see an index that points at missing shards.
+    """
+    by_target: dict[str, list[MappedFinding]] = {t.target_id: [] for t in summary.targets}
+    for mf in summary.mapped_findings:
+        by_target[mf.finding.target_id].append(mf)
+
+    (root / SHARD_DIR).mkdir(parents=True, exist_ok=True)
+    refs: list[SummaryShardRef] = []
+    used: set[str] = set()
+    with span("serialize", records=len(summary.mapped_findings), layout="partitioned"):
+        for target in summary.targets:
+            rel = _shard_path(target.target_id, used)
+            data = (
+                SummaryShard(target=target, mapped_findings=by_target[target.target_id])
+                .model_dump_json(indent=2)
+                .encode("utf-8")
+            )
+            (root / rel).write_bytes(data)
+            refs.append(
+                SummaryShardRef(
+                    target_id=target.target_id,
+                    provider=target.provider,
+                    environment=target.environment,
+                    posture_score=target.posture_score,
+                    finding_count=target.finding_count,
+                    path=rel,
+                    sha256=hashlib.sha256(data).hexdigest(),
+                )
+            )
+
+        index = SummaryIndex(
+            assessed_at=summary.assessed_at,
+            org=summary.org,
+            targets=refs,
+            scoring_mode=summary.scoring_mode,
+            scoring_profile=summary.scoring_profile,
+            correlated_findings=summary.correlated_findings,
+            uncertainty=summary.uncertainty,
+            rollups=summary.rollups,
+        )
+        tmp = root / (INDEX_FILE + ".tmp")
+        tmp.write_text(index.model_dump_json(indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, root / INDEX_FILE)
+    return index
+
+
+def read_summary_index(root: Path) -> SummaryIndex:
+    path = root / INDEX_FILE
+    if not path.is_file():
+        raise ValueError(f"Not a partitioned summary (missing {path})")
+    with span("load", path=str(path)):
+        return SummaryIndex.model_validate_json(path.read_bytes())
+
+
+def read_target_shards(
+    root: Path, target_ids: Iterable[str] | None = None, *, index: SummaryIndex | None = None
+) -> Iterator[SummaryShard]:
+    """Yield shards in index order, reading only the files of `target_ids` (default: all)."""
+    index = index or read_summary_index(root)
+    refs = _select(index, target_ids)
+    for ref in refs:
+        path = root / ref.path
+        with span("load", path=str(path), records=ref.finding_count):
+            yield SummaryShard.model_validate_json(path.read_bytes())
+
+
+def read_partitioned_summary(
+    root: Path, target_ids: Iterable[str] | None = None
+) -> AssessmentSummary:
+    """Reassemble an `AssessmentSummary` holding only `target_ids` (default: every target).
+
+    Org-level scores are always those of the full assessment.
+    """
+    index = read_summary_index(root)
+    shards = list(read_target_shards(root, target_ids, index=index))
+    return AssessmentSummary(
+        assessed_at=index.assessed_at,
+        org=index.org,
+        targets=[s.target for s in shards],
+        mapped_findings=[mf for s in shards for mf in s.mapped_findings],
+        scoring_mode=index.scoring_mode,
+        scoring_profile=index.scoring_profile,
+        correlated_findings=index.correlated_findings,
+        uncertainty=index.uncertainty,
+        rollups=index.rollups,
+    )
+
+
+def _select(index: SummaryIndex, target_ids: Iterable[str] | None) -> list[SummaryShardRef]:
+    if target_ids is None:
+        return index.targets
+    wanted = set(target_ids)
+    unknown = sorted(wanted - {r.target_id for r in index.targets})
+    if unknown:
+        raise ValueError(f"Unknown target_id(s) in partitioned summary: {unknown}")
+    return [r for r in index.targets if r.target_id in wanted]
+
+
+def _shard_path(target_id: str, used: set[str]) -> str:
+    stem = _UNSAFE.sub("_", target_id) or "_"
+    name = stem
+    n = 1
+    while name.lower() in used:
+        n += 1
+        name = f"{stem}-{n}"
+    used.add(name.lower())
+    return f"{SHARD_DIR}/{name}.json"
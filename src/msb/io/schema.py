@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, get_args
+
+from msb.io.artifacts import codec_for_path, open_text
+from msb.io.jsonstream import iter_json_array
+from msb.models import Finding
+
+FindingUpgrade = Callable[[dict[str, Any]], dict[str, Any]]
+
+# The version written by this release; `Finding.schema_version` only accepts this value.
+CURRENT_FINDING_SCHEMA: str = get_args(Finding.model_fields["schema_version"].annotation)[0]
+
+# from_version -> (to_version, upgrade). Chains are followed until the current version.
+_UPGRADES: dict[str, tuple[str, FindingUpgrade]] = {}
+
+
+def register_finding_upgrade(
+    from_version: str, to_version: str
+) -> Callable[[FindingUpgrade], FindingUpgrade]:
+    """Register the function that rewrites a `from_version` finding dict as `to_version`.
+
+    Upgrades receive and return plain dicts (they run before model validation) and must set
+    nothing but the fields that changed; `schema_version` is updated by the caller.
+    """
+
+    def decorator(fn: FindingUpgrade) -> FindingUpgrade:
+        if from_version in _UPGRADES:
+            raise ValueError(f"An upgrade from finding schema {from_version!r} already exists")
+        _UPGRADES[from_version] = (to_version, fn)
+        return fn
+
+    return decorator
+
+
+def finding_schema_versions() -> list[str]:
+    """Every version `upgrade_finding` accepts, oldest registered first."""
+    return [*_UPGRADES, CURRENT_FINDING_SCHEMA]
+
+
+def needs_upgrade(obj: dict[str, Any]) -> bool:
+    version: str = obj.get("schema_version", CURRENT_FINDING_SCHEMA)
+    return version != CURRENT_FINDING_SCHEMA
+
+
+def upgrade_finding(obj: dict[str, Any]) -> dict[str, Any]:
+    """Bring a raw finding dict up to `CURRENT_FINDING_SCHEMA` (a no-op for current records)."""
+    version = obj.get("schema_version", CURRENT_FINDING_SCHEMA)
+    seen: set[str] = set()
+    while version != CURRENT_FINDING_SCHEMA:
+        step = _UPGRADES.get(version)
+        if step is None or version in seen:
+            raise ValueError(
+                f"Unsupported finding schema_version {version!r} "
+                f"(finding {obj.get('finding_id', '?')}); "
+                f"supported: {finding_schema_versions()}"
+            )
+        seen.add(version)
+        version, fn = step
+        obj = {**fn(obj), "schema_version": version}
+    return obj
+
+
+@dataclass(frozen=True)
+class MigrationStats:
+    records: int
+    upgraded: int
+    bytes_read: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else float("inf")
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.seconds if self.seconds else float("inf")
+
+
+def migrate_findings_file(
+    src: Path, dst: Path, *, validate: bool = True, chunk_size: int = 1 << 16
+) -> MigrationStats:
+    """Stream a findings.json document into the current schema, record by record.
+
+    Only one record is held in memory at a time. Either file may be gzip/zstd compressed
+    (detected from content for `src`, from the suffix for `dst`). Output goes to a temporary
+    file that replaces `dst` on success, so `src` and `dst` may be the same path.
+    """
+    start = time.perf_counter()
+    size = src.stat().st_size
+    tmp = dst.with_name(dst.name + ".migrating")
+    records = upgraded = 0
+    try:
+        with (
+            open_text(src) as f_in,
+            open_text(tmp, "w", compression=codec_for_path(dst)) as f_out,
+        ):
+            f_out.write('{\n  "findings": [')
+            for obj in iter_json_array(f_in, "findings", chunk_size=chunk_size):
+                if needs_upgrade(obj):
+                    obj = upgrade_finding(obj)
+                    upgraded += 1
+                if validate:
+                    Finding.model_validate(obj)
+                f_out.write(",\n    " if records else "\n    ")
+                f_out.write(json.dumps(obj))
+                records += 1
+            f_out.write("\n  ]\n}\n")
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return MigrationStats(
+        records=records,
+        upgraded=upgraded,
+        bytes_read=size,
+        seconds=time.perf_counter() - start,
+    )
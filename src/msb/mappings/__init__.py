@@ -1,5 +1,36 @@
 from __future__ import annotations
 
-from msb.mappings.mapper import map_finding
+from msb.mappings.frameworks import (
+    CompiledFramework,
+    Framework,
+    framework_label,
+    register_framework,
+    registered_frameworks,
+    resolve_frameworks,
+    unregister_framework,
+)
+from msb.mappings.mapper import map_finding, map_finding_controls
+from msb.mappings.rules import (
+    CompiledRuleSet,
+    MappingRule,
+    compile_rules,
+    default_rule_set,
+    load_rule_set,
+)
 
-__all__ = ["map_finding"]
+__all__ = [
+    "CompiledFramework",
+    "CompiledRuleSet",
+    "Framework",
+    "MappingRule",
+    "compile_rules",
+    "default_rule_set",
+    "framework_label",
+    "load_rule_set",
+    "map_finding",
+    "map_finding_controls",
+    "register_framework",
+    "registered_frameworks",
+    "resolve_frameworks",
+    "unregister_framework",
+]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from importlib.resources import files
+from typing import Any, cast
+
+from msb.models import ControlMapping, FindingCategory
+
+RawControl = Mapping[str, str]
+RawFrameworkData = tuple[Mapping[str, Sequence[RawControl]], Sequence[RawControl]]
+
+
+@dataclass(frozen=True)
+class Framework:
+    """A control framework plugin.
+
+    `load` returns the raw per-category control entries plus the default entries used for
+    categories the data does not cover. It is called once, when the framework is compiled.
+    """
+
+    key: str
+    label: str
+    load: Callable[[], RawFrameworkData]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledFramework:
+    framework: Framework
+    by_category: Mapping[FindingCategory, tuple[ControlMapping, ...]]
+
+    def controls_for(self, category: FindingCategory) -> tuple[ControlMapping, ...]:
+        return self.by_category[category]
+
+
+_REGISTRY: dict[str, Framework] = {}
+_COMPILED: dict[str, CompiledFramework] = {}
+
+
+def register_framework(framework: Framework, *, replace: bool = False) -> None:
+    if framework.key in _REGISTRY and not replace:
+        raise ValueError(f"Framework already registered: {framework.key}")
+    _REGISTRY[framework.key] = framework
+    _COMPILED.pop(framework.key, None)
+
+
+def unregister_framework(key: str) -> None:
+    _REGISTRY.pop(key, None)
+    _COMPILED.pop(key, None)
+
+
+def registered_frameworks() -> list[str]:
+    return list(_REGISTRY)
+
+
+def framework_label(key: str) -> str:
+    framework = _REGISTRY.get(key)
+    return framework.label if framework is not None else key
+
+
+def compiled_framework(key: str) -> CompiledFramework:
+    compiled = _COMPILED.get(key)
+    if compiled is None:
+        framework = _REGISTRY.get(key)
+        if framework is None:
+            raise ValueError(f"Unknown framework: {key} (registered: {registered_frameworks()})")
+        compiled = _COMPILED[key] = _compile(framework)
+    return compiled
+
+
+def resolve_frameworks(keys: Sequence[str] | None = None) -> tuple[CompiledFramework, ...]:
+    """Compile (once) and return the requested frameworks; all registered ones by default."""
+    return tuple(compiled_framework(k) for k in (registered_frameworks() if keys is None else keys))
+
+
+def clear_compiled_frameworks() -> None:
+    """Drop compiled lookups so the next use re-reads mapping data (e.g. after edits)."""
+    _COMPILED.clear()
+    _package_json.cache_clear()
+
+
+def _compile(framework: Framework) -> CompiledFramework:
+    categories, default = framework.load()
+    known = {c.value for c in FindingCategory}
+    unknown = sorted(set(categories) - known)
+    if unknown:
+        raise ValueError(f"{framework.key}: mapping data has unknown categories: {unknown}")
+
+    def _validate(entries: Sequence[RawControl]) -> tuple[ControlMapping, ...]:
+        return tuple(
+            ControlMapping.model_validate({**entry, "framework": framework.key})
+            for entry in entries
+        )
+
+    fallback = _validate(default)
+    by_category = {
+        c: _validate(categories[c.value]) if c.value in categories else fallback
+        for c in FindingCategory
+    }
+    return CompiledFramework(framework=framework, by_category=by_category)
+
+
+@cache
+def _package_json(name: str) -> dict[str, Any]:
+    raw = files("msb.mappings.data").joinpath(name).read_text(encoding="utf-8")
+    return cast(dict[str, Any], json.loads(raw))
+
+
+def _legacy_loader(section: str, id_field: str, name_field: str) -> Callable[[], RawFrameworkData]:
+    # NIST CSF and ISO 27001 share the original category -> {"nist": [...], "iso": [...]} file.
+    defaults = {
+        "nist": {
+            "function": "Identify",
+            "category": "ID.GV (Governance)",
+            "rationale": "Default mapping.",
+        },
+        "iso": {
+            "theme_id": "A.6",
+            "theme_name": "Information security governance",
+            "rationale": "Default mapping.",
+        },
+    }
+
+    def _convert(entry: Mapping[str, str]) -> RawControl:
+        return {
+            "control_id": entry[id_field],
+            "control_name": entry[name_field],
+            "rationale": entry["rationale"],
+        }
+
+    def _load() -> RawFrameworkData:
+        data = _package_json("finding_category_to_controls.json")
+        categories = {k: [_convert(x) for x in v[section]] for k, v in data.items()}
+        return categories, [_convert(defaults[section])]
+
+    return _load
+
+
+def _package_loader(name: str) -> Callable[[], RawFrameworkData]:
+    def _load() -> RawFrameworkData:
+        data = _package_json(name)
+        return data["categories"], data["default"]
+
+    return _load
+
+
+register_framework(
+    Framework(key="nist_csf", label="NIST CSF", load=_legacy_loader("nist", "function", "category"))
+)
+register_framework(
+    Framework(
+        key="iso_27001",
+        label="ISO 27001 Theme",
+        load=_legacy_loader("iso", "theme_id", "theme_name"),
+    )
+)
+register_framework(
+    Framework(key="cis_v8", label="CIS Controls v8", load=_package_loader("cis_controls_v8.json"))
+)
+register_framework(Framework(key="soc2", label="SOC 2 TSC", load=_package_loader("soc2_tsc.json")))
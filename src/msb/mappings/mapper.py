@@ -1,42 +1,67 @@
 from __future__ import annotations
 
-import json
-from importlib.resources import files
-from typing import cast
+from collections.abc import Sequence
+from functools import cache
 
+from msb.mappings.frameworks import CompiledFramework, compiled_framework, resolve_frameworks
+from msb.mappings.rules import CompiledRuleSet, default_rule_set
 from msb.models import (
+    ControlMapping,
     Finding,
+    FindingCategory,
     Iso27001ThemeMapping,
     NistCsfMapping,
 )
 
 
-def _mapping_data() -> dict[str, object]:
-    path = files("msb.mappings.data").joinpath("finding_category_to_controls.json")
-    raw: str = path.read_text(encoding="utf-8")
-    return cast(dict[str, object], json.loads(raw))
+def map_finding(finding: Finding) -> tuple[list[NistCsfMapping], list[Iso27001ThemeMapping]]:
+    nist, iso = _legacy_mappings(
+        compiled_framework("nist_csf"), compiled_framework("iso_27001"), finding.category
+    )
+    return list(nist), list(iso)
 
 
-def map_finding(finding: Finding) -> tuple[list[NistCsfMapping], list[Iso27001ThemeMapping]]:
-    data = _mapping_data()
-    key = finding.category.value
-    entry = data.get(key)
-    if entry is None:
-        return (
-            [
-                NistCsfMapping(
-                    function="Identify", category="ID.GV (Governance)", rationale="Default mapping."
-                )
-            ],
-            [
-                Iso27001ThemeMapping(
-                    theme_id="A.6",
-                    theme_name="Information security governance",
-                    rationale="Default mapping.",
-                )
-            ],
-        )
-
-    nist = [NistCsfMapping.model_validate(x) for x in entry["nist"]]  # type: ignore[index]
-    iso = [Iso27001ThemeMapping.model_validate(x) for x in entry["iso"]]  # type: ignore[index]
-    return nist, iso
+def map_finding_controls(
+    finding: Finding,
+    frameworks: Sequence[CompiledFramework] | None = None,
+    rules: CompiledRuleSet | None = None,
+) -> list[ControlMapping]:
+    """Map a finding against every enabled framework (all registered ones by default).
+
+    Category mappings come first; controls from matching tag/evidence rules (the packaged
+    rule set by default) are appended for enabled frameworks, skipping duplicates.
+    """
+    enabled = resolve_frameworks() if frameworks is None else frameworks
+    controls: list[ControlMapping] = []
+    for framework in enabled:
+        controls.extend(framework.controls_for(finding.category))
+
+    extra = (default_rule_set() if rules is None else rules).controls_for(finding)
+    if extra:
+        keys = {f.framework.key for f in enabled}
+        seen = {(c.framework, c.control_id, c.control_name) for c in controls}
+        for c in extra:
+            key = (c.framework, c.control_id, c.control_name)
+            if c.framework in keys and key not in seen:
+                seen.add(key)
+                controls.append(c)
+    return controls
+
+
+@cache
+def _legacy_mappings(
+    nist: CompiledFramework, iso: CompiledFramework, category: FindingCategory
+) -> tuple[tuple[NistCsfMapping, ...], tuple[Iso27001ThemeMapping, ...]]:
+    # Keyed on the compiled framework objects, so recompiling yields fresh entries.
+    return (
+        tuple(
+            NistCsfMapping(function=c.control_id, category=c.control_name, rationale=c.rationale)
+            for c in nist.controls_for(category)
+        ),
+        tuple(
+            Iso27001ThemeMapping(
+                theme_id=c.control_id, theme_name=c.control_name, rationale=c.rationale
+            )
+            for c in iso.controls_for(category)
+        ),
+    )
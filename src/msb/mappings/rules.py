@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from msb.mappings.frameworks import registered_frameworks
+from msb.models import ControlMapping, Finding, FindingCategory
+
+# A matchable property of a finding: ("tag", t), ("key", k) or ("kv", k, v).
+Feature = tuple[str, ...]
+
+
+class MappingRule(BaseModel):
+    rule_id: str
+    category: FindingCategory
+    tags: list[str] = Field(default_factory=list)
+    evidence: dict[str, str] = Field(default_factory=dict)
+    evidence_keys: list[str] = Field(default_factory=list)
+    controls: list[ControlMapping]
+
+    def features(self) -> set[Feature]:
+        out: set[Feature] = {("tag", t) for t in self.tags}
+        out.update(("key", k) for k in self.evidence_keys)
+        out.update(("kv", k, v) for k, v in self.evidence.items())
+        return out
+
+
+@dataclass(frozen=True, eq=False)
+class _CategoryMatcher:
+    # Each rule is indexed under one "anchor" feature (its rarest), so only rules whose anchor
+    # the finding has are checked, and each check is a single mask comparison.
+    feature_bits: dict[Feature, int]
+    anchored: dict[Feature, int]
+    unconditional: int
+    required: tuple[int, ...]
+    rules: tuple[MappingRule, ...]
+
+    def match(self, finding: Finding) -> list[MappingRule]:
+        bits = self.feature_bits
+        present = 0
+        candidates = self.unconditional
+        for feature in _finding_features(finding):
+            bit = bits.get(feature)
+            if bit is not None:
+                present |= bit
+                candidates |= self.anchored.get(feature, 0)
+
+        matched: list[MappingRule] = []
+        while candidates:
+            low = candidates & -candidates
+            idx = low.bit_length() - 1
+            candidates ^= low
+            if self.required[idx] & ~present == 0:
+                matched.append(self.rules[idx])
+        return matched
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledRuleSet:
+    by_category: dict[FindingCategory, _CategoryMatcher]
+    rule_count: int
+
+    def match(self, finding: Finding) -> list[MappingRule]:
+        matcher = self.by_category.get(finding.category)
+        return matcher.match(finding) if matcher is not None else []
+
+    def controls_for(self, finding: Finding) -> list[ControlMapping]:
+        return [c for rule in self.match(finding) for c in rule.controls]
+
+    def __len__(self) -> int:
+        return self.rule_count
+
+
+def compile_rules(rules: Iterable[MappingRule]) -> CompiledRuleSet:
+    by_category: dict[FindingCategory, list[MappingRule]] = {}
+    seen_ids: set[str] = set()
+    frameworks = set(registered_frameworks())
+    count = 0
+    for rule in rules:
+        if rule.rule_id in seen_ids:
+            raise ValueError(f"Duplicate mapping rule_id: {rule.rule_id}")
+        unknown = sorted({c.framework for c in rule.controls} - frameworks)
+        if unknown:
+            raise ValueError(
+                f"Mapping rule {rule.rule_id} references unknown framework(s): {unknown}"
+            )
+        seen_ids.add(rule.rule_id)
+        by_category.setdefault(rule.category, []).append(rule)
+        count += 1
+
+    return CompiledRuleSet(
+        by_category={c: _compile_category(rs) for c, rs in by_category.items()},
+        rule_count=count,
+    )
+
+
+def load_rule_set(path: Path) -> CompiledRuleSet:
+    return _rule_set_from_obj(json.loads(path.read_text(encoding="utf-8")))
+
+
+@cache
+def default_rule_set() -> CompiledRuleSet:
+    raw = files("msb.mappings.data").joinpath("mapping_rules.json").read_text(encoding="utf-8")
+    return _rule_set_from_obj(json.loads(raw))
+
+
+def _rule_set_from_obj(obj: dict[str, Any]) -> CompiledRuleSet:
+    return compile_rules(MappingRule.model_validate(x) for x in obj["rules"])
+
+
+def _compile_category(rules: list[MappingRule]) -> _CategoryMatcher:
+    rule_features = [r.features() for r in rules]
+    frequency: Counter[Feature] = Counter(f for fs in rule_features for f in fs)
+    feature_bits = {f: 1 << i for i, f in enumerate(sorted(frequency))}
+
+    anchored: dict[Feature, int] = {}
+    unconditional = 0
+    required: list[int] = []
+    for idx, features in enumerate(rule_features):
+        mask = 0
+        for f in features:
+            mask |= feature_bits[f]
+        required.append(mask)
+        if not features:
+            unconditional |= 1 << idx
+            continue
+        anchor = min(features, key=lambda f: (frequency[f], f))
+        anchored[anchor] = anchored.get(anchor, 0) | (1 << idx)
+
+    return _CategoryMatcher(
+        feature_bits=feature_bits,
+        anchored=anchored,
+        unconditional=unconditional,
+        required=tuple(required),
+        rules=tuple(rules),
+    )
+
+
+def _finding_features(finding: Finding) -> Iterable[Feature]:
+    for t in finding.tags:
+        yield ("tag", t)
+    for k, v in finding.evidence.items():
+        yield ("key", k)
+        yield ("kv", k, v)
@@ -41,6 +41,11 @@ class Effort(StrEnum):
     large = "L"
 
 
+class ScoringMode(StrEnum):
+    raw = "raw"
+    correlated = "correlated"
+
+
 class Asset(BaseModel):
     asset_id: str
     asset_type: str
@@ -55,6 +60,8 @@ class Target(BaseModel):
     region: str
     owner: str
     assets: list[Asset]
+    # Grouping labels for rollups, e.g. {"business_unit": "payments", "account": "1234"}.
+    labels: dict[str, str] = Field(default_factory=dict)
 
 
 class RecommendedAction(BaseModel):
@@ -98,12 +105,31 @@ class Iso27001ThemeMapping(BaseModel):
     rationale: str
 
 
+class ControlMapping(BaseModel):
+    framework: str
+    control_id: str
+    control_name: str
+    rationale: str
+
+
 class MappedFinding(BaseModel):
+    """A finding with its control mappings, risk score and domain.
+
+    `controls` holds the mappings for the selected frameworks, including controls added by
+    mapping rules. `nist` and `iso` always hold the category-only NIST CSF and ISO 27001
+    mappings, whatever frameworks are selected. They are a compatibility shim: summaries
+    written before multi-framework mapping only carry them, and readers of summary.json
+    rely on them.
+    """
+
     finding: Finding
     nist: list[NistCsfMapping]
     iso: list[Iso27001ThemeMapping]
+    controls: list[ControlMapping] = Field(default_factory=list)
     risk_score: float
     domain: str
+    # Affected-asset count, or its label-weighted sum when assessed with asset weights.
+    blast_radius: float | None = None
 
 
 class DomainMaturity(BaseModel):
@@ -121,13 +147,142 @@ class TargetAssessment(BaseModel):
     finding_count: int
 
 
+class RollupGroup(BaseModel):
+    """One node of a rollup hierarchy, e.g. path ["payments", "acct-0001"].
+
+    `penalty`, `domain_penalty`, the counts and `posture_sum` add up across groups, so
+    sibling groups merge into their parent without rescoring.
+    """
+
+    path: list[str]
+    posture_score: float
+    domain_maturity: list[DomainMaturity]
+    penalty: float
+    domain_penalty: dict[str, float]
+    finding_count: int
+    target_count: int
+    # Sum and minimum of member target postures (mean = posture_sum / target_count).
+    posture_sum: float
+    min_target_posture: float
+
+
+class Rollup(BaseModel):
+    name: str
+    levels: list[str]
+    # Every level of the hierarchy, parents before children, sorted by path.
+    groups: list[RollupGroup]
+
+
 class OrgAssessment(BaseModel):
     posture_score: float
     domain_maturity: list[DomainMaturity]
 
 
+class CorrelatedFinding(BaseModel):
+    signature: str
+    canonical_finding_id: str
+    canonical_target_id: str
+    category: FindingCategory
+    title: str
+    target_ids: list[str]
+    finding_ids: list[str]
+
+
+class PostureBand(BaseModel):
+    mean: float
+    median: float
+    lower: float
+    upper: float
+
+
+class PostureUncertainty(BaseModel):
+    draws: int
+    confidence: float
+    seed: int
+    org: PostureBand
+    domains: dict[str, PostureBand]
+    targets: dict[str, PostureBand]
+
+
+class EstimateBand(BaseModel):
+    estimate: float
+    lower: float
+    upper: float
+
+
+class ControlCoverageEstimate(BaseModel):
+    framework: str
+    control_theme: str
+    finding_count: EstimateBand
+
+
+class AssetCountEstimate(BaseModel):
+    target_id: str
+    asset_id: str
+    finding_count: EstimateBand
+
+
+class ApproximateSummary(BaseModel):
+    """Quick-look estimates from a stratified sample of findings; see `msb assess --approximate`.
+
+    Posture and coverage bands are normal-approximation intervals at `confidence`; asset
+    counts come from a count-min sketch and hold with probability `1 - sketch_delta`.
+    """
+
+    assessed_at: datetime
+    confidence: float
+    seed: int
+    findings_total: int
+    findings_sampled: int
+    strata: int
+    org: EstimateBand
+    domains: dict[str, EstimateBand]
+    targets: dict[str, EstimateBand]
+    coverage: list[ControlCoverageEstimate]
+    top_assets: list[AssetCountEstimate]
+    sketch_epsilon: float
+    sketch_delta: float
+    scoring_profile: str | None = None
+
+
 class AssessmentSummary(BaseModel):
     assessed_at: datetime
     org: OrgAssessment
     targets: list[TargetAssessment]
     mapped_findings: list[MappedFinding]
+    scoring_mode: ScoringMode = ScoringMode.raw
+    # Digest of the scoring profile that produced the scores (None for older summaries).
+    scoring_profile: str | None = None
+    correlated_findings: list[CorrelatedFinding] = Field(default_factory=list)
+    uncertainty: PostureUncertainty | None = None
+    rollups: list[Rollup] = Field(default_factory=list)
+
+
+class SummaryShardRef(BaseModel):
+    target_id: str
+    provider: Provider
+    environment: str
+    posture_score: float
+    finding_count: int
+    # Shard path relative to the index, and a digest of its bytes to detect unchanged targets.
+    path: str
+    sha256: str
+
+
+class SummaryIndex(BaseModel):
+    """Org-level part of a partitioned summary; each target's detail lives in its shard."""
+
+    layout_version: Literal[1] = 1
+    assessed_at: datetime
+    org: OrgAssessment
+    targets: list[SummaryShardRef]
+    scoring_mode: ScoringMode = ScoringMode.raw
+    scoring_profile: str | None = None
+    correlated_findings: list[CorrelatedFinding] = Field(default_factory=list)
+    uncertainty: PostureUncertainty | None = None
+    rollups: list[Rollup] = Field(default_factory=list)
+
+
+class SummaryShard(BaseModel):
+    target: TargetAssessment
+    mapped_findings: list[MappedFinding]
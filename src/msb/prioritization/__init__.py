@@ -1,5 +1,19 @@
 from __future__ import annotations
 
-from msb.prioritization.planner import build_backlog_and_roadmap
+from msb.prioritization.planner import (
+    RoadmapBuilder,
+    backlog_and_roadmap_tables,
+    build_backlog_and_roadmap,
+    build_backlog_records,
+    iter_backlog_rows,
+    spill_backlog_records,
+)
 
-__all__ = ["build_backlog_and_roadmap"]
+__all__ = [
+    "RoadmapBuilder",
+    "backlog_and_roadmap_tables",
+    "build_backlog_and_roadmap",
+    "build_backlog_records",
+    "iter_backlog_rows",
+    "spill_backlog_records",
+]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
 
-from msb.models import Effort, MappedFinding
+from msb.models import MappedFinding
+from msb.scoring.profile import PHASES, CompiledScoringProfile, default_scoring_profile
+from msb.utils.extsort import ExternalSorter
+from msb.utils.instrumentation import span
 
 
 @dataclass(frozen=True)
@@ -15,98 +19,174 @@ class CsvTable:
         return self.rows
 
 
-def build_backlog_and_roadmap(mapped_findings: list[MappedFinding]) -> tuple[CsvTable, CsvTable]:
-    backlog_rows: list[dict[str, str | float | int]] = []
+BacklogRecord = dict[str, str | float | int]
+
+BACKLOG_HEADERS = [
+    "item_id",
+    "target_id",
+    "domain",
+    "finding_title",
+    "action_title",
+    "risk_score",
+    "impact_1_to_5",
+    "effort",
+    "dependencies",
+    "owner",
+    "quick_win",
+    "phase",
+    "priority_score",
+    "rationale",
+]
+
+
+def build_backlog_and_roadmap(
+    mapped_findings: list[MappedFinding], profile: CompiledScoringProfile | None = None
+) -> tuple[CsvTable, CsvTable]:
+    with span("plan", records=len(mapped_findings)):
+        return backlog_and_roadmap_tables(
+            _backlog_records(mapped_findings, profile or default_scoring_profile())
+        )
+
+
+def build_backlog_records(
+    mapped_findings: list[MappedFinding], profile: CompiledScoringProfile | None = None
+) -> list[BacklogRecord]:
+    """Backlog rows in priority order with unformatted numeric scores (for columnar export)."""
+    with span("plan", records=len(mapped_findings)):
+        return _backlog_records(mapped_findings, profile or default_scoring_profile())
+
+
+def spill_backlog_records(
+    mapped_findings: list[MappedFinding],
+    profile: CompiledScoringProfile | None = None,
+    *,
+    memory_budget: int,
+    spill_dir: Path | None = None,
+) -> ExternalSorter:
+    """`build_backlog_records` for backlogs larger than memory.
+
+    Rows are sorted in runs of about `memory_budget` bytes that spill to temporary files under
+    `spill_dir`; iterating the returned sorter merges them into exactly the same order. Close
+    it (or use it as a context manager) to remove the spill files.
+    """
+    sorter = ExternalSorter(_backlog_order, memory_budget=memory_budget, tmp_dir=spill_dir)
+    with span("plan", records=len(mapped_findings)) as s:
+        sorter.extend(_iter_backlog_records(mapped_findings, profile or default_scoring_profile()))
+        s.fields["spilled_runs"] = sorter.spilled_runs
+    return sorter
+
+
+def _backlog_order(r: BacklogRecord) -> tuple[float, str]:
+    return -float(r["priority_score"]), str(r["item_id"])
+
+
+def _backlog_records(
+    mapped_findings: list[MappedFinding], profile: CompiledScoringProfile
+) -> list[BacklogRecord]:
+    backlog_rows = list(_iter_backlog_records(mapped_findings, profile))
+    backlog_rows.sort(key=_backlog_order)
+    return backlog_rows
+
+
+def _iter_backlog_records(
+    mapped_findings: list[MappedFinding], profile: CompiledScoringProfile
+) -> Iterator[BacklogRecord]:
+    # Unordered; callers sort by `_backlog_order`.
+    dependency_factor = profile.profile.dependency_factor
 
     for mf in mapped_findings:
         for action in mf.finding.recommended_actions:
-            effort_num = _effort_to_num(action.effort)
+            effort_num = profile.effort(action.effort)
             impact = float(action.expected_impact)
             deps = len(action.dependencies)
-            blast_radius = max(1, len(mf.finding.affected_assets))
+            blast_radius = max(
+                1.0,
+                mf.blast_radius
+                if mf.blast_radius is not None
+                else float(len(mf.finding.affected_assets)),
+            )
 
-            risk = float(mf.risk_score) * (1.0 + 0.05 * (blast_radius - 1))
+            risk = float(mf.risk_score) * profile.blast_multiplier(blast_radius)
             priority = (risk * impact) / effort_num
-            priority *= 0.92**deps
-
-            quick_win = effort_num <= 2 and risk >= 20.0
-            phase = _phase_for(risk=risk, effort_num=effort_num)
-
-            backlog_rows.append(
-                {
-                    "item_id": f"{mf.finding.finding_id}:{action.action_id}",
-                    "target_id": mf.finding.target_id,
-                    "domain": mf.domain,
-                    "finding_title": mf.finding.title,
-                    "action_title": action.title,
-                    "risk_score": risk,
-                    "impact_1_to_5": int(impact),
-                    "effort": action.effort.value,
-                    "dependencies": ",".join(action.dependencies),
-                    "owner": action.owner,
-                    "quick_win": "yes" if quick_win else "no",
-                    "phase": phase,
-                    "priority_score": priority,
-                    "rationale": _rationale(
-                        mf=mf, effort_num=effort_num, impact=impact, deps=deps, blast=blast_radius
-                    ),
-                }
-            )
+            priority *= dependency_factor**deps
+
+            quick_win = profile.is_quick_win(risk=risk, effort_num=effort_num)
+            phase = profile.phase_for(risk=risk, effort_num=effort_num)
+
+            yield {
+                "item_id": f"{mf.finding.finding_id}:{action.action_id}",
+                "target_id": mf.finding.target_id,
+                "domain": mf.domain,
+                "finding_title": mf.finding.title,
+                "action_title": action.title,
+                "risk_score": risk,
+                "impact_1_to_5": int(impact),
+                "effort": action.effort.value,
+                "dependencies": ",".join(action.dependencies),
+                "owner": action.owner,
+                "quick_win": "yes" if quick_win else "no",
+                "phase": phase,
+                "priority_score": priority,
+                "rationale": _rationale(
+                    mf=mf, effort_num=effort_num, impact=impact, deps=deps, blast=blast_radius
+                ),
+            }
 
-    backlog_rows.sort(key=lambda r: (-float(r["priority_score"]), str(r["item_id"])))
-
-    backlog_table = _as_csv_table(
-        backlog_rows,
-        headers=[
-            "item_id",
-            "target_id",
-            "domain",
-            "finding_title",
-            "action_title",
-            "risk_score",
-            "impact_1_to_5",
-            "effort",
-            "dependencies",
-            "owner",
-            "quick_win",
-            "phase",
-            "priority_score",
-            "rationale",
-        ],
-        formatters={
-            "risk_score": lambda v: f"{float(v):.2f}",
-            "priority_score": lambda v: f"{float(v):.3f}",
-        },
-    )
 
-    roadmap_rows = _roadmap_from_backlog(backlog_rows)
-    roadmap_table = _as_csv_table(
-        roadmap_rows,
-        headers=["phase", "focus", "why_now", "example_items", "notes"],
-        formatters={},
+def backlog_and_roadmap_tables(backlog_rows: list[BacklogRecord]) -> tuple[CsvTable, CsvTable]:
+    """Format records from `build_backlog_records` as the backlog and roadmap CSV tables."""
+    roadmap = RoadmapBuilder()
+    backlog_table = CsvTable(
+        headers=BACKLOG_HEADERS, rows=list(iter_backlog_rows(backlog_rows, roadmap))
     )
+    return backlog_table, roadmap.table()
+
+
+_BACKLOG_FORMATTERS: dict[str, Callable[[str | float | int], str]] = {
+    "risk_score": lambda v: f"{float(v):.2f}",
+    "priority_score": lambda v: f"{float(v):.3f}",
+}
+
+
+def iter_backlog_rows(
+    backlog_rows: Iterable[BacklogRecord], roadmap: RoadmapBuilder | None = None
+) -> Iterator[list[str]]:
+    """Backlog CSV rows in record order, optionally feeding `roadmap` on the way."""
+    for r in backlog_rows:
+        if roadmap is not None:
+            roadmap.add(r)
+        yield _csv_row(r, BACKLOG_HEADERS, _BACKLOG_FORMATTERS)
 
-    return backlog_table, roadmap_table
 
+@dataclass
+class RoadmapBuilder:
+    """Collects the roadmap from backlog records seen in priority order.
 
-def _phase_for(*, risk: float, effort_num: int) -> str:
-    if risk >= 30.0 and effort_num <= 2:
-        return "Phase 0 (Immediate)"
-    if risk >= 25.0:
-        return "Phase 1 (0-30 days)"
-    if risk >= 15.0:
-        return "Phase 2 (30-90 days)"
-    return "Phase 3 (90-180 days)"
+    Only the first few items per phase are kept, so arbitrarily long backlogs stream through.
+    """
 
+    examples_per_phase: int = 3
+    _examples: dict[str, list[str]] = field(default_factory=dict)
 
-def _effort_to_num(effort: Effort) -> int:
-    return {Effort.small: 1, Effort.medium: 3, Effort.large: 5}[effort]
+    def add(self, record: BacklogRecord) -> None:
+        items = self._examples.setdefault(str(record["phase"]), [])
+        if len(items) < self.examples_per_phase:
+            items.append(str(record["item_id"]))
+
+    def table(self) -> CsvTable:
+        return _as_csv_table(
+            _roadmap_from_examples(self._examples),
+            headers=["phase", "focus", "why_now", "example_items", "notes"],
+            formatters={},
+        )
 
 
-def _rationale(*, mf: MappedFinding, effort_num: int, impact: float, deps: int, blast: int) -> str:
+def _rationale(
+    *, mf: MappedFinding, effort_num: int, impact: float, deps: int, blast: float
+) -> str:
     return (
         f"Risk is driven by {mf.finding.severity.value} severity and {mf.domain} control gap; "
-        f"impact={int(impact)}/5, effort≈{effort_num}, deps={deps}, blast_radius≈{blast} assets."
+        f"impact={int(impact)}/5, effort≈{effort_num}, deps={deps}, blast_radius≈{blast:g} assets."
     )
 
 
@@ -115,39 +195,32 @@ def _as_csv_table(
     headers: list[str],
     formatters: dict[str, Callable[[str | float | int], str]],
 ) -> CsvTable:
-    formatted: list[list[str]] = []
-    for r in rows:
-        out_row: list[str] = []
-        for h in headers:
-            v = r.get(h, "")
-            if h in formatters:
-                out_row.append(formatters[h](v))
-            else:
-                out_row.append(str(v))
-        formatted.append(out_row)
-    return CsvTable(headers=headers, rows=formatted)
-
-
-def _roadmap_from_backlog(
-    backlog_rows: list[dict[str, str | float | int]],
-) -> list[dict[str, str | float | int]]:
-    by_phase: dict[str, list[dict[str, str | float | int]]] = {}
-    for r in backlog_rows:
-        by_phase.setdefault(str(r["phase"]), []).append(r)
+    return CsvTable(headers=headers, rows=[_csv_row(r, headers, formatters) for r in rows])
 
-    phases = [
-        "Phase 0 (Immediate)",
-        "Phase 1 (0-30 days)",
-        "Phase 2 (30-90 days)",
-        "Phase 3 (90-180 days)",
-    ]
 
-    def _top_items(phase: str, n: int = 3) -> str:
-        items = by_phase.get(phase, [])[:n]
-        return " | ".join(str(i["item_id"]) for i in items) if items else ""
+def _csv_row(
+    r: dict[str, str | float | int],
+    headers: list[str],
+    formatters: dict[str, Callable[[str | float | int], str]],
+) -> list[str]:
+    out_row: list[str] = []
+    for h in headers:
+        v = r.get(h, "")
+        if h in formatters:
+            out_row.append(formatters[h](v))
+        else:
+            out_row.append(str(v))
+    return out_row
+
+
+def _roadmap_from_examples(
+    examples: dict[str, list[str]],
+) -> list[dict[str, str | float | int]]:
+    def _top_items(phase: str) -> str:
+        return " | ".join(examples.get(phase, []))
 
     roadmap: list[dict[str, str | float | int]] = []
-    for phase in phases:
+    for phase in PHASES:
         roadmap.append(
             {
                 "phase": phase,
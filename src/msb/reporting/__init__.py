@@ -1,5 +1,17 @@
 from __future__ import annotations
 
-from msb.reporting.render import render_html_report, render_markdown_report
+from msb.reporting.render import (
+    html_template,
+    render_html_from_rows,
+    render_html_report,
+    render_markdown_from_rows,
+    render_markdown_report,
+)
 
-__all__ = ["render_html_report", "render_markdown_report"]
+__all__ = [
+    "html_template",
+    "render_html_from_rows",
+    "render_html_report",
+    "render_markdown_from_rows",
+    "render_markdown_report",
+]
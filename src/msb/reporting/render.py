@@ -1,20 +1,69 @@
 from __future__ import annotations
 
 import csv
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, PackageLoader, Template, select_autoescape
+
+from msb.io.artifacts import find_artifact, open_text
+from msb.utils.instrumentation import span
 
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
+    path = find_artifact(path)
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8", newline="") as f:
+    with open_text(path, newline="") as f:
         reader = csv.DictReader(f)
         return [dict(row) for row in reader]
 
 
+def _top_per_framework(coverage: list[dict[str, str]], n: int) -> list[dict[str, str]]:
+    # Coverage rows are grouped by framework, so every framework keeps its own top rows.
+    seen: dict[str, int] = {}
+    out: list[dict[str, str]] = []
+    for row in coverage:
+        count = seen.get(row["framework"], 0)
+        if count < n:
+            out.append(row)
+        seen[row["framework"]] = count + 1
+    return out
+
+
+def _rollup_tables(
+    compare_obj: dict[str, Any], depth: int = 2, n: int = 30
+) -> list[dict[str, Any]]:
+    # The first `depth` levels of each rollup, parents before children, capped at `n` rows.
+    tables = []
+    for rollup in compare_obj.get("rollups", []):
+        rows = [
+            {**g, "group": " / ".join(g["path"]), "depth": len(g["path"])}
+            for g in rollup["groups"]
+            if len(g["path"]) <= depth
+        ]
+        tables.append({"name": rollup["name"], "rows": rows[:n], "omitted": max(0, len(rows) - n)})
+    return tables
+
+
+def _posture_cell(value: float | None, fmt: str = "{:.1f}") -> str:
+    return "-" if value is None else fmt.format(value)
+
+
+def _band_text(org: dict[str, Any]) -> str:
+    # Summaries assessed with Monte Carlo uncertainty carry an interval per side.
+    parts = []
+    for side in ("before", "after"):
+        band = org.get(f"{side}_band")
+        if band:
+            parts.append(
+                f"{side} {band['lower']:.1f}-{band['upper']:.1f} "
+                f"({band['confidence'] * 100:.0f}% interval)"
+            )
+    return "; ".join(parts)
+
+
 def render_markdown_report(
     *,
     title: str,
@@ -24,10 +73,37 @@ def render_markdown_report(
     roadmap_csv_path: Path,
     controls_coverage_csv_path: Path,
 ) -> str:
-    backlog = _read_csv(remediation_backlog_csv_path)
-    roadmap = _read_csv(roadmap_csv_path)
-    coverage = _read_csv(controls_coverage_csv_path)
+    return render_markdown_from_rows(
+        title=title,
+        author=author,
+        compare_obj=compare_obj,
+        backlog=_read_csv(remediation_backlog_csv_path),
+        roadmap=_read_csv(roadmap_csv_path),
+        coverage=_read_csv(controls_coverage_csv_path),
+    )
+
 
+def render_markdown_from_rows(
+    *,
+    title: str,
+    author: str | None,
+    compare_obj: dict[str, Any],
+    backlog: list[dict[str, str]],
+    roadmap: list[dict[str, str]],
+    coverage: list[dict[str, str]],
+) -> str:
+    with span("render", format="md"):
+        return _render_markdown(title, author, compare_obj, backlog, roadmap, coverage)
+
+
+def _render_markdown(
+    title: str,
+    author: str | None,
+    compare_obj: dict[str, Any],
+    backlog: list[dict[str, str]],
+    roadmap: list[dict[str, str]],
+    coverage: list[dict[str, str]],
+) -> str:
     org = compare_obj["org"]["posture"]
     deltas = compare_obj["org"]["domain_posture_deltas"]
 
@@ -41,6 +117,9 @@ def render_markdown_report(
         f"- Org posture: **{org['before']:.1f} → {org['after']:.1f}** "
         f"(**{org['delta']:+.1f}**, {org['percent_change']:+.1f}%)."
     )
+    bands = _band_text(org)
+    if bands:
+        lines.append(f"- Uncertainty: {bands}.")
     lines.append(
         "- This is a safe, offline simulation using synthetic fixtures (no cloud credentials, no scanning)."
     )
@@ -54,6 +133,26 @@ def render_markdown_report(
         )
     lines.append("")
 
+    rollups = _rollup_tables(compare_obj)
+    if rollups:
+        lines.append("## Rollups")
+        for table in rollups:
+            lines.append(f"### {table['name']}")
+            lines.append("| Group | Targets | Before | After | Delta | Mean target | Findings |")
+            lines.append("|---|---:|---:|---:|---:|---|---|")
+            for r in table["rows"]:
+                lines.append(
+                    f"| {r['group']} | {r['targets_after']} | {_posture_cell(r['before'])} | "
+                    f"{_posture_cell(r['after'])} | {_posture_cell(r['delta'], '{:+.1f}')} | "
+                    f"{_posture_cell(r['mean_target_before'])} → "
+                    f"{_posture_cell(r['mean_target_after'])} | "
+                    f"{r['findings_before']} → {r['findings_after']} |"
+                )
+            if table["omitted"]:
+                lines.append("")
+                lines.append(f"_{table['omitted']} more groups in compare.json._")
+            lines.append("")
+
     lines.append("## Remediation Backlog (Top 10)")
     lines.append("| Priority | Item | Target | Domain | Risk | Effort | Phase |")
     lines.append("|---:|---|---|---|---:|---|---|")
@@ -76,7 +175,7 @@ def render_markdown_report(
     lines.append("## Framework Coverage Summary")
     lines.append("| Framework | Control theme | Findings |")
     lines.append("|---|---|---:|")
-    for row in coverage[:20]:
+    for row in _top_per_framework(coverage, 5):
         lines.append(f"| {row['framework']} | {row['control_theme']} | {row['finding_count']} |")
     lines.append("")
 
@@ -92,22 +191,44 @@ def render_html_report(
     roadmap_csv_path: Path,
     controls_coverage_csv_path: Path,
 ) -> str:
-    env = Environment(
-        loader=PackageLoader("msb.reporting", "templates"),
-        autoescape=select_autoescape(["html"]),
+    return render_html_from_rows(
+        title=title,
+        author=author,
+        compare_obj=compare_obj,
+        backlog=_read_csv(remediation_backlog_csv_path),
+        roadmap=_read_csv(roadmap_csv_path),
+        coverage=_read_csv(controls_coverage_csv_path),
     )
-    template = env.get_template("report.html.j2")
 
-    backlog = _read_csv(remediation_backlog_csv_path)
-    roadmap = _read_csv(roadmap_csv_path)
-    coverage = _read_csv(controls_coverage_csv_path)
 
-    return template.render(
-        title=title,
-        author=author,
-        org=compare_obj["org"]["posture"],
-        domain_deltas=compare_obj["org"]["domain_posture_deltas"],
-        backlog=backlog[:25],
-        roadmap=roadmap,
-        coverage=coverage[:40],
+def render_html_from_rows(
+    *,
+    title: str,
+    author: str | None,
+    compare_obj: dict[str, Any],
+    backlog: list[dict[str, str]],
+    roadmap: list[dict[str, str]],
+    coverage: list[dict[str, str]],
+) -> str:
+    with span("render", format="html"):
+        return html_template().render(
+            title=title,
+            author=author,
+            org=compare_obj["org"]["posture"],
+            org_bands=_band_text(compare_obj["org"]["posture"]),
+            domain_deltas=compare_obj["org"]["domain_posture_deltas"],
+            rollups=_rollup_tables(compare_obj),
+            backlog=backlog[:25],
+            roadmap=roadmap,
+            coverage=_top_per_framework(coverage, 10),
+        )
+
+
+@cache
+def html_template() -> Template:
+    """The compiled report template; `html_template.cache_clear()` picks up template edits."""
+    env = Environment(
+        loader=PackageLoader("msb.reporting", "templates"),
+        autoescape=select_autoescape(["html"]),
     )
+    return env.get_template("report.html.j2")
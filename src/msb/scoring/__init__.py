@@ -1,5 +1,44 @@
 from __future__ import annotations
 
-from msb.scoring.assess import assess_fixture_pack, compute_controls_coverage
+from msb.scoring.approximate import approximate_assess
+from msb.scoring.assess import (
+    assess_fixture_pack,
+    build_coverage_aggregator,
+    compute_controls_coverage,
+)
+from msb.scoring.correlation import FindingCluster, correlate_findings, finding_signature
+from msb.scoring.coverage import CoverageAggregator, CoverageTable
+from msb.scoring.profile import (
+    CompiledScoringProfile,
+    ScoringProfile,
+    compile_scoring_profile,
+    default_scoring_profile,
+    load_scoring_profile,
+)
+from msb.scoring.rollup import RollupAggregate, RollupSpec, build_rollups, parse_rollup
+from msb.scoring.simulation import PostureSimulator, SimulationResult
+from msb.scoring.uncertainty import estimate_posture_uncertainty
 
-__all__ = ["assess_fixture_pack", "compute_controls_coverage"]
+__all__ = [
+    "CompiledScoringProfile",
+    "CoverageAggregator",
+    "CoverageTable",
+    "FindingCluster",
+    "PostureSimulator",
+    "RollupAggregate",
+    "RollupSpec",
+    "ScoringProfile",
+    "SimulationResult",
+    "approximate_assess",
+    "assess_fixture_pack",
+    "build_coverage_aggregator",
+    "build_rollups",
+    "compile_scoring_profile",
+    "compute_controls_coverage",
+    "correlate_findings",
+    "default_scoring_profile",
+    "estimate_posture_uncertainty",
+    "finding_signature",
+    "load_scoring_profile",
+    "parse_rollup",
+]
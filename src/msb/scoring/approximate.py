@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any
+
+from msb.assets import AssetWeights
+from msb.io.artifacts import open_text, read_json
+from msb.io.fixtures import (
+    FixturePack,
+    FixtureValidationError,
+    pack_files,
+    validate_finding_records,
+)
+from msb.io.jsonstream import iter_json_array
+from msb.io.schema import needs_upgrade, upgrade_finding
+from msb.mappings import CompiledRuleSet, framework_label
+from msb.models import (
+    ApproximateSummary,
+    AssetCountEstimate,
+    ControlCoverageEstimate,
+    EstimateBand,
+    FindingCategory,
+    Target,
+)
+from msb.scoring.assess import FindingMapper, finding_penalty, posture_score_from_penalty
+from msb.scoring.coverage import ControlKey
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
+from msb.scoring.risk import domain_for_category
+from msb.utils.instrumentation import span
+from msb.utils.sketch import CountMinSketch, HeavyHitters
+
+
+@dataclass
+class _Stratum:
+    """Findings of one (target, category): the exact count and a reservoir sample."""
+
+    seen: int = 0
+    # (record index, raw record)
+    sample: list[tuple[int, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _Total:
+    """A stratified estimate of a sum and its variance."""
+
+    estimate: float = 0.0
+    variance: float = 0.0
+
+    def add(self, population: int, values: Sequence[float]) -> None:
+        n = len(values)
+        mean = sum(values) / n
+        self.estimate += population * mean
+        if 1 < n < population:
+            s2 = sum((v - mean) ** 2 for v in values) / (n - 1)
+            # Finite population correction: a fully sampled stratum contributes no error.
+            self.variance += population**2 * (1 - n / population) * s2 / n
+
+    def band(self, z: float, lowest: float = 0.0) -> tuple[float, float, float]:
+        half = z * math.sqrt(self.variance)
+        return self.estimate, max(lowest, self.estimate - half), self.estimate + half
+
+
+def approximate_assess(
+    pack_dirs: Sequence[Path],
+    *,
+    sample_per_stratum: int = 8,
+    confidence: float = 0.9,
+    seed: int = 0,
+    frameworks: Sequence[str] | None = None,
+    rules: CompiledRuleSet | None = None,
+    asset_weights: AssetWeights | None = None,
+    profile: CompiledScoringProfile | None = None,
+    top_assets: int = 20,
+    sketch_epsilon: float = 0.0001,
+    sketch_delta: float = 0.01,
+) -> ApproximateSummary:
+    """Estimate posture, coverage and the most affected assets without a full assessment.
+
+    One streaming pass over the raw findings counts every (target, category) stratum exactly,
+    keeps a seeded reservoir sample of up to `sample_per_stratum` findings per stratum and
+    feeds every affected asset into a count-min sketch. Only the sampled findings are
+    validated, mapped and scored; stratified estimators scale them back up. Strata that fit
+    in the sample are exact, and so are controls mapped from the category alone.
+    """
+    if sample_per_stratum < 2:
+        raise ValueError("sample_per_stratum must be >= 2")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1)")
+    profile = profile or default_scoring_profile()
+    rng = random.Random(seed)
+
+    targets: list[Target] = []
+    strata: dict[tuple[str, str], _Stratum] = {}
+    assets = HeavyHitters(top_assets, CountMinSketch(sketch_epsilon, sketch_delta, seed=seed))
+    total = 0
+    unknown: set[str] = set()
+    with span("sample") as s:
+        for root in pack_dirs:
+            targets_path, findings_path = pack_files(root)
+            pack_targets = [Target.model_validate(t) for t in read_json(targets_path)["targets"]]
+            dupes = sorted({t.target_id for t in pack_targets} & {t.target_id for t in targets})
+            if dupes:
+                raise ValueError(f"Duplicate target_id(s) across fixture packs: {dupes}")
+            targets.extend(pack_targets)
+            known = {t.target_id for t in targets}
+            with open_text(findings_path) as f:
+                for obj in iter_json_array(f, "findings"):
+                    if needs_upgrade(obj):
+                        obj = upgrade_finding(obj)
+                    target_id = str(obj.get("target_id"))
+                    if target_id not in known:
+                        unknown.add(target_id)
+                    stratum = strata.setdefault((target_id, str(obj.get("category"))), _Stratum())
+                    stratum.seen += 1
+                    if len(stratum.sample) < sample_per_stratum:
+                        stratum.sample.append((total, obj))
+                    else:
+                        j = rng.randrange(stratum.seen)
+                        if j < sample_per_stratum:
+                            stratum.sample[j] = (total, obj)
+                    for asset_id in obj.get("affected_assets") or ():
+                        assets.add(f"{target_id}/{asset_id}")
+                    total += 1
+        s.records = total
+    if unknown:
+        raise ValueError(f"Findings reference unknown target_id(s): {sorted(unknown)}")
+
+    sampled = [item for stratum in strata.values() for item in stratum.sample]
+    with span("score", records=len(sampled)):
+        try:
+            findings = validate_finding_records([obj for _, obj in sampled])
+        except FixtureValidationError as exc:
+            # Report positions in the findings array, not in the sample.
+            errors = [replace(e, index=sampled[e.index][0]) for e in exc.errors]
+            raise FixtureValidationError(errors, total) from None
+        mapper = FindingMapper(
+            FixturePack(targets=targets, findings=findings),
+            frameworks,
+            rules,
+            asset_weights,
+            profile,
+        )
+        mapped = iter(mapper.map(f) for f in findings)
+
+        org, domains, by_target = _Total(), dict[str, _Total](), dict[str, _Total]()
+        coverage: dict[ControlKey, _Total] = {}
+        for (target_id, category), stratum in strata.items():
+            sample = [next(mapped) for _ in stratum.sample]
+            penalties = [finding_penalty(mf, profile) for mf in sample]
+            domain = domain_for_category(FindingCategory(category))
+            for acc in (
+                org,
+                domains.setdefault(domain, _Total()),
+                by_target.setdefault(target_id, _Total()),
+            ):
+                acc.add(stratum.seen, penalties)
+            hits: Counter[ControlKey] = Counter()
+            for mf in sample:
+                hits.update(
+                    {
+                        (framework_label(c.framework), c.control_id, c.control_name)
+                        for c in mf.controls
+                    }
+                )
+            # A control missing from a stratum's sample adds zero, with zero variance.
+            for key, n in hits.items():
+                coverage.setdefault(key, _Total()).add(
+                    stratum.seen, [1.0] * n + [0.0] * (len(sample) - n)
+                )
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    norm = profile.posture_normalization
+    sketch = assets.sketch
+    return ApproximateSummary(
+        assessed_at=datetime.now(tz=UTC),
+        confidence=confidence,
+        seed=seed,
+        findings_total=total,
+        findings_sampled=len(sampled),
+        strata=len(strata),
+        org=_posture_band(org, z, norm),
+        domains={d: _posture_band(acc, z, norm) for d, acc in sorted(domains.items())},
+        targets={
+            t.target_id: _posture_band(by_target.get(t.target_id, _Total()), z, norm)
+            for t in sorted(targets, key=lambda t: t.target_id)
+        },
+        coverage=_coverage_estimates(coverage, z),
+        top_assets=[
+            AssetCountEstimate(
+                target_id=key.split("/", 1)[0],
+                asset_id=key.split("/", 1)[1],
+                finding_count=EstimateBand(
+                    estimate=float(count),
+                    # Counts are integers, so the sketch's error bound rounds up.
+                    lower=float(max(0, math.ceil(count - sketch.epsilon * sketch.total))),
+                    upper=float(count),
+                ),
+            )
+            for key, count in assets.top()
+        ],
+        sketch_epsilon=sketch.epsilon,
+        sketch_delta=sketch.delta,
+        scoring_profile=profile.digest,
+    )
+
+
+def _posture_band(acc: _Total, z: float, norm: float) -> EstimateBand:
+    # Posture falls as penalty rises, so the penalty's upper bound is the posture's lower.
+    estimate, low, high = acc.band(z)
+    return EstimateBand(
+        estimate=posture_score_from_penalty(estimate, norm),
+        lower=posture_score_from_penalty(high, norm),
+        upper=posture_score_from_penalty(low, norm),
+    )
+
+
+def _coverage_estimates(
+    coverage: dict[ControlKey, _Total], z: float
+) -> list[ControlCoverageEstimate]:
+    # Frameworks in first-seen order, controls by estimated count (as in the exact table).
+    frameworks: dict[str, list[tuple[ControlKey, _Total]]] = {}
+    for key, acc in coverage.items():
+        frameworks.setdefault(key[0], []).append((key, acc))
+    out: list[ControlCoverageEstimate] = []
+    for items in frameworks.values():
+        for (framework, control_id, name), acc in sorted(items, key=lambda kv: -kv[1].estimate):
+            estimate, low, high = acc.band(z)
+            out.append(
+                ControlCoverageEstimate(
+                    framework=framework,
+                    control_theme=f"{control_id} | {name}",
+                    finding_count=EstimateBand(estimate=estimate, lower=low, upper=high),
+                )
+            )
+    return out
@@ -1,101 +1,282 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from typing import Any
 
+from msb.assets import AssetWeights
 from msb.io.fixtures import FixturePack
-from msb.mappings import map_finding
+from msb.mappings import (
+    CompiledRuleSet,
+    map_finding,
+    map_finding_controls,
+    resolve_frameworks,
+)
 from msb.models import (
     AssessmentSummary,
+    CorrelatedFinding,
     DomainMaturity,
+    Finding,
     MappedFinding,
     OrgAssessment,
+    Rollup,
+    RollupGroup,
+    ScoringMode,
+    Target,
     TargetAssessment,
 )
-from msb.scoring.risk import domain_for_category, risk_score_for_finding
+from msb.scoring.correlation import correlate_findings, correlated_finding_models
+from msb.scoring.coverage import CoverageAggregator, CoverageTable
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
+from msb.scoring.risk import domain_for_category
+from msb.scoring.rollup import RollupAggregate, RollupSpec, build_rollups
+from msb.utils.instrumentation import span
+
+
+def assess_fixture_pack(
+    pack: FixturePack,
+    *,
+    frameworks: Sequence[str] | None = None,
+    rules: CompiledRuleSet | None = None,
+    asset_weights: AssetWeights | None = None,
+    scoring_mode: ScoringMode = ScoringMode.raw,
+    profile: CompiledScoringProfile | None = None,
+    rollups: Sequence[RollupSpec] = (),
+) -> AssessmentSummary:
+    profile = profile or default_scoring_profile()
+    findings = ordered_findings(pack)
+    with span("map", records=len(findings)):
+        mapper = FindingMapper(pack, frameworks, rules, asset_weights, profile)
+        mapped = [mapper.map(finding) for finding in findings]
+
+    with span("score", records=len(mapped)):
+        accumulator = AssessmentAccumulator.for_targets(pack.targets)
+        for mf in mapped:
+            accumulator.add(mf, profile, scoring_mode)
+        return accumulator.summarize(
+            pack.targets,
+            mapped,
+            scoring_mode=scoring_mode,
+            profile=profile,
+            assessed_at=datetime.now(tz=UTC),
+            rollups=rollups,
+        )
+
+
+def ordered_findings(pack: FixturePack) -> list[Finding]:
+    # Penalties are summed target by target (in pack target order), in pack order within each
+    # target. Every accumulation, including a resumed checkpoint, walks this same sequence, so
+    # float sums match the original per-target scoring exactly.
+    position = {t.target_id: i for i, t in enumerate(pack.targets)}
+    return sorted(pack.findings, key=lambda f: position[f.target_id])
 
 
-@dataclass(frozen=True)
-class CoverageTable:
-    headers: list[str]
-    rows: list[list[str]]
+def _summary_order(mf: MappedFinding) -> tuple[str, str]:
+    return mf.finding.target_id, mf.finding.finding_id
 
-    def to_rows(self) -> list[list[str]]:
-        return self.rows
 
+class FindingMapper:
+    """Maps and risk-scores single findings against a pack's frameworks, rules and assets."""
 
-def assess_fixture_pack(pack: FixturePack) -> AssessmentSummary:
-    mapped: list[MappedFinding] = []
-    for finding in pack.findings:
+    def __init__(
+        self,
+        pack: FixturePack,
+        frameworks: Sequence[str] | None,
+        rules: CompiledRuleSet | None,
+        asset_weights: AssetWeights | None,
+        profile: CompiledScoringProfile,
+    ) -> None:
+        self._compiled = resolve_frameworks(frameworks)
+        self._rules = rules
+        self._assets = pack.asset_index
+        self._asset_weights = asset_weights
+        self._profile = profile
+
+    def map(self, finding: Finding) -> MappedFinding:
         nist, iso = map_finding(finding)
-        risk = risk_score_for_finding(finding)
-        domain = domain_for_category(finding.category)
-        mapped.append(
-            MappedFinding(
-                finding=finding,
-                nist=nist,
-                iso=iso,
-                risk_score=risk,
-                domain=domain,
-            )
+        return MappedFinding(
+            finding=finding,
+            nist=nist,
+            iso=iso,
+            controls=map_finding_controls(finding, self._compiled, self._rules),
+            risk_score=self._profile.risk(finding),
+            domain=domain_for_category(finding.category),
+            blast_radius=self._assets.blast_radius(finding, self._asset_weights),
+        )
+
+
+@dataclass
+class AssessmentAccumulator:
+    """Running penalty sums per target, target/domain and org domain.
+
+    The state is plain JSON-serializable data so long assessments can be checkpointed.
+    """
+
+    target_penalty: dict[str, float]
+    target_domain_penalty: dict[str, dict[str, float]]
+    target_findings: dict[str, int]
+    org_domain_penalty: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def for_targets(cls, targets: Iterable[Target]) -> AssessmentAccumulator:
+        ids = [t.target_id for t in targets]
+        return cls(
+            target_penalty=dict.fromkeys(ids, 0.0),
+            target_domain_penalty={tid: {} for tid in ids},
+            target_findings=dict.fromkeys(ids, 0),
         )
 
-    # Score per target
-    per_target_findings: dict[str, list[MappedFinding]] = defaultdict(list)
-    for mf in mapped:
-        per_target_findings[mf.finding.target_id].append(mf)
-
-    target_assessments: list[TargetAssessment] = []
-    org_domain_penalty: dict[str, float] = defaultdict(float)
-
-    for target in pack.targets:
-        t_findings = per_target_findings.get(target.target_id, [])
-        domain_penalty: dict[str, float] = defaultdict(float)
-        total_penalty = 0.0
-        for mf in t_findings:
-            # Penalty increases slightly with number of affected assets (synthetic blast radius).
-            penalty = mf.risk_score * (1.0 + 0.05 * max(0, len(mf.finding.affected_assets) - 1))
-            domain_penalty[mf.domain] += penalty
-            org_domain_penalty[mf.domain] += penalty
-            total_penalty += penalty
-
-        posture = _posture_score_from_penalty(total_penalty)
-        domain_maturity = _domain_maturity(domain_penalty)
-        target_assessments.append(
+    def add(
+        self, mf: MappedFinding, profile: CompiledScoringProfile, scoring_mode: ScoringMode
+    ) -> None:
+        target_id = mf.finding.target_id
+        penalty = finding_penalty(mf, profile)
+        domains = self.target_domain_penalty[target_id]
+        domains[mf.domain] = domains.get(mf.domain, 0.0) + penalty
+        self.target_penalty[target_id] += penalty
+        self.target_findings[target_id] += 1
+        if scoring_mode is ScoringMode.raw:
+            self.org_domain_penalty[mf.domain] = (
+                self.org_domain_penalty.get(mf.domain, 0.0) + penalty
+            )
+
+    def to_state(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> AssessmentAccumulator:
+        return cls(**state)
+
+    def summarize(
+        self,
+        targets: Iterable[Target],
+        mapped: list[MappedFinding],
+        *,
+        scoring_mode: ScoringMode,
+        profile: CompiledScoringProfile,
+        assessed_at: datetime,
+        rollups: Sequence[RollupSpec] = (),
+    ) -> AssessmentSummary:
+        """Build the summary; `mapped` must be in `ordered_findings` order.
+
+        The summary lists mapped findings by (target_id, finding_id).
+        """
+        norm = profile.posture_normalization
+        targets = list(targets)
+        target_assessments = [
             TargetAssessment(
                 target_id=target.target_id,
                 provider=target.provider,
                 environment=target.environment,
-                posture_score=posture,
-                domain_maturity=domain_maturity,
-                finding_count=len(t_findings),
+                posture_score=posture_score_from_penalty(
+                    self.target_penalty[target.target_id], norm
+                ),
+                domain_maturity=_domain_maturity(
+                    self.target_domain_penalty[target.target_id], norm
+                ),
+                finding_count=self.target_findings[target.target_id],
             )
+            for target in targets
+        ]
+
+        org_domain_penalty = dict(self.org_domain_penalty)
+        correlated: list[CorrelatedFinding] = []
+        if scoring_mode is ScoringMode.correlated:
+            # The same misconfiguration across many targets is charged to the org once, at the
+            # penalty of its worst instance; per-target scores still see every finding.
+            with span("correlate", records=len(mapped)):
+                clusters = correlate_findings(mapped)
+                for cluster in clusters.values():
+                    org_domain_penalty[cluster.canonical.domain] = org_domain_penalty.get(
+                        cluster.canonical.domain, 0.0
+                    ) + max(finding_penalty(m, profile) for m in cluster.members)
+                correlated = correlated_finding_models(clusters)
+
+        return AssessmentSummary(
+            assessed_at=assessed_at,
+            org=OrgAssessment(
+                posture_score=posture_score_from_penalty(sum(org_domain_penalty.values()), norm),
+                domain_maturity=_domain_maturity(org_domain_penalty, norm),
+            ),
+            targets=sorted(target_assessments, key=lambda x: x.target_id),
+            mapped_findings=sorted(mapped, key=_summary_order),
+            scoring_mode=scoring_mode,
+            scoring_profile=profile.digest,
+            correlated_findings=correlated,
+            rollups=self._rollups(rollups, targets, norm) if rollups else [],
         )
 
-    org_posture = _posture_score_from_penalty(sum(org_domain_penalty.values()))
-    org_domain_maturity = _domain_maturity(org_domain_penalty)
+    def _rollups(
+        self, specs: Sequence[RollupSpec], targets: list[Target], norm: float
+    ) -> list[Rollup]:
+        # Rollups sum per-target penalties, so in correlated mode their totals can exceed
+        # the org's deduplicated penalty.
+        with span("rollup", records=len(targets)):
+            leaves = (
+                (
+                    t,
+                    RollupAggregate.for_target(
+                        self.target_penalty[t.target_id],
+                        self.target_domain_penalty[t.target_id],
+                        self.target_findings[t.target_id],
+                        posture_score_from_penalty(self.target_penalty[t.target_id], norm),
+                    ),
+                )
+                for t in targets
+            )
+            return [
+                Rollup(
+                    name=spec.name,
+                    levels=list(spec.levels),
+                    groups=[_rollup_group(path, agg, norm) for path, agg in groups.items()],
+                )
+                for spec, groups in zip(specs, build_rollups(specs, leaves), strict=True)
+            ]
+
 
-    return AssessmentSummary(
-        assessed_at=datetime.now(tz=UTC),
-        org=OrgAssessment(posture_score=org_posture, domain_maturity=org_domain_maturity),
-        targets=sorted(target_assessments, key=lambda x: x.target_id),
-        mapped_findings=sorted(mapped, key=lambda x: (x.finding.target_id, x.finding.finding_id)),
+def _rollup_group(path: tuple[str, ...], agg: RollupAggregate, norm: float) -> RollupGroup:
+    return RollupGroup(
+        path=list(path),
+        posture_score=posture_score_from_penalty(agg.penalty, norm),
+        domain_maturity=_domain_maturity(agg.domain_penalty, norm),
+        penalty=agg.penalty,
+        domain_penalty=dict(sorted(agg.domain_penalty.items())),
+        finding_count=agg.finding_count,
+        target_count=agg.target_count,
+        posture_sum=agg.posture_sum,
+        min_target_posture=agg.min_target_posture,
     )
 
 
-def _posture_score_from_penalty(total_penalty: float) -> float:
+def finding_penalty(mf: MappedFinding, profile: CompiledScoringProfile) -> float:
+    """Posture penalty of one mapped finding under `profile`."""
+    # Penalty increases slightly with blast radius (affected assets, optionally weighted).
+    return mf.risk_score * profile.blast_multiplier(finding_blast_radius(mf))
+
+
+def finding_blast_radius(mf: MappedFinding) -> float:
+    """Affected-asset count of a mapped finding, label-weighted when assessed that way."""
+    # Summaries written before blast_radius existed fall back to the raw asset count.
+    if mf.blast_radius is not None:
+        return mf.blast_radius
+    return float(len(mf.finding.affected_assets))
+
+
+def posture_score_from_penalty(total_penalty: float, normalization: float = 450.0) -> float:
+    """Scale a summed penalty to a 0-100 posture score."""
     # Deterministic scaling chosen to keep scores in a realistic consulting range.
-    # Higher penalty => lower posture score.
-    normalization = 450.0
+    # Higher penalty => lower posture score. The normalization comes from the scoring profile.
     score = 100.0 - (min(total_penalty, normalization) / normalization) * 100.0
     return max(0.0, min(100.0, score))
 
 
-def _domain_maturity(domain_penalty: dict[str, float]) -> list[DomainMaturity]:
+def _domain_maturity(
+    domain_penalty: dict[str, float], normalization: float = 450.0
+) -> list[DomainMaturity]:
     result: list[DomainMaturity] = []
     for domain, penalty in sorted(domain_penalty.items()):
-        posture = _posture_score_from_penalty(penalty)
+        posture = posture_score_from_penalty(penalty, normalization)
         maturity = (posture / 100.0) * 5.0
         result.append(
             DomainMaturity(domain=domain, maturity_0_to_5=maturity, posture_0_to_100=posture)
@@ -103,19 +284,21 @@ def _domain_maturity(domain_penalty: dict[str, float]) -> list[DomainMaturity]:
     return result
 
 
-def compute_controls_coverage(mapped_findings: list[MappedFinding]) -> CoverageTable:
-    nist_counts: Counter[str] = Counter()
-    iso_counts: Counter[str] = Counter()
-    for mf in mapped_findings:
-        for n in mf.nist:
-            nist_counts[f"{n.function} | {n.category}"] += 1
-        for i in mf.iso:
-            iso_counts[f"{i.theme_id} | {i.theme_name}"] += 1
+def compute_controls_coverage(
+    mapped_findings: list[MappedFinding],
+    targets: Iterable[Target | TargetAssessment] = (),
+) -> CoverageTable:
+    return build_coverage_aggregator(mapped_findings, targets).to_table()
 
-    rows: list[list[str]] = []
-    for k, v in nist_counts.most_common():
-        rows.append(["NIST CSF", k, str(v)])
-    for k, v in iso_counts.most_common():
-        rows.append(["ISO 27001 Theme", k, str(v)])
 
-    return CoverageTable(headers=["framework", "control_theme", "finding_count"], rows=rows)
+def build_coverage_aggregator(
+    mapped_findings: Iterable[MappedFinding],
+    targets: Iterable[Target | TargetAssessment] = (),
+) -> CoverageAggregator:
+    with span("coverage") as s:
+        aggregator = CoverageAggregator()
+        aggregator.register_targets(targets)
+        if not isinstance(mapped_findings, list):
+            mapped_findings = list(mapped_findings)
+        s.records = len(mapped_findings)
+        return aggregator.add_all(mapped_findings)
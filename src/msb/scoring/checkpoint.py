@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from msb.assets import AssetWeights
+from msb.io.fixtures import FixturePack
+from msb.mappings import CompiledRuleSet
+from msb.models import AssessmentSummary, MappedFinding, ScoringMode
+from msb.scoring.assess import (
+    AssessmentAccumulator,
+    FindingMapper,
+    build_coverage_aggregator,
+    ordered_findings,
+)
+from msb.scoring.coverage import CoverageAggregator
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
+from msb.scoring.rollup import RollupSpec
+from msb.utils.instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "assess.checkpoint.json"
+MAPPED_FILE = "assess.mapped.jsonl"
+# 2: coverage counters are no longer checkpointed; coverage is built from the summary.
+_STATE_VERSION = 2
+
+
+def fingerprint_inputs(paths: Sequence[Path], **options: Any) -> str:
+    """Digest of the input files plus every option that affects scores.
+
+    A checkpoint is only resumed when this matches, so a changed pack or flag starts fresh.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(str(path.name).encode("utf-8") + b"\0")
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    h.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def assess_with_checkpoints(
+    pack: FixturePack,
+    checkpoint_dir: Path,
+    *,
+    fingerprint: str,
+    every: int = 10_000,
+    frameworks: Sequence[str] | None = None,
+    rules: CompiledRuleSet | None = None,
+    asset_weights: AssetWeights | None = None,
+    scoring_mode: ScoringMode = ScoringMode.raw,
+    profile: CompiledScoringProfile | None = None,
+    rollups: Sequence[RollupSpec] = (),
+) -> tuple[AssessmentSummary, CoverageAggregator]:
+    """`assess_fixture_pack` plus coverage, checkpointed every `every` findings.
+
+    After each chunk the mapped findings are appended to a JSONL log and the accumulators,
+    offset and log length are written atomically. Coverage is counted once at the end from the
+    summary's findings, so its row order matches an uncheckpointed run. A rerun with the same
+    fingerprint resumes after the last checkpoint and yields the same summary (including
+    `assessed_at`) as an uninterrupted run. Checkpoint files are removed on success.
+    """
+    if every < 1:
+        raise ValueError("every must be >= 1")
+    profile = profile or default_scoring_profile()
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    state_path = checkpoint_dir / STATE_FILE
+    mapped_path = checkpoint_dir / MAPPED_FILE
+
+    state = _load_state(state_path, fingerprint)
+    if state is None:
+        offset = 0
+        log_bytes = 0
+        assessed_at = datetime.now(tz=UTC)
+        accumulator = AssessmentAccumulator.for_targets(pack.targets)
+    else:
+        offset = int(state["offset"])
+        log_bytes = int(state["mapped_bytes"])
+        assessed_at = datetime.fromisoformat(state["assessed_at"])
+        accumulator = AssessmentAccumulator.from_state(state["accumulator"])
+        logger.info("Resuming assessment at finding %d from %s", offset, state_path)
+
+    findings = ordered_findings(pack)
+    mapper = FindingMapper(pack, frameworks, rules, asset_weights, profile)
+    with mapped_path.open("ab") as log:
+        # Anything past the last checkpoint was written by the interrupted run; drop it.
+        log.truncate(log_bytes)
+        log.seek(log_bytes)
+        for start in range(offset, len(findings), every):
+            chunk = findings[start : start + every]
+            with span("map", records=len(chunk), offset=start):
+                mapped = [mapper.map(f) for f in chunk]
+            with span("score", records=len(chunk), offset=start):
+                for mf in mapped:
+                    accumulator.add(mf, profile, scoring_mode)
+            with span("checkpoint", records=len(chunk), offset=start):
+                log.writelines(mf.model_dump_json().encode("utf-8") + b"\n" for mf in mapped)
+                log.flush()
+                os.fsync(log.fileno())
+                _write_state(
+                    state_path,
+                    {
+                        "version": _STATE_VERSION,
+                        "fingerprint": fingerprint,
+                        "offset": start + len(chunk),
+                        "mapped_bytes": log.tell(),
+                        "assessed_at": assessed_at.isoformat(),
+                        "accumulator": accumulator.to_state(),
+                    },
+                )
+
+    with span("load", path=str(mapped_path)), mapped_path.open("rb") as log:
+        all_mapped = [MappedFinding.model_validate_json(line) for line in log]
+    with span("score", records=len(all_mapped)):
+        summary = accumulator.summarize(
+            pack.targets,
+            all_mapped,
+            scoring_mode=scoring_mode,
+            profile=profile,
+            assessed_at=assessed_at,
+            rollups=rollups,
+        )
+
+    state_path.unlink(missing_ok=True)
+    mapped_path.unlink(missing_ok=True)
+    coverage = build_coverage_aggregator(summary.mapped_findings, summary.targets)
+    return summary, coverage
+
+
+def _load_state(path: Path, fingerprint: str) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    state: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    if state.get("version") != _STATE_VERSION or state.get("fingerprint") != fingerprint:
+        logger.warning("Ignoring checkpoint %s: it belongs to different inputs or options", path)
+        return None
+    return state
+
+
+def _write_state(path: Path, state: dict[str, Any]) -> None:
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
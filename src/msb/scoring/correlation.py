@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from msb.models import CorrelatedFinding, Finding, MappedFinding
+
+_WS = re.compile(r"\s+")
+# Instance-specific noise (account ids, counts, percentages) that should not split clusters.
+_DIGITS = re.compile(r"\d+")
+
+
+def _normalise(text: str) -> str:
+    return _WS.sub(" ", _DIGITS.sub("#", text.strip().lower()))
+
+
+def finding_signature(finding: Finding) -> str:
+    """Stable hash of (category, normalised title, normalised evidence signal)."""
+    signal = finding.evidence.get("signal", "")
+    key = "\x1f".join((finding.category.value, _normalise(finding.title), _normalise(signal)))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class FindingCluster:
+    signature: str
+    canonical: MappedFinding
+    members: list[MappedFinding] = field(default_factory=list)
+
+    def to_model(self) -> CorrelatedFinding:
+        return CorrelatedFinding(
+            signature=self.signature,
+            canonical_finding_id=self.canonical.finding.finding_id,
+            canonical_target_id=self.canonical.finding.target_id,
+            category=self.canonical.finding.category,
+            title=self.canonical.finding.title,
+            target_ids=sorted({m.finding.target_id for m in self.members}),
+            finding_ids=[m.finding.finding_id for m in self.members],
+        )
+
+
+def correlate_findings(mapped_findings: Iterable[MappedFinding]) -> dict[str, FindingCluster]:
+    """Cluster findings by signature in one hashed pass; the highest-risk member is canonical.
+
+    Clusters come back keyed by signature in first-seen order.
+    """
+    clusters: dict[str, FindingCluster] = {}
+    for mf in mapped_findings:
+        sig = finding_signature(mf.finding)
+        cluster = clusters.get(sig)
+        if cluster is None:
+            cluster = clusters[sig] = FindingCluster(signature=sig, canonical=mf)
+        elif mf.risk_score > cluster.canonical.risk_score:
+            cluster.canonical = mf
+        cluster.members.append(mf)
+    return clusters
+
+
+def correlated_finding_models(clusters: dict[str, FindingCluster]) -> list[CorrelatedFinding]:
+    ordered = sorted(clusters.values(), key=lambda c: (-len(c.members), c.signature))
+    return [c.to_model() for c in ordered]
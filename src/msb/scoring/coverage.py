@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from msb.mappings import framework_label
+from msb.models import MappedFinding, Target, TargetAssessment
+
+# Breakdown dimensions computed alongside org-wide counts, in pivot column order.
+DIMENSIONS = ("provider", "environment", "target")
+
+_UNKNOWN = "unknown"
+
+ControlKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class CoverageTable:
+    headers: list[str]
+    rows: list[list[str]]
+
+    def to_rows(self) -> list[list[str]]:
+        return self.rows
+
+
+@dataclass
+class ControlInterner:
+    """Maps (framework, control id, control name) keys to dense integer codes."""
+
+    _codes: dict[ControlKey, int] = field(default_factory=dict)
+    _keys: list[ControlKey] = field(default_factory=list)
+
+    def intern(self, key: ControlKey) -> int:
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self._keys)
+            self._codes[key] = code
+            self._keys.append(key)
+        return code
+
+    def key(self, code: int) -> ControlKey:
+        return self._keys[code]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+@dataclass
+class CoverageAggregator:
+    """Mergeable control coverage counts with per-provider/environment/target breakdowns.
+
+    Controls are interned once, so the per-finding work is a handful of integer counter
+    increments. Aggregates built on separate shards can be combined with `merge`; when
+    shards were processed in order the merged result is identical to a single pass.
+    """
+
+    interner: ControlInterner = field(default_factory=ControlInterner)
+    totals: Counter[int] = field(default_factory=Counter)
+    breakdown: dict[tuple[str, str], Counter[int]] = field(default_factory=dict)
+    _target_dims: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    def register_targets(self, targets: Iterable[Target | TargetAssessment]) -> None:
+        for t in targets:
+            self._target_dims[t.target_id] = (t.provider.value, t.environment)
+
+    def add(self, mf: MappedFinding) -> None:
+        if mf.controls:
+            codes = [
+                self.interner.intern((framework_label(c.framework), c.control_id, c.control_name))
+                for c in mf.controls
+            ]
+        else:
+            # Summaries written before multi-framework mapping only carry NIST/ISO lists.
+            codes = [self.interner.intern(("NIST CSF", n.function, n.category)) for n in mf.nist]
+            codes.extend(
+                self.interner.intern(("ISO 27001 Theme", i.theme_id, i.theme_name)) for i in mf.iso
+            )
+
+        target_id = mf.finding.target_id
+        provider, environment = self._target_dims.get(target_id, (_UNKNOWN, _UNKNOWN))
+        buckets = [
+            self._bucket("provider", provider),
+            self._bucket("environment", environment),
+            self._bucket("target", target_id),
+        ]
+        for code in codes:
+            self.totals[code] += 1
+            for bucket in buckets:
+                bucket[code] += 1
+
+    def add_all(self, mapped_findings: Iterable[MappedFinding]) -> CoverageAggregator:
+        for mf in mapped_findings:
+            self.add(mf)
+        return self
+
+    def merge(self, other: CoverageAggregator) -> CoverageAggregator:
+        if other.interner is self.interner:
+            remap = list(range(len(self.interner)))
+        else:
+            remap = [
+                self.interner.intern(other.interner.key(c)) for c in range(len(other.interner))
+            ]
+
+        for code, n in other.totals.items():
+            self.totals[remap[code]] += n
+        for (dimension, value), counts in other.breakdown.items():
+            bucket = self._bucket(dimension, value)
+            for code, n in counts.items():
+                bucket[remap[code]] += n
+        for target_id, dims in other._target_dims.items():
+            self._target_dims.setdefault(target_id, dims)
+        return self
+
+    def to_table(self) -> CoverageTable:
+        rows: list[list[str]] = []
+        for code in self._ordered_codes():
+            framework, control_id, name = self.interner.key(code)
+            rows.append([framework, f"{control_id} | {name}", str(self.totals[code])])
+        return CoverageTable(headers=["framework", "control_theme", "finding_count"], rows=rows)
+
+    def to_pivot_table(self) -> CoverageTable:
+        columns = [
+            (dimension, value)
+            for dimension in DIMENSIONS
+            for value in sorted(v for d, v in self.breakdown if d == dimension)
+        ]
+        headers = ["framework", "control_theme", "finding_count"]
+        headers.extend(f"{dimension}:{value}" for dimension, value in columns)
+
+        rows: list[list[str]] = []
+        for code in self._ordered_codes():
+            framework, control_id, name = self.interner.key(code)
+            row = [framework, f"{control_id} | {name}", str(self.totals[code])]
+            row.extend(str(self.breakdown[col][code]) for col in columns)
+            rows.append(row)
+        return CoverageTable(headers=headers, rows=rows)
+
+    def _bucket(self, dimension: str, value: str) -> Counter[int]:
+        bucket = self.breakdown.get((dimension, value))
+        if bucket is None:
+            bucket = self.breakdown[(dimension, value)] = Counter()
+        return bucket
+
+    def _ordered_codes(self) -> list[int]:
+        # Frameworks in first-seen order; within a framework by count desc, then first-seen.
+        frameworks: dict[str, list[int]] = {}
+        for code in range(len(self.interner)):
+            if self.totals[code]:
+                frameworks.setdefault(self.interner.key(code)[0], []).append(code)
+        ordered: list[int] = []
+        for codes in frameworks.values():
+            ordered.extend(sorted(codes, key=lambda c: -self.totals[c]))
+        return ordered
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field, model_validator
+
+from msb.models import Effort, Finding, FindingCategory, Rating, Severity
+
+NonNegative = Annotated[float, Field(ge=0.0)]
+
+PHASES = (
+    "Phase 0 (Immediate)",
+    "Phase 1 (0-30 days)",
+    "Phase 2 (30-90 days)",
+    "Phase 3 (90-180 days)",
+)
+
+# Ordinals are per enum: StrEnum members hash like their values, so Severity.low and
+# Rating.low would collide in a shared dict.
+_SEVERITY_ORD = {m: i for i, m in enumerate(Severity)}
+_RATING_ORD = {m: i for i, m in enumerate(Rating)}
+_CATEGORY_ORD = {m: i for i, m in enumerate(FindingCategory)}
+_EFFORT_ORD = {m: i for i, m in enumerate(Effort)}
+
+
+class PhaseThresholds(BaseModel):
+    immediate_min_risk: NonNegative = 30.0
+    immediate_max_effort: int = 2
+    phase1_min_risk: NonNegative = 25.0
+    phase2_min_risk: NonNegative = 15.0
+
+    @model_validator(mode="after")
+    def _ordered(self) -> PhaseThresholds:
+        if not self.immediate_min_risk >= self.phase1_min_risk >= self.phase2_min_risk:
+            raise ValueError("Phase thresholds must satisfy immediate >= phase1 >= phase2")
+        return self
+
+
+class ScoringProfile(BaseModel):
+    """Every tunable weight and threshold of the scoring and prioritization model."""
+
+    severity_weights: dict[Severity, NonNegative] = Field(
+        default_factory=lambda: {
+            Severity.low: 1.0,
+            Severity.medium: 3.0,
+            Severity.high: 6.0,
+            Severity.critical: 10.0,
+        }
+    )
+    likelihood_weights: dict[Rating, NonNegative] = Field(
+        default_factory=lambda: {Rating.low: 1.0, Rating.medium: 2.0, Rating.high: 3.0}
+    )
+    impact_weights: dict[Rating, NonNegative] = Field(
+        default_factory=lambda: {Rating.low: 1.0, Rating.medium: 2.0, Rating.high: 3.0}
+    )
+    category_weights: dict[FindingCategory, NonNegative] = Field(
+        default_factory=lambda: {
+            FindingCategory.iam: 1.25,
+            FindingCategory.logging: 1.10,
+            FindingCategory.network: 1.20,
+            FindingCategory.governance: 1.00,
+            FindingCategory.asset_inventory: 0.90,
+            FindingCategory.data_protection: 1.15,
+        }
+    )
+    effort_weights: dict[Effort, Annotated[int, Field(ge=1)]] = Field(
+        default_factory=lambda: {Effort.small: 1, Effort.medium: 3, Effort.large: 5}
+    )
+    blast_radius_factor: NonNegative = 0.05
+    posture_normalization: Annotated[float, Field(gt=0.0)] = 450.0
+    dependency_factor: Annotated[float, Field(gt=0.0, le=1.0)] = 0.92
+    quick_win_max_effort: int = 2
+    quick_win_min_risk: NonNegative = 20.0
+    phases: PhaseThresholds = Field(default_factory=PhaseThresholds)
+
+    @model_validator(mode="after")
+    def _complete(self) -> ScoringProfile:
+        for name, enum in (
+            ("severity_weights", Severity),
+            ("likelihood_weights", Rating),
+            ("impact_weights", Rating),
+            ("category_weights", FindingCategory),
+            ("effort_weights", Effort),
+        ):
+            missing = [m.value for m in enum if m not in getattr(self, name)]
+            if missing:
+                raise ValueError(f"Scoring profile {name} is missing: {missing}")
+        return self
+
+    def digest(self) -> str:
+        canonical = json.dumps(self.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledScoringProfile:
+    """A validated profile flattened into ordinal-indexed tables for the per-finding hot path."""
+
+    profile: ScoringProfile
+    digest: str
+    # severity x likelihood x impact x category, row-major.
+    risk_table: tuple[float, ...]
+    effort_table: tuple[int, ...]
+
+    @property
+    def posture_normalization(self) -> float:
+        return self.profile.posture_normalization
+
+    def risk(self, finding: Finding) -> float:
+        idx = _SEVERITY_ORD[finding.severity]
+        idx = idx * len(_RATING_ORD) + _RATING_ORD[finding.likelihood]
+        idx = idx * len(_RATING_ORD) + _RATING_ORD[finding.impact]
+        idx = idx * len(_CATEGORY_ORD) + _CATEGORY_ORD[finding.category]
+        return self.risk_table[idx]
+
+    def effort(self, effort: Effort) -> int:
+        return self.effort_table[_EFFORT_ORD[effort]]
+
+    def blast_multiplier(self, blast_radius: float) -> float:
+        return 1.0 + self.profile.blast_radius_factor * max(0.0, blast_radius - 1.0)
+
+    def phase_for(self, *, risk: float, effort_num: int) -> str:
+        p = self.profile.phases
+        if risk >= p.immediate_min_risk and effort_num <= p.immediate_max_effort:
+            return PHASES[0]
+        if risk >= p.phase1_min_risk:
+            return PHASES[1]
+        if risk >= p.phase2_min_risk:
+            return PHASES[2]
+        return PHASES[3]
+
+    def is_quick_win(self, *, risk: float, effort_num: int) -> bool:
+        p = self.profile
+        return effort_num <= p.quick_win_max_effort and risk >= p.quick_win_min_risk
+
+
+def compile_scoring_profile(profile: ScoringProfile) -> CompiledScoringProfile:
+    table: list[float] = []
+    for severity in Severity:
+        for likelihood in Rating:
+            for impact in Rating:
+                for category in FindingCategory:
+                    table.append(
+                        profile.severity_weights[severity]
+                        * profile.likelihood_weights[likelihood]
+                        * profile.impact_weights[impact]
+                        * profile.category_weights[category]
+                    )
+    return CompiledScoringProfile(
+        profile=profile,
+        digest=profile.digest(),
+        risk_table=tuple(table),
+        effort_table=tuple(profile.effort_weights[e] for e in Effort),
+    )
+
+
+def load_scoring_profile(path: Path) -> CompiledScoringProfile:
+    """Validate a profile JSON file; omitted keys keep their default values."""
+    obj: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return compile_scoring_profile(ScoringProfile.model_validate(obj))
+
+
+@cache
+def default_scoring_profile() -> CompiledScoringProfile:
+    return compile_scoring_profile(ScoringProfile())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from msb.models import Finding, FindingCategory, Rating, Severity
+from msb.models import Finding, FindingCategory
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
 
 
 def domain_for_category(category: FindingCategory) -> str:
@@ -14,27 +15,8 @@ def domain_for_category(category: FindingCategory) -> str:
     }[category]
 
 
-def risk_score_for_finding(finding: Finding) -> float:
-    severity_weight = {
-        Severity.low: 1.0,
-        Severity.medium: 3.0,
-        Severity.high: 6.0,
-        Severity.critical: 10.0,
-    }[finding.severity]
-    likelihood_weight = _rating_weight(finding.likelihood)
-    impact_weight = _rating_weight(finding.impact)
-
-    category_weight = {
-        FindingCategory.iam: 1.25,
-        FindingCategory.logging: 1.10,
-        FindingCategory.network: 1.20,
-        FindingCategory.governance: 1.00,
-        FindingCategory.asset_inventory: 0.90,
-        FindingCategory.data_protection: 1.15,
-    }[finding.category]
-
-    return severity_weight * likelihood_weight * impact_weight * category_weight
-
-
-def _rating_weight(rating: Rating) -> float:
-    return {Rating.low: 1.0, Rating.medium: 2.0, Rating.high: 3.0}[rating]
+def risk_score_for_finding(
+    finding: Finding, profile: CompiledScoringProfile | None = None
+) -> float:
+    # severity x likelihood x impact x category weights, precomputed in the profile's table.
+    return (profile or default_scoring_profile()).risk(finding)
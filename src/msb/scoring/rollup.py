@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from msb.models import RollupGroup, Target
+
+DIMENSIONS = ("provider", "environment", "region", "owner")
+LABEL_PREFIX = "label."
+# Group key for targets that lack a label used by a rollup level.
+UNLABELLED = "(none)"
+
+RollupPath = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RollupSpec:
+    """A group-by hierarchy such as `label.business_unit/label.account` (parent first).
+
+    Levels are target attributes (`provider`, `environment`, `region`, `owner`) or target
+    labels (`label.<key>`).
+    """
+
+    levels: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return "/".join(self.levels)
+
+    def path_for(self, target: Target) -> RollupPath:
+        return tuple(_level_value(target, level) for level in self.levels)
+
+
+def parse_rollup(text: str) -> RollupSpec:
+    levels = tuple(part.strip() for part in text.split("/"))
+    for level in levels:
+        is_label = level.startswith(LABEL_PREFIX) and len(level) > len(LABEL_PREFIX)
+        if level not in DIMENSIONS and not is_label:
+            raise ValueError(
+                f"Unknown rollup level {level!r} in {text!r}; "
+                f"use {', '.join(DIMENSIONS)} or {LABEL_PREFIX}<key>"
+            )
+    if len(set(levels)) != len(levels):
+        raise ValueError(f"Rollup {text!r} repeats a level")
+    return RollupSpec(levels)
+
+
+def _level_value(target: Target, level: str) -> str:
+    if level.startswith(LABEL_PREFIX):
+        return target.labels.get(level.removeprefix(LABEL_PREFIX), UNLABELLED)
+    value = getattr(target, level)
+    return str(getattr(value, "value", value))
+
+
+@dataclass
+class RollupAggregate:
+    """Additive per-group totals; merging two groups' aggregates gives their union's."""
+
+    penalty: float = 0.0
+    domain_penalty: dict[str, float] = field(default_factory=dict)
+    finding_count: int = 0
+    target_count: int = 0
+    posture_sum: float = 0.0
+    min_target_posture: float = 100.0
+
+    @classmethod
+    def for_target(
+        cls, penalty: float, domain_penalty: dict[str, float], finding_count: int, posture: float
+    ) -> RollupAggregate:
+        return cls(
+            penalty=penalty,
+            domain_penalty=dict(domain_penalty),
+            finding_count=finding_count,
+            target_count=1,
+            posture_sum=posture,
+            min_target_posture=posture,
+        )
+
+    @classmethod
+    def from_group(cls, group: RollupGroup) -> RollupAggregate:
+        return cls(
+            penalty=group.penalty,
+            domain_penalty=dict(group.domain_penalty),
+            finding_count=group.finding_count,
+            target_count=group.target_count,
+            posture_sum=group.posture_sum,
+            min_target_posture=group.min_target_posture,
+        )
+
+    def merge(self, other: RollupAggregate) -> RollupAggregate:
+        self.penalty += other.penalty
+        for domain, penalty in other.domain_penalty.items():
+            self.domain_penalty[domain] = self.domain_penalty.get(domain, 0.0) + penalty
+        self.finding_count += other.finding_count
+        self.target_count += other.target_count
+        self.posture_sum += other.posture_sum
+        self.min_target_posture = min(self.min_target_posture, other.min_target_posture)
+        return self
+
+
+def build_rollups(
+    specs: Sequence[RollupSpec], leaves: Iterable[tuple[Target, RollupAggregate]]
+) -> list[dict[RollupPath, RollupAggregate]]:
+    """Aggregate every level of every spec in one pass over per-target aggregates.
+
+    Targets are folded into the deepest level of each spec; each parent is then the merge of
+    its children. Returns one `{path: aggregate}` mapping per spec, sorted by path.
+    """
+    deepest: list[dict[RollupPath, RollupAggregate]] = [{} for _ in specs]
+    for target, leaf in leaves:
+        for spec, groups in zip(specs, deepest, strict=True):
+            path = spec.path_for(target)
+            groups.setdefault(path, RollupAggregate()).merge(leaf)
+
+    out: list[dict[RollupPath, RollupAggregate]] = []
+    for spec, groups in zip(specs, deepest, strict=True):
+        levels = [dict(sorted(groups.items()))]
+        for depth in range(len(spec.levels) - 1, 0, -1):
+            parents: dict[RollupPath, RollupAggregate] = {}
+            for path, agg in levels[-1].items():
+                parents.setdefault(path[:depth], RollupAggregate()).merge(agg)
+            levels.append(parents)
+        out.append(dict(sorted(item for level in levels for item in level.items())))
+    return out
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from msb.models import AssessmentSummary, ScoringMode
+from msb.scoring.assess import finding_blast_radius, posture_score_from_penalty
+from msb.scoring.profile import PHASES, CompiledScoringProfile, default_scoring_profile
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    org_posture: float
+    domain_posture: dict[str, float]
+    # Only targets whose posture moved; the rest keep their baseline score.
+    target_posture: dict[str, float]
+    findings_changed: int
+
+
+class PostureSimulator:
+    """Projected posture after removing findings or completing remediation actions.
+
+    Each finding's penalty contribution is precomputed once, so a scenario costs
+    O(findings it touches) rather than a full re-assessment. Completing an action removes the
+    share of its finding's penalty given by the action's expected impact; completing every
+    action of a finding removes it entirely.
+    """
+
+    def __init__(
+        self, summary: AssessmentSummary, profile: CompiledScoringProfile | None = None
+    ) -> None:
+        profile = profile or default_scoring_profile()
+        if summary.scoring_mode is not ScoringMode.raw:
+            raise ValueError("Simulation requires a summary assessed in raw scoring mode")
+        if summary.scoring_profile is not None and summary.scoring_profile != profile.digest:
+            raise ValueError(
+                f"Summary was scored with profile {summary.scoring_profile}, not {profile.digest}"
+            )
+
+        self._normalization = profile.posture_normalization
+        self._target_ids = [t.target_id for t in summary.targets]
+        target_idx = {tid: i for i, tid in enumerate(self._target_ids)}
+        self._domains: list[str] = []
+        domain_idx: dict[str, int] = {}
+
+        self._finding_idx: dict[str, int] = {}
+        self._penalty: list[float] = []
+        self._target_of: list[int] = []
+        self._domain_of: list[int] = []
+        self._action: dict[str, tuple[int, float]] = {}
+        self._phase_items: dict[str, list[str]] = {p: [] for p in PHASES}
+        self._target_penalty = [0.0] * len(self._target_ids)
+        self._domain_penalty: list[float] = []
+
+        for mf in summary.mapped_findings:
+            f = mf.finding
+            if f.finding_id in self._finding_idx:
+                raise ValueError(f"Duplicate finding_id in summary: {f.finding_id}")
+            if mf.domain not in domain_idx:
+                domain_idx[mf.domain] = len(self._domains)
+                self._domains.append(mf.domain)
+                self._domain_penalty.append(0.0)
+
+            i = len(self._penalty)
+            blast = finding_blast_radius(mf)
+            penalty = mf.risk_score * profile.blast_multiplier(blast)
+            self._finding_idx[f.finding_id] = i
+            self._penalty.append(penalty)
+            self._target_of.append(target_idx[f.target_id])
+            self._domain_of.append(domain_idx[mf.domain])
+            self._target_penalty[target_idx[f.target_id]] += penalty
+            self._domain_penalty[domain_idx[mf.domain]] += penalty
+
+            # Same risk and phase rules as the planner, so phases line up with the backlog.
+            risk = mf.risk_score * profile.blast_multiplier(max(1.0, blast))
+            total_impact = sum(a.expected_impact for a in f.recommended_actions)
+            for action in f.recommended_actions:
+                item_id = f"{f.finding_id}:{action.action_id}"
+                self._action[item_id] = (i, action.expected_impact / total_impact)
+                phase = profile.phase_for(risk=risk, effort_num=profile.effort(action.effort))
+                self._phase_items[phase].append(item_id)
+
+        self._org_penalty = sum(self._domain_penalty)
+
+    def items_in_phases(self, phases: Iterable[str]) -> list[str]:
+        items: list[str] = []
+        for phase in phases:
+            if phase not in self._phase_items:
+                raise ValueError(f"Unknown phase: {phase!r} (expected one of {list(PHASES)})")
+            items.extend(self._phase_items[phase])
+        return items
+
+    def baseline(self) -> SimulationResult:
+        return self.simulate()
+
+    def simulate(
+        self, *, remove: Iterable[str] = (), complete: Iterable[str] = ()
+    ) -> SimulationResult:
+        """Project posture with `remove` findings resolved and `complete` items done.
+
+        Backlog items are identified as `finding_id:action_id`, as in the backlog CSV. An item
+        listed more than once (e.g. explicitly and through its phase) counts once.
+        """
+        reduction: dict[int, float] = {}
+        for finding_id in remove:
+            idx = self._finding_idx.get(finding_id)
+            if idx is None:
+                raise ValueError(f"Unknown finding_id: {finding_id}")
+            reduction[idx] = 1.0
+        for item_id in dict.fromkeys(complete):
+            entry = self._action.get(item_id)
+            if entry is None:
+                raise ValueError(f"Unknown backlog item: {item_id}")
+            idx, share = entry
+            reduction[idx] = min(1.0, reduction.get(idx, 0.0) + share)
+
+        target_delta: dict[int, float] = {}
+        domain_delta: dict[int, float] = {}
+        for idx, fraction in reduction.items():
+            removed = self._penalty[idx] * fraction
+            t = self._target_of[idx]
+            d = self._domain_of[idx]
+            target_delta[t] = target_delta.get(t, 0.0) + removed
+            domain_delta[d] = domain_delta.get(d, 0.0) + removed
+
+        norm = self._normalization
+        return SimulationResult(
+            org_posture=posture_score_from_penalty(
+                max(0.0, self._org_penalty - sum(domain_delta.values())), norm
+            ),
+            domain_posture={
+                domain: posture_score_from_penalty(
+                    max(0.0, self._domain_penalty[d] - domain_delta.get(d, 0.0)), norm
+                )
+                for d, domain in enumerate(self._domains)
+            },
+            target_posture={
+                self._target_ids[t]: posture_score_from_penalty(
+                    max(0.0, self._target_penalty[t] - delta), norm
+                )
+                for t, delta in target_delta.items()
+            },
+            findings_changed=len(reduction),
+        )
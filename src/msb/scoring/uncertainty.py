@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from msb.models import AssessmentSummary, PostureBand, PostureUncertainty, Rating, ScoringMode
+from msb.scoring.assess import finding_blast_radius
+from msb.scoring.profile import CompiledScoringProfile, default_scoring_profile
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    FloatArray = npt.NDArray[np.float64]
+
+_RATINGS = list(Rating)
+_RATING_ORD = {r: i for i, r in enumerate(_RATINGS)}
+# Width of the outermost ratings' distributions, relative to their weight.
+_END_SPREAD = 0.25
+# Upper bound on draws x groups evaluated at once, to cap memory on large estates.
+_CELLS_PER_CHUNK = 4_000_000
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise RuntimeError(
+            "Uncertainty estimation needs numpy: pip install 'multicloud-security-baseline[uncertainty]'"
+        ) from exc
+    return numpy
+
+
+def rating_bounds(weights: dict[Rating, float]) -> list[tuple[float, float, float]]:
+    """(low, mode, high) of the triangular distribution for each rating's weight.
+
+    A rating is treated as covering the range halfway to its neighbours' weights; the lowest
+    and highest ratings extend ±25% beyond their own weight.
+    """
+    values = [weights[r] for r in _RATINGS]
+    bounds: list[tuple[float, float, float]] = []
+    for k, mode in enumerate(values):
+        low = (values[k - 1] + mode) / 2 if k > 0 else mode * (1 - _END_SPREAD)
+        high = (values[k + 1] + mode) / 2 if k + 1 < len(values) else mode * (1 + _END_SPREAD)
+        bounds.append((min(low, mode), mode, max(high, mode)))
+    return bounds
+
+
+def _sample_triangular(
+    rng: Any, bounds: list[tuple[float, float, float]], draws: int
+) -> FloatArray:
+    # Inverse-CDF sampling; unlike Generator.triangular it tolerates zero-width ranges.
+    np = _numpy()
+    a, c, b = (np.array(col, dtype=np.float64) for col in zip(*bounds, strict=True))
+    u = rng.random((draws, len(bounds)))
+    width = b - a
+    safe = np.where(width > 0, width, 1.0)
+    split = np.where(width > 0, (c - a) / safe, 0.0)
+    left = a + np.sqrt(u * width * (c - a))
+    right = b - np.sqrt((1 - u) * width * (b - c))
+    return np.where(u < split, left, right)  # type: ignore[no-any-return]
+
+
+def estimate_posture_uncertainty(
+    summary: AssessmentSummary,
+    profile: CompiledScoringProfile | None = None,
+    *,
+    draws: int = 2000,
+    confidence: float = 0.9,
+    seed: int = 0,
+) -> PostureUncertainty:
+    """Monte Carlo posture bands from uncertain likelihood/impact rating weights.
+
+    Each draw samples one weight per rating (shared by every finding with that rating), so the
+    bands reflect calibration uncertainty in what "medium" means. Findings are reduced to sums
+    per (likelihood, impact) combination and group, which turns every draw into a
+    (draws x 9) @ (9 x groups) matrix product instead of a loop over findings.
+    """
+    np = _numpy()
+    profile = profile or default_scoring_profile()
+    if summary.scoring_mode is not ScoringMode.raw:
+        raise ValueError("Uncertainty bands require a summary assessed in raw scoring mode")
+    if draws < 1:
+        raise ValueError("draws must be >= 1")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+
+    weights = profile.profile
+    target_ids = [t.target_id for t in summary.targets]
+    target_idx = {tid: i for i, tid in enumerate(target_ids)}
+    domains = sorted({mf.domain for mf in summary.mapped_findings})
+    domain_idx = {d: i for i, d in enumerate(domains)}
+    n_combos = len(_RATINGS) ** 2
+
+    n = len(summary.mapped_findings)
+    base = np.empty(n, dtype=np.float64)
+    combo = np.empty(n, dtype=np.int64)
+    target_of = np.empty(n, dtype=np.int64)
+    domain_of = np.empty(n, dtype=np.int64)
+    for i, mf in enumerate(summary.mapped_findings):
+        f = mf.finding
+        # Everything in the penalty except the likelihood and impact weights.
+        base[i] = (
+            weights.severity_weights[f.severity]
+            * weights.category_weights[f.category]
+            * profile.blast_multiplier(finding_blast_radius(mf))
+        )
+        combo[i] = _RATING_ORD[f.likelihood] * len(_RATINGS) + _RATING_ORD[f.impact]
+        target_of[i] = target_idx[f.target_id]
+        domain_of[i] = domain_idx[mf.domain]
+
+    rng = np.random.default_rng(seed)
+    likelihood = _sample_triangular(rng, rating_bounds(weights.likelihood_weights), draws)
+    impact = _sample_triangular(rng, rating_bounds(weights.impact_weights), draws)
+    multipliers = (likelihood[:, :, None] * impact[:, None, :]).reshape(draws, n_combos)
+
+    norm = profile.posture_normalization
+    tail = (1.0 - confidence) / 2.0
+
+    def _bands(group_of: Any, groups: int) -> list[PostureBand]:
+        sums = np.bincount(combo * groups + group_of, weights=base, minlength=n_combos * groups)
+        sums = sums.reshape(n_combos, groups)
+        out: list[PostureBand] = []
+        step = max(1, _CELLS_PER_CHUNK // draws)
+        for start in range(0, groups, step):
+            penalty = multipliers @ sums[:, start : start + step]
+            posture = np.clip(100.0 - np.minimum(penalty, norm) / norm * 100.0, 0.0, 100.0)
+            lower, median, upper = np.quantile(posture, [tail, 0.5, 1.0 - tail], axis=0)
+            mean = posture.mean(axis=0)
+            out.extend(
+                PostureBand(
+                    mean=float(mean[j]),
+                    median=float(median[j]),
+                    lower=float(lower[j]),
+                    upper=float(upper[j]),
+                )
+                for j in range(penalty.shape[1])
+            )
+        return out
+
+    org = _bands(np.zeros(n, dtype=np.int64), 1)[0]
+    return PostureUncertainty(
+        draws=draws,
+        confidence=confidence,
+        seed=seed,
+        org=org,
+        domains=dict(zip(domains, _bands(domain_of, len(domains)), strict=True)),
+        targets=dict(zip(target_ids, _bands(target_of, len(target_ids)), strict=True)),
+    )
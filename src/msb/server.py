@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import json
+import logging
+import socketserver
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any
+
+from msb.compare import compare_summaries
+from msb.io.fixtures import FixturePack, load_fixture_pack, validate_fixture_objects
+from msb.mappings import default_rule_set, resolve_frameworks
+from msb.models import AssessmentSummary
+from msb.prioritization import build_backlog_and_roadmap
+from msb.reporting import html_template, render_html_from_rows, render_markdown_from_rows
+from msb.scoring import assess_fixture_pack, build_coverage_aggregator
+
+logger = logging.getLogger("msb.server")
+
+Handler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class RequestError(ValueError):
+    """A client error (HTTP 400) raised while handling a request payload."""
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    # Most recent latencies only, so percentiles track current behaviour in bounded memory.
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def snapshot(self) -> dict[str, Any]:
+        ordered = sorted(self.recent)
+
+        def _pct(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000.0, 3)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "mean_ms": round(self.total_seconds / self.requests * 1000.0, 3)
+            if self.requests
+            else None,
+            "p50_ms": _pct(0.50),
+            "p95_ms": _pct(0.95),
+            "p99_ms": _pct(0.99),
+        }
+
+
+class ServerMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._endpoints: dict[str, _EndpointStats] = {}
+
+    def record(self, endpoint: str, seconds: float, *, error: bool) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(endpoint, _EndpointStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.total_seconds += seconds
+            stats.recent.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            total = sum(s.requests for s in self._endpoints.values())
+            return {
+                "uptime_s": round(uptime, 3),
+                "requests": total,
+                "requests_per_s": round(total / uptime, 3) if uptime > 0 else 0.0,
+                "endpoints": {k: v.snapshot() for k, v in sorted(self._endpoints.items())},
+            }
+
+
+class AssessmentService:
+    """The pipeline behind `msb serve`, with mapping data, rules and templates kept warm.
+
+    Fixture packs can be sent inline or named by an `"input"` path. Paths are resolved against
+    `input_root` and must stay inside it; without a root, path inputs are refused.
+    """
+
+    def __init__(self, input_root: Path | None = None) -> None:
+        self._input_root = input_root.resolve() if input_root is not None else None
+        # Compile once up front so the first request does not pay for it.
+        resolve_frameworks()
+        default_rule_set()
+        html_template()
+
+    def routes(self) -> dict[str, Handler]:
+        return {
+            "/assess": self.assess,
+            "/compare": self.compare,
+            "/plan": self.plan,
+            "/report": self.report,
+        }
+
+    def assess(self, payload: dict[str, Any]) -> dict[str, Any]:
+        pack = self._pack(payload)
+        assessment = assess_fixture_pack(pack, frameworks=payload.get("frameworks"))
+        coverage = build_coverage_aggregator(assessment.mapped_findings, assessment.targets)
+        table = coverage.to_table()
+        return {
+            "summary": assessment.model_dump(mode="json"),
+            "controls_coverage": {"headers": table.headers, "rows": table.rows},
+        }
+
+    def compare(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return compare_summaries(_require(payload, "before"), _require(payload, "after"))
+
+    def plan(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if "summary" in payload:
+            mapped = AssessmentSummary.model_validate(payload["summary"]).mapped_findings
+        else:
+            mapped = assess_fixture_pack(self._pack(payload)).mapped_findings
+        backlog, roadmap = build_backlog_and_roadmap(mapped)
+        return {
+            "remediation_backlog": {"headers": backlog.headers, "rows": backlog.rows},
+            "roadmap": {"headers": roadmap.headers, "rows": roadmap.rows},
+        }
+
+    def report(self, payload: dict[str, Any]) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "title": payload.get("title", "Multi-Cloud Security Baseline Report"),
+            "author": payload.get("author"),
+            "compare_obj": _require(payload, "compare"),
+            "backlog": _table_rows(payload.get("remediation_backlog")),
+            "roadmap": _table_rows(payload.get("roadmap")),
+            "coverage": _table_rows(payload.get("controls_coverage")),
+        }
+        return {
+            "markdown": render_markdown_from_rows(**kwargs),
+            "html": render_html_from_rows(**kwargs),
+        }
+
+    def _pack(self, payload: dict[str, Any]) -> FixturePack:
+        if "input" in payload:
+            return load_fixture_pack(self._input_path(str(payload["input"])))
+        return validate_fixture_objects(
+            {"targets": _require(payload, "targets")},
+            {"findings": _require(payload, "findings")},
+        )
+
+    def _input_path(self, value: str) -> Path:
+        if self._input_root is None:
+            raise RequestError("Path inputs are disabled; send targets and findings inline")
+        path = (self._input_root / value).resolve()
+        if not path.is_relative_to(self._input_root):
+            raise RequestError(f"Input path is outside the server's input root: {value}")
+        return path
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: _AssessmentHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/healthz":
+            self._send(HTTPStatus.OK, {"status": "ok"})
+        elif self.path == "/metrics":
+            self._send(HTTPStatus.OK, self.server.metrics.snapshot())
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        handler = self.server.routes.get(self.path)
+        if handler is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+            return
+
+        start = time.perf_counter()
+        error = True
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                raise RequestError("Request body must be a JSON object")
+            body = handler(payload)
+            error = False
+            self._send(HTTPStatus.OK, body)
+        except (RequestError, ValueError, KeyError, TypeError) as exc:
+            # pydantic.ValidationError is a ValueError, so schema problems land here too;
+            # TypeError and KeyError come from payload fields of the wrong type or shape.
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except Exception as exc:
+            logger.exception("Request to %s failed", self.path)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
+        finally:
+            self.server.metrics.record(self.path, time.perf_counter() - start, error=error)
+
+    def _send(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        # One request per connection: an idle keep-alive client would otherwise hold a pool
+        # worker (and a slot) until it disconnects.
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix-socket peers have no (host, port) address.
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s %s", self.address_string(), format % args)
+
+
+class _BoundedPoolMixin:
+    """Handle each connection (one request; see `_RequestHandler._send`) on a fixed-size pool.
+
+    The accept loop blocks once `workers + backlog` connections are in flight, which bounds
+    memory under load instead of spawning a thread per connection.
+    """
+
+    def _init_pool(self, workers: int, backlog: int) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="msb-serve")
+        self._slots = threading.BoundedSemaphore(workers + backlog)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._slots.acquire()
+        self._pool.submit(self._process, request, client_address)
+
+    def _process(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)  # type: ignore[attr-defined]
+        except Exception:
+            self.handle_error(request, client_address)  # type: ignore[attr-defined]
+        finally:
+            self.shutdown_request(request)  # type: ignore[attr-defined]
+            self._slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()  # type: ignore[misc]
+        self._pool.shutdown(wait=True)
+
+
+class _AssessmentHTTPServer(_BoundedPoolMixin, HTTPServer):
+    daemon_threads = True
+    routes: dict[str, Handler]
+    metrics: ServerMetrics
+
+
+class _AssessmentUnixServer(_BoundedPoolMixin, socketserver.UnixStreamServer):
+    routes: dict[str, Handler]
+    metrics: ServerMetrics
+
+
+def create_server(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Path | None = None,
+    workers: int = 4,
+    backlog: int = 16,
+    input_root: Path | None = None,
+    service: AssessmentService | None = None,
+) -> socketserver.BaseServer:
+    """Build (but do not start) the JSON API server; call `serve_forever()` on the result.
+
+    `input_root` is the directory `"input"` paths may name (see `AssessmentService`). A stale
+    socket left at `unix_socket` is replaced; any other file there raises ValueError.
+    """
+    server: _AssessmentHTTPServer | _AssessmentUnixServer
+    if unix_socket is not None:
+        if unix_socket.is_socket():
+            unix_socket.unlink()
+        elif unix_socket.exists():
+            raise ValueError(f"{unix_socket} exists and is not a socket")
+        server = _AssessmentUnixServer(str(unix_socket), _RequestHandler)
+    else:
+        server = _AssessmentHTTPServer((host, port), _RequestHandler)
+    server._init_pool(workers, backlog)
+    server.routes = (service or AssessmentService(input_root)).routes()
+    server.metrics = ServerMetrics()
+    return server
+
+
+def server_address(server: socketserver.BaseServer) -> str:
+    address = server.server_address
+    if isinstance(address, tuple):
+        return f"http://{address[0]}:{address[1]}"
+    return f"unix:{address!r}" if isinstance(address, bytes) else f"unix:{address}"
+
+
+def _require(payload: dict[str, Any], key: str) -> Any:
+    if key not in payload:
+        raise RequestError(f"Missing required field: {key}")
+    return payload[key]
+
+
+def _table_rows(table: Any) -> list[dict[str, str]]:
+    if not table:
+        return []
+    headers = list(table["headers"])
+    return [dict(zip(headers, row, strict=True)) for row in table["rows"]]
+
+
+__all__ = [
+    "AssessmentService",
+    "RequestError",
+    "ServerMetrics",
+    "create_server",
+    "server_address",
+]
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from msb.io.fixtures import FixturePack
+from msb.models import Effort, Finding, FindingCategory, Provider, Rating, Severity, Target
+
+_ASSET_TYPES = {
+    Provider.aws: ["aws_account", "iam_principal", "logging", "network", "s3_bucket", "kms"],
+    Provider.azure: ["azure_subscription", "entra_principal", "logging", "vnet", "storage", "kms"],
+    Provider.gcp: ["gcp_project", "service_account", "logging", "vpc", "gcs_bucket", "kms"],
+}
+
+_CATEGORY_TAGS = {
+    FindingCategory.iam: ["mfa", "root", "privileged", "service-accounts", "rotation", "review"],
+    FindingCategory.logging: ["logging", "audit", "retention", "alerting", "diagnostics"],
+    FindingCategory.network: ["segmentation", "security-groups", "exposure", "egress"],
+    FindingCategory.governance: ["policy", "ownership", "exceptions", "standards"],
+    FindingCategory.asset_inventory: ["tagging", "ownership", "inventory"],
+    FindingCategory.data_protection: ["encryption", "kms", "rotation", "backup"],
+}
+
+_CATEGORY_SIGNALS = {
+    FindingCategory.iam: ["mfa_enabled=false", "credential_reviews=partial", "wildcard_admin=true"],
+    FindingCategory.logging: ["retention_days=30", "diag_settings=partial", "alerts=noisy=true"],
+    FindingCategory.network: ["sg_permissive=true", "subnet_tiering=none", "public_ip=true"],
+    FindingCategory.governance: ["policy_owner=none", "exceptions_expired=12"],
+    FindingCategory.asset_inventory: ["required_tags_missing=42%", "orphaned_assets=17"],
+    FindingCategory.data_protection: ["rotation=off", "cmk=false", "backup_encryption=off"],
+}
+
+_REGIONS = {
+    Provider.aws: ["us-east-1", "us-east-2", "eu-west-1"],
+    Provider.azure: ["eastus", "westeurope"],
+    Provider.gcp: ["us-central1", "europe-west1"],
+}
+
+_ENVIRONMENTS = ["prod", "staging", "dev"]
+_BUSINESS_UNITS = ["payments", "retail", "corporate", "data"]
+_DEPENDENCIES = ["Define break-glass policy", "Central logging account design", "Tagging standard"]
+
+
+@dataclass(frozen=True)
+class SyntheticPackConfig:
+    """Shape of a generated fixture pack; the same config and seed always give the same pack."""
+
+    targets: int = 10
+    findings_per_target: int = 100
+    actions_per_finding: int = 2
+    assets_per_target: int = 20
+    assets_per_finding: int = 3
+    provider_mix: dict[Provider, float] = field(
+        default_factory=lambda: {Provider.aws: 0.5, Provider.azure: 0.3, Provider.gcp: 0.2}
+    )
+    seed: int = 0
+
+    @property
+    def finding_count(self) -> int:
+        return self.targets * self.findings_per_target
+
+
+def synthetic_targets(config: SyntheticPackConfig) -> list[dict[str, Any]]:
+    rng = random.Random(f"{config.seed}:targets")
+    providers = list(config.provider_mix)
+    weights = [config.provider_mix[p] for p in providers]
+
+    targets: list[dict[str, Any]] = []
+    for t in range(config.targets):
+        provider = rng.choices(providers, weights)[0]
+        environment = _ENVIRONMENTS[t % len(_ENVIRONMENTS)]
+        target_id = f"{provider.value}-{environment}-{t:05d}"
+        assets = []
+        for a in range(config.assets_per_target):
+            labels = {"tier": environment}
+            if rng.random() < 0.1:
+                labels["privileged"] = "true"
+            assets.append(
+                {
+                    "asset_id": f"{target_id}-a{a:04d}",
+                    "asset_type": rng.choice(_ASSET_TYPES[provider]),
+                    "name": f"asset-{a}",
+                    "labels": labels,
+                }
+            )
+        targets.append(
+            {
+                "target_id": target_id,
+                "provider": provider.value,
+                "environment": environment,
+                "region": rng.choice(_REGIONS[provider]),
+                "owner": rng.choice(["Platform/Security", "Security", "Platform"]),
+                "assets": assets,
+                # Derived from the index so labels leave the random stream (and pack) unchanged.
+                "labels": {
+                    "business_unit": _BUSINESS_UNITS[(t // len(_ENVIRONMENTS)) % 4],
+                    "account": f"acct-{t // len(_ENVIRONMENTS):05d}",
+                },
+            }
+        )
+    return targets
+
+
+def iter_synthetic_findings(
+    config: SyntheticPackConfig, targets: list[dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"{config.seed}:findings")
+    categories = list(FindingCategory)
+    severities = list(Severity)
+    ratings = list(Rating)
+    efforts = list(Effort)
+
+    n = 0
+    for target in targets:
+        asset_ids = [a["asset_id"] for a in target["assets"]]
+        fan_out = min(config.assets_per_finding, len(asset_ids))
+        for _ in range(config.findings_per_target):
+            n += 1
+            category = rng.choice(categories)
+            finding_id = f"F-{n:08d}"
+            yield {
+                "schema_version": "1.0",
+                "finding_id": finding_id,
+                "target_id": target["target_id"],
+                "title": f"Synthetic {category.value} gap {rng.randint(1, 50)}",
+                "description": "Synthetic finding generated for scale testing.",
+                "category": category.value,
+                "severity": rng.choice(severities).value,
+                "likelihood": rng.choice(ratings).value,
+                "impact": rng.choice(ratings).value,
+                "evidence": {
+                    "signal": rng.choice(_CATEGORY_SIGNALS[category]),
+                    "source": "synthetic_generator",
+                },
+                "affected_assets": rng.sample(asset_ids, rng.randint(1, fan_out))
+                if fan_out
+                else [],
+                "detection_source": "msb.synthetic",
+                "detected_at": f"2026-02-{rng.randint(1, 28):02d}T00:00:00Z",
+                "tags": rng.sample(_CATEGORY_TAGS[category], 2),
+                "references": [],
+                "recommended_actions": [
+                    {
+                        "action_id": f"A-{a + 1}",
+                        "title": f"Remediate {category.value} gap (step {a + 1})",
+                        "description": "Synthetic remediation action.",
+                        "effort": rng.choice(efforts).value,
+                        "expected_impact": rng.randint(1, 5),
+                        "dependencies": rng.sample(_DEPENDENCIES, rng.randint(0, 1)),
+                        "owner": "Platform/Security",
+                    }
+                    for a in range(config.actions_per_finding)
+                ],
+            }
+
+
+def generate_fixture_pack(config: SyntheticPackConfig) -> FixturePack:
+    targets = synthetic_targets(config)
+    return FixturePack(
+        targets=[Target.model_validate(t) for t in targets],
+        findings=[Finding.model_validate(f) for f in iter_synthetic_findings(config, targets)],
+    )
+
+
+def write_synthetic_pack(root: Path, config: SyntheticPackConfig) -> None:
+    """Write targets.json + findings.json, streaming findings so large packs fit in memory."""
+    root.mkdir(parents=True, exist_ok=True)
+    targets = synthetic_targets(config)
+    (root / "targets.json").write_text(
+        json.dumps({"targets": targets}, indent=2) + "\n", encoding="utf-8"
+    )
+    with (root / "findings.json").open("w", encoding="utf-8") as f:
+        f.write('{\n  "findings": [')
+        for i, finding in enumerate(iter_synthetic_findings(config, targets)):
+            f.write(",\n    " if i else "\n    ")
+            f.write(json.dumps(finding))
+        f.write("\n  ]\n}\n")
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import heapq
+import json
+import shutil
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+Record = dict[str, Any]
+
+# Most open run files merged at once; more runs are first merged into fewer, longer ones.
+DEFAULT_FAN_IN = 64
+
+
+def record_size(record: Record) -> int:
+    """Approximate bytes held by a flat record (the dict plus its values; keys are shared)."""
+    return sys.getsizeof(record) + sum(sys.getsizeof(v) for v in record.values())
+
+
+class ExternalSorter:
+    """Sorts flat JSON-serializable records that may not fit in memory.
+
+    Records are buffered until their approximate size reaches `memory_budget` bytes; each
+    full buffer is sorted and spilled to a temporary run file as JSON lines, and iterating
+    k-way merges the runs. The merge is stable across runs in insertion order, so the result
+    is exactly `sorted(records, key=key)`. Floats round-trip through JSON unchanged.
+
+    Iterating again replays the merge from the runs. Use as a context manager (or call
+    `close`) to remove the run files.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Record], Any],
+        *,
+        memory_budget: int,
+        tmp_dir: Path | None = None,
+        fan_in: int = DEFAULT_FAN_IN,
+    ) -> None:
+        if memory_budget < 1:
+            raise ValueError("memory_budget must be >= 1 byte")
+        if fan_in < 2:
+            raise ValueError("fan_in must be >= 2")
+        self._key = key
+        self._budget = memory_budget
+        self._tmp_dir = tmp_dir
+        self._fan_in = fan_in
+        self._buffer: list[Record] = []
+        self._buffered = 0
+        self._runs: list[Path] = []
+        self._dir: Path | None = None
+        self._next_run = 0
+        self.count = 0
+        # Sorted runs written from the buffer; merging passes do not reduce this.
+        self.spilled_runs = 0
+
+    def __enter__(self) -> ExternalSorter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def runs(self) -> int:
+        """Run files on disk now (0 while everything fits in memory); see `spilled_runs`."""
+        return len(self._runs)
+
+    def add(self, record: Record) -> None:
+        self._buffer.append(record)
+        self._buffered += record_size(record)
+        self.count += 1
+        if self._buffered >= self._budget:
+            self._spill()
+
+    def extend(self, records: Iterable[Record]) -> ExternalSorter:
+        for record in records:
+            self.add(record)
+        return self
+
+    def __iter__(self) -> Iterator[Record]:
+        if not self._runs:
+            self._buffer.sort(key=self._key)
+            return iter(list(self._buffer))
+        if self._buffer:
+            self._spill()
+        while len(self._runs) > self._fan_in:
+            self._runs = [
+                self._merge_to_run(self._runs[i : i + self._fan_in])
+                for i in range(0, len(self._runs), self._fan_in)
+            ]
+        return self._merge(self._runs)
+
+    def close(self) -> None:
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+        self._runs = []
+        self._buffer = []
+        self._buffered = 0
+
+    def _new_run(self) -> Path:
+        if self._dir is None:
+            self._dir = Path(tempfile.mkdtemp(prefix="msb-sort-", dir=self._tmp_dir))
+        path = self._dir / f"run-{self._next_run:06d}.jsonl"
+        self._next_run += 1
+        return path
+
+    def _spill(self) -> None:
+        self._buffer.sort(key=self._key)
+        path = self._new_run()
+        with path.open("w", encoding="utf-8") as f:
+            for record in self._buffer:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+        self._runs.append(path)
+        self.spilled_runs += 1
+        self._buffer = []
+        self._buffered = 0
+
+    def _merge_to_run(self, runs: list[Path]) -> Path:
+        if len(runs) == 1:
+            return runs[0]
+        path = self._new_run()
+        with path.open("w", encoding="utf-8") as f:
+            for record in self._merge(runs):
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+        for run in runs:
+            run.unlink()
+        return path
+
+    def _merge(self, runs: list[Path]) -> Iterator[Record]:
+        files = [run.open(encoding="utf-8") for run in runs]
+        try:
+            # heapq.merge breaks ties by input order, which keeps the sort stable.
+            yield from heapq.merge(*(map(json.loads, f) for f in files), key=self._key)
+        finally:
+            for f in files:
+                f.close()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+logger = logging.getLogger("msb.perf")
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class Span:
+    name: str
+    records: int | None = None
+    fields: dict[str, Any] = field(default_factory=dict)
+    seconds: float = 0.0
+    peak_rss_mb: float | None = None
+    rss_growth_mb: float | None = None
+    traced_peak_mb: float | None = None
+
+    @property
+    def throughput(self) -> float | None:
+        if self.records is None or self.seconds <= 0:
+            return None
+        return self.records / self.seconds
+
+    def event(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "span": self.name,
+            "seconds": round(self.seconds, 6),
+            **self.fields,
+        }
+        if self.records is not None:
+            payload["records"] = self.records
+        if self.throughput is not None:
+            payload["records_per_s"] = round(self.throughput, 1)
+        if self.peak_rss_mb is not None:
+            payload["peak_rss_mb"] = round(self.peak_rss_mb, 2)
+            payload["rss_growth_mb"] = round(self.rss_growth_mb or 0.0, 2)
+        if self.traced_peak_mb is not None:
+            payload["traced_peak_mb"] = round(self.traced_peak_mb, 2)
+        return payload
+
+
+@dataclass
+class SpanCollector:
+    spans: list[Span] = field(default_factory=list)
+
+    def summary_rows(self) -> list[list[str]]:
+        rows: list[list[str]] = []
+        for s in self.spans:
+            rows.append(
+                [
+                    s.name,
+                    f"{s.seconds * 1000:.1f}",
+                    "" if s.records is None else str(s.records),
+                    "" if s.throughput is None else f"{s.throughput:,.0f}",
+                    "" if s.peak_rss_mb is None else f"{s.peak_rss_mb:.1f}",
+                    "" if s.traced_peak_mb is None else f"{s.traced_peak_mb:.1f}",
+                ]
+            )
+        return rows
+
+
+_collector: SpanCollector | None = None
+
+
+def start_collecting() -> SpanCollector:
+    """Keep every finished span in memory (in addition to logging it) until `stop_collecting`."""
+    global _collector
+    _collector = SpanCollector()
+    return _collector
+
+
+def stop_collecting() -> None:
+    global _collector
+    _collector = None
+
+
+def trace_memory_enabled() -> bool:
+    return os.getenv("MSB_TRACE_MEMORY", "").strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+@contextmanager
+def span(name: str, *, records: int | None = None, **fields: Any) -> Iterator[Span]:
+    """Time a pipeline stage and log it as a structured `msb.perf` event.
+
+    The yielded span's `records` can be set inside the block once the count is known.
+    tracemalloc deltas are only recorded when tracing is already on or MSB_TRACE_MEMORY=1,
+    since tracing slows allocation-heavy stages considerably. Like peak RSS, both memory
+    figures are high-water marks reached by the end of the span, not per-span figures: they
+    only grow, and a span that allocates less than an earlier one reports the earlier peak.
+    The traced peak is measured from the memory traced when the span starts. Spans never
+    reset tracemalloc's peak, so callers that read it themselves are unaffected.
+    """
+    s = Span(name=name, records=records, fields=dict(fields))
+    rss_before = _peak_rss_mb()
+    traced = tracemalloc.is_tracing()
+    if not traced and trace_memory_enabled():
+        tracemalloc.start()
+        traced = True
+    if traced:
+        traced_start, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    try:
+        yield s
+    finally:
+        s.seconds = time.perf_counter() - start
+        if traced:
+            _, peak = tracemalloc.get_traced_memory()
+            s.traced_peak_mb = max(0, peak - traced_start) / (1024 * 1024)
+        s.peak_rss_mb = _peak_rss_mb()
+        if s.peak_rss_mb is not None and rss_before is not None:
+            s.rss_growth_mb = s.peak_rss_mb - rss_before
+        if _collector is not None:
+            _collector.spans.append(s)
+        logger.info("span %s %.3fs", name, s.seconds, extra={"event": s.event()})
+
+
+def timed(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    def _decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        @wraps(fn)
+        def _wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorate
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
@@ -15,6 +15,9 @@ class _JsonFormatter(logging.Formatter):
             "logger": record.name,
             "msg": record.getMessage(),
         }
+        event = getattr(record, "event", None)
+        if isinstance(event, dict):
+            payload["event"] = event
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
         return json.dumps(payload, sort_keys=True)
@@ -35,3 +38,8 @@ def configure_logging(*, json_logs: bool, level: str) -> None:
         _JsonFormatter() if json_logs else logging.Formatter("%(levelname)s %(name)s: %(message)s")
     )
     root.addHandler(handler)
+
+    # Per-stage timing events are meant for log pipelines; keep plain console output quiet
+    # unless DEBUG was asked for (`--timings` prints a summary table for humans instead).
+    perf_level = logging.NOTSET if json_logs or level.upper() == "DEBUG" else logging.WARNING
+    logging.getLogger("msb.perf").setLevel(perf_level)
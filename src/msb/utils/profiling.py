@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+
+
+@dataclass(frozen=True)
+class HotFunction:
+    function: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        super().__init__(name="msb-stack-sampler", daemon=True)
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.stacks: Counter[str] = Counter()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class ProfileSession:
+    """cProfile (exact call stats) plus a stack sampler (flamegraph input) for one command."""
+
+    def __init__(self, *, sample_interval: float = 0.005) -> None:
+        self._profiler = cProfile.Profile()
+        self._sampler = _StackSampler(threading.get_ident(), sample_interval)
+        self.output_dir: Path | None = None
+
+    def start(self) -> None:
+        self._sampler.start()
+        self._profiler.enable()
+
+    def stop(self) -> None:
+        self._profiler.disable()
+        self._sampler.stop()
+
+    def write(self, out_dir: Path, name: str) -> tuple[Path, Path]:
+        """Write `<name>.pstats` and `<name>.collapsed` (Brendan Gregg folded stacks)."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        pstats_path = out_dir / f"{name}.pstats"
+        collapsed_path = out_dir / f"{name}.collapsed"
+        self._profiler.dump_stats(str(pstats_path))
+        with collapsed_path.open("w", encoding="utf-8") as f:
+            for stack, count in sorted(self._sampler.stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return pstats_path, collapsed_path
+
+    def hot_functions(self, n: int = 15) -> list[HotFunction]:
+        stats = pstats.Stats(self._profiler)
+        rows: list[HotFunction] = []
+        # pstats keeps (primitive calls, total calls, self time, cumulative time, callers).
+        for (filename, line, func), (_, calls, tt, ct, _) in stats.stats.items():  # type: ignore[attr-defined]
+            rows.append(
+                HotFunction(
+                    function=f"{_short_path(filename)}:{line}({func})",
+                    calls=calls,
+                    self_seconds=tt,
+                    cumulative_seconds=ct,
+                )
+            )
+        rows.sort(key=lambda r: r.self_seconds, reverse=True)
+        return rows[:n]
+
+
+_active: ProfileSession | None = None
+
+
+def start_profiling(*, sample_interval: float = 0.005) -> ProfileSession:
+    global _active
+    _active = ProfileSession(sample_interval=sample_interval)
+    _active.start()
+    return _active
+
+
+def note_output_dir(path: Path) -> None:
+    """Commands call this with their artifact directory so profiles land next to artifacts."""
+    if _active is not None and _active.output_dir is None:
+        _active.output_dir = path
+
+
+def finish_profiling() -> ProfileSession | None:
+    global _active
+    session, _active = _active, None
+    if session is not None:
+        session.stop()
+    return session
+
+
+def _collapse(frame: FrameType | None) -> str:
+    parts: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{_short_path(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+def _short_path(filename: str) -> str:
+    # Package-relative paths for msb modules, bare file names for everything else.
+    normalized = filename.replace("\\", "/")
+    idx = normalized.rfind("/msb/")
+    return normalized[idx + 1 :] if idx >= 0 else Path(filename).name
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import math
+
+# Bytes of hash digest per sketch row; blake2b digests are at most 64 bytes.
+_ROW_BYTES = 4
+_MAX_DEPTH = 64 // _ROW_BYTES
+
+
+class CountMinSketch:
+    """Approximate counts in fixed memory (Cormode & Muthukrishnan).
+
+    Estimates never undercount; with probability `1 - delta` an estimate exceeds the true
+    count by at most `epsilon * total`. Hashing is seeded and deterministic across runs.
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01, *, seed: int = 0) -> None:
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be in (0, 1)")
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        if self.depth > _MAX_DEPTH:
+            raise ValueError(f"delta too small: at most {_MAX_DEPTH} rows are supported")
+        self.seed = seed
+        self.total = 0
+        self._salt = seed.to_bytes(16, "little", signed=True)
+        self._rows = [[0] * self.width for _ in range(self.depth)]
+
+    @property
+    def epsilon(self) -> float:
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        return math.exp(-self.depth)
+
+    def _columns(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(
+            key.encode("utf-8"), digest_size=_ROW_BYTES * self.depth, salt=self._salt
+        ).digest()
+        return [
+            int.from_bytes(digest[i : i + _ROW_BYTES], "little") % self.width
+            for i in range(0, len(digest), _ROW_BYTES)
+        ]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Count `key` and return its new estimate."""
+        self.total += count
+        estimate = None
+        for row, col in zip(self._rows, self._columns(key), strict=True):
+            row[col] += count
+            estimate = row[col] if estimate is None else min(estimate, row[col])
+        return estimate or 0
+
+    def estimate(self, key: str) -> int:
+        return min(row[col] for row, col in zip(self._rows, self._columns(key), strict=True))
+
+    def merge(self, other: CountMinSketch) -> CountMinSketch:
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Only sketches with the same shape and seed can be merged")
+        for row, other_row in zip(self._rows, other._rows, strict=True):
+            for i, n in enumerate(other_row):
+                row[i] += n
+        self.total += other.total
+        return self
+
+
+class HeavyHitters:
+    """The `k` most frequent keys of a stream, tracked by their count-min estimates.
+
+    A few times `k` candidates are kept; a key enters when its estimate beats the weakest
+    candidate, so memory stays O(k) however many distinct keys the stream has.
+    """
+
+    def __init__(self, k: int, sketch: CountMinSketch, *, slack: int = 4) -> None:
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        self.k = k
+        self.sketch = sketch
+        self._capacity = k * slack
+        self._candidates: dict[str, int] = {}
+        self._floor = 0
+
+    def add(self, key: str, count: int = 1) -> None:
+        estimate = self.sketch.add(key, count)
+        candidates = self._candidates
+        if key in candidates or len(candidates) < self._capacity:
+            candidates[key] = estimate
+        elif estimate > self._floor:
+            candidates[key] = estimate
+            # Candidate estimates only grow, so the floor is refreshed on eviction only.
+            del candidates[min(candidates, key=candidates.__getitem__)]
+            self._floor = min(candidates.values())
+
+    def top(self) -> list[tuple[str, int]]:
+        """Up to `k` (key, estimate) pairs, most frequent first."""
+        return sorted(self._candidates.items(), key=lambda kv: (-kv[1], kv[0]))[: self.k]
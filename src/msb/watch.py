@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Collection, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import msb.mappings
+import msb.reporting
+from msb.demo_flow import assess_stage, compare_stage, report_stage
+from msb.io.fixtures import FixturePack, load_fixture_pack
+from msb.mappings import CompiledRuleSet, default_rule_set, load_rule_set
+from msb.mappings.frameworks import clear_compiled_frameworks
+from msb.models import AssessmentSummary
+from msb.reporting.render import html_template
+from msb.scoring import CoverageAggregator
+
+SIDES = ("before", "after")
+# Packaged inputs that curators edit alongside fixture packs.
+MAPPING_DATA_DIR = Path(msb.mappings.__file__).parent / "data"
+TEMPLATE_DIR = Path(msb.reporting.__file__).parent / "templates"
+
+FileState = dict[Path, tuple[int, int]]
+
+
+class PollingWatcher:
+    """Detects changes to groups of files by polling mtime and size.
+
+    Polling needs no inotify/FSEvents support, so it behaves the same on every platform and
+    on network or container-mounted filesystems. Directories are watched recursively.
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, Sequence[Path]],
+        *,
+        interval: float = 0.5,
+        debounce: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.groups = {name: list(paths) for name, paths in groups.items()}
+        self.interval = interval
+        self.debounce = debounce
+        self._clock = clock
+        self._sleep = sleep
+        self._state = {name: _scan(paths) for name, paths in self.groups.items()}
+
+    def poll(self) -> set[str]:
+        """Groups whose files were added, removed or modified since the previous poll."""
+        changed: set[str] = set()
+        for name, paths in self.groups.items():
+            state = _scan(paths)
+            if state != self._state[name]:
+                changed.add(name)
+                self._state[name] = state
+        return changed
+
+    def wait(self) -> set[str]:
+        """Block until something changes, then until `debounce` seconds pass with no changes.
+
+        Editors often save a file in several writes; debouncing turns them into one rerun.
+        """
+        changed: set[str] = set()
+        while not changed:
+            self._sleep(self.interval)
+            changed = self.poll()
+        quiet_since = self._clock()
+        while self._clock() - quiet_since < self.debounce:
+            self._sleep(min(self.interval, self.debounce))
+            more = self.poll()
+            if more:
+                changed |= more
+                quiet_since = self._clock()
+        return changed
+
+
+def _scan(paths: Sequence[Path]) -> FileState:
+    state: FileState = {}
+    for path in paths:
+        files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+        for f in files:
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            state[f] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+class WatchPipeline:
+    """The demo pipeline with per-stage results kept between runs.
+
+    `run(changed)` repeats only the stages downstream of the changed input groups
+    ("before", "after", "mappings", "rules", "templates"); compiled frameworks, rules and the
+    report template stay warm in-process unless their sources changed.
+    """
+
+    def __init__(self, fixtures_dir: Path, out_dir: Path, rules_path: Path | None = None) -> None:
+        self.fixtures_dir = fixtures_dir
+        self.out_dir = out_dir
+        self.rules_path = rules_path
+        self._rules: CompiledRuleSet | None = None
+        self._packs: dict[str, FixturePack] = {}
+        self._assessed: dict[str, tuple[AssessmentSummary, CoverageAggregator]] = {}
+        self._comparison: dict[str, Any] | None = None
+        self._report_current = False
+
+    def watch_groups(self) -> dict[str, list[Path]]:
+        groups = {side: [self.fixtures_dir / side] for side in SIDES}
+        groups["mappings"] = [MAPPING_DATA_DIR]
+        if self.rules_path is not None:
+            groups["rules"] = [self.rules_path]
+        groups["templates"] = [TEMPLATE_DIR]
+        return groups
+
+    def run(self, changed: Collection[str] = ()) -> list[str]:
+        """Bring all outputs up to date after `changed`; returns the stages that ran."""
+        stages: list[str] = []
+        if "mappings" in changed:
+            clear_compiled_frameworks()
+            default_rule_set.cache_clear()
+        if "templates" in changed:
+            html_template.cache_clear()
+        reload_rules = "rules" in changed or "mappings" in changed
+        if self.rules_path is not None and (self._rules is None or reload_rules):
+            self._rules = load_rule_set(self.rules_path)
+
+        load = [s for s in SIDES if s in changed or s not in self._packs]
+        for side in load:
+            self._packs[side] = load_fixture_pack(self.fixtures_dir / side)
+            # Drop the stale assessment so a failure below forces a rerun next time.
+            self._assessed.pop(side, None)
+        if load:
+            stages.append("load")
+
+        assess = [s for s in SIDES if reload_rules or s not in self._assessed]
+        if assess:
+            self._comparison = None
+        for side in assess:
+            self._assessed[side] = assess_stage(
+                self._packs[side], self.out_dir / side, rules=self._rules
+            )
+        if assess:
+            stages.append("assess")
+
+        if self._comparison is None:
+            self._report_current = False
+            self._comparison = compare_stage(
+                self._assessed["before"], self._assessed["after"], self.out_dir / "compare"
+            )
+            stages.append("compare")
+
+        if not self._report_current or "templates" in changed:
+            self._report_current = False
+            report_stage(self._comparison, self.out_dir / "compare", self.out_dir / "report")
+            self._report_current = True
+            stages.append("report")
+        return stages
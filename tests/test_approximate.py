@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.io.fixtures import FixtureValidationError, load_fixture_pack
+from msb.scoring import approximate_assess, assess_fixture_pack, build_coverage_aggregator
+from msb.synthetic import SyntheticPackConfig, write_synthetic_pack
+from msb.utils.sketch import CountMinSketch, HeavyHitters
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _pack(tmp_path: Path) -> Path:
+    root = tmp_path / "pack"
+    write_synthetic_pack(root, SyntheticPackConfig(targets=12, findings_per_target=40, seed=3))
+    return root
+
+
+def _exact_coverage(root: Path) -> dict[tuple[str, str], int]:
+    summary = assess_fixture_pack(load_fixture_pack(root))
+    table = build_coverage_aggregator(summary.mapped_findings, summary.targets).to_table()
+    return {(r[0], r[1]): int(r[2]) for r in table.rows}
+
+
+def test_count_min_sketch_never_undercounts() -> None:
+    stream = [f"k{i % 97}" for i in range(5000)] + ["hot"] * 400
+    sketch = CountMinSketch(0.01, 0.01, seed=7)
+    hitters = HeavyHitters(3, CountMinSketch(0.01, 0.01, seed=7))
+    for key in stream:
+        sketch.add(key)
+        hitters.add(key)
+    exact = Counter(stream)
+    for key, n in exact.items():
+        assert n <= sketch.estimate(key) <= n + sketch.epsilon * sketch.total
+    assert hitters.top()[0] == ("hot", sketch.estimate("hot"))
+
+    other = CountMinSketch(0.01, 0.01, seed=7)
+    other.add("hot", 5)
+    assert sketch.merge(other).estimate("hot") >= 405
+    with pytest.raises(ValueError, match="same shape"):
+        sketch.merge(CountMinSketch(0.01, 0.01, seed=8))
+
+
+def test_census_sample_matches_the_exact_assessment(tmp_path: Path) -> None:
+    root = tmp_path / "pack"
+    write_synthetic_pack(root, SyntheticPackConfig(targets=6, findings_per_target=10, seed=1))
+    exact = assess_fixture_pack(load_fixture_pack(root))
+    estimate = approximate_assess([root], sample_per_stratum=1000)
+
+    assert estimate.findings_sampled == estimate.findings_total == len(exact.mapped_findings)
+    assert estimate.org.estimate == pytest.approx(exact.org.posture_score)
+    assert estimate.org.lower == estimate.org.upper == pytest.approx(exact.org.posture_score)
+    for t in exact.targets:
+        assert estimate.targets[t.target_id].estimate == pytest.approx(t.posture_score)
+    assert {
+        (c.framework, c.control_theme): c.finding_count.estimate for c in estimate.coverage
+    } == pytest.approx(_exact_coverage(root))
+
+
+def test_sampled_estimates_bracket_the_exact_values(tmp_path: Path) -> None:
+    root = _pack(tmp_path)
+    exact = assess_fixture_pack(load_fixture_pack(root))
+    estimate = approximate_assess([root], sample_per_stratum=4, confidence=0.99, seed=5)
+    assert estimate.findings_sampled < estimate.findings_total
+
+    coverage = _exact_coverage(root)
+    inside = [
+        c.finding_count.lower <= coverage[(c.framework, c.control_theme)] <= c.finding_count.upper
+        for c in estimate.coverage
+    ]
+    assert len(inside) == len(coverage)
+    assert sum(inside) >= 0.9 * len(inside)
+    for t in exact.targets:
+        band = estimate.targets[t.target_id]
+        assert band.lower - 1e-9 <= t.posture_score <= band.upper + 1e-9
+
+    asset_counts = Counter(
+        (mf.finding.target_id, a)
+        for mf in exact.mapped_findings
+        for a in mf.finding.affected_assets
+    )
+    for a in estimate.top_assets:
+        n = asset_counts[(a.target_id, a.asset_id)]
+        assert a.finding_count.lower <= n <= a.finding_count.upper
+    # The same seed draws the same sample.
+    again = approximate_assess([root], sample_per_stratum=4, confidence=0.99, seed=5)
+    assert again.model_dump(exclude={"assessed_at"}) == estimate.model_dump(exclude={"assessed_at"})
+
+
+def test_sampled_validation_errors_report_findings_positions(tmp_path: Path) -> None:
+    root = _pack(tmp_path)
+    findings_path = root / "findings.json"
+    doc = json.loads(findings_path.read_text(encoding="utf-8"))
+    doc["findings"][137]["severity"] = "catastrophic"
+    findings_path.write_text(json.dumps(doc), encoding="utf-8")
+
+    with pytest.raises(FixtureValidationError) as excinfo:
+        approximate_assess([root], sample_per_stratum=1000)
+    assert [e.index for e in excinfo.value.errors] == [137]
+    assert excinfo.value.total == 480
+
+
+def test_cli_approximate_writes_estimates(tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    result = CliRunner().invoke(
+        app,
+        ["assess", "--input", str(_pack(tmp_path)), "--out", str(out), "--approximate"],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Approximate Assessment" in result.output
+    summary = json.loads((out / "approximate_summary.json").read_text(encoding="utf-8"))
+    assert summary["findings_total"] == 480
+    header = (out / "controls_coverage_estimate.csv").read_text(encoding="utf-8").splitlines()[0]
+    assert header == "framework,control_theme,finding_count,lower,upper"
+    assert (out / "top_assets_estimate.csv").exists()
+    assert not (out / "summary.json").exists()
+
+
+@pytest.mark.parametrize(
+    ("flag", "hint"),
+    [
+        (["--rollup", "provider"], "--rollup"),
+        (["--scoring-mode", "correlated"], "--scoring-mode"),
+        (["--uncertainty-draws", "10"], "--uncertainty-draws"),
+    ],
+)
+def test_cli_approximate_rejects_exact_only_options(
+    tmp_path: Path, flag: list[str], hint: str
+) -> None:
+    result = CliRunner().invoke(
+        app,
+        [
+            "assess",
+            "--input",
+            str(FIXTURES / "before"),
+            "--out",
+            str(tmp_path),
+            "--approximate",
+            *flag,
+        ],
+    )
+    assert result.exit_code == 2
+    assert hint in result.output
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from msb.assets import AssetIndex, AssetWeights
+from msb.io.fixtures import FixturePack, load_fixture_pack, validate_fixture_objects
+from msb.models import Asset
+from msb.scoring import assess_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_asset_index_lookups_and_label_index() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    index = pack.asset_index
+    assert index is pack.asset_index  # built once per pack
+
+    root = index.get("aws-prod", "iam-root")
+    assert root is not None and root.labels == {"privileged": "true"}
+    assert ("aws-prod", "iam-root") in index.with_label("privileged", "true")
+    assert index.get("aws-dev", "iam-root") is None
+
+
+def test_unknown_affected_assets_are_rejected() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    targets = {"targets": [t.model_dump(mode="json") for t in pack.targets]}
+    finding = pack.findings[0].model_dump(mode="json")
+    finding["affected_assets"] = ["does-not-exist"]
+    with pytest.raises(ValueError, match="unknown asset_id"):
+        validate_fixture_objects(targets, {"findings": [finding]})
+
+
+def test_duplicate_asset_ids_within_target_are_rejected() -> None:
+    target = load_fixture_pack(FIXTURES / "before").targets[0]
+    doubled = target.model_copy(update={"assets": target.assets + target.assets[:1]})
+    with pytest.raises(ValueError, match="Duplicate asset_id"):
+        AssetIndex.build([doubled])
+
+
+def test_weighted_blast_radius_is_opt_in() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    plain = assess_fixture_pack(pack)
+    weighted = assess_fixture_pack(pack, asset_weights=AssetWeights())
+
+    by_id = {mf.finding.finding_id: mf for mf in plain.mapped_findings}
+    for mf in plain.mapped_findings:
+        assert mf.blast_radius == len(mf.finding.affected_assets)
+
+    # Privileged and prod assets widen the blast radius, so posture can only get worse.
+    assert weighted.org.posture_score < plain.org.posture_score
+    for mf in weighted.mapped_findings:
+        assert mf.blast_radius is not None
+        assert mf.blast_radius >= (by_id[mf.finding.finding_id].blast_radius or 0.0)
+
+
+def test_asset_weights_from_obj() -> None:
+    weights = AssetWeights.from_obj({"default": 0.5, "labels": {"tier=prod": 4}})
+    pack = load_fixture_pack(FIXTURES / "before")
+    prod = pack.asset_index.get("aws-prod", "111111111111")
+    assert prod is not None and weights.weight(prod) == 4.0
+    with pytest.raises(ValueError, match="key=value"):
+        AssetWeights.from_obj({"labels": {"tier": 2}})
+
+
+def test_risk_by_asset_ranks_assets_touched_by_most_risk() -> None:
+    pack: FixturePack = load_fixture_pack(FIXTURES / "before")
+    summary = assess_fixture_pack(pack)
+    ranked = pack.asset_index.risk_by_asset(summary.mapped_findings)
+
+    assert ranked[0].asset_id == "111111111111"
+    assert ranked[0].finding_count == 2
+    assert [a.risk for a in ranked] == sorted((a.risk for a in ranked), reverse=True)
+    assert len(pack.asset_index.risk_by_asset(summary.mapped_findings, n=3)) == 3
+
+
+def test_label_weights_below_the_default_apply() -> None:
+    weights = AssetWeights.from_obj({"default": 1, "labels": {"tier=dev": 0.5, "pii=true": 2}})
+    dev = Asset(asset_id="a", asset_type="vm", name="a", labels={"tier": "dev"})
+    assert weights.weight(dev) == 0.5
+    # Among matching labels the largest still wins, even above the default.
+    both = Asset(asset_id="b", asset_type="vm", name="b", labels={"tier": "dev", "pii": "true"})
+    assert weights.weight(both) == 2.0
+    unlabelled = Asset(asset_id="c", asset_type="vm", name="c", labels={"team": "x"})
+    assert weights.weight(unlabelled) == 1.0
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import msb.io.fixtures as fixtures_mod
+from msb.io.artifacts import read_json
+from msb.io.fixtures import load_fixture_pack, load_fixture_packs, merge_fixture_packs
+from msb.synthetic import SyntheticPackConfig, write_synthetic_pack
+
+
+def _write_packs(tmp_path: Path, n: int) -> list[Path]:
+    roots = []
+    for i in range(n):
+        root = tmp_path / f"pack-{i}"
+        write_synthetic_pack(root, SyntheticPackConfig(targets=2, findings_per_target=5, seed=i))
+        roots.append(root)
+    return roots
+
+
+def test_async_loader_matches_sync_loader_in_order(tmp_path: Path) -> None:
+    roots = _write_packs(tmp_path, 4)
+    packs = load_fixture_packs(roots, concurrency=2)
+    assert [p.findings for p in packs] == [load_fixture_pack(r).findings for r in roots]
+
+
+def test_async_loader_bounds_packs_in_flight(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    roots = _write_packs(tmp_path, 6)
+    real_load = read_json
+    lock = threading.Lock()
+    active: set[Path] = set()
+    peak = 0
+
+    def slow_load(path: Path) -> Any:
+        nonlocal peak
+        with lock:
+            active.add(path.parent)
+            peak = max(peak, len(active))
+        time.sleep(0.02)
+        try:
+            return real_load(path)
+        finally:
+            with lock:
+                active.discard(path.parent)
+
+    monkeypatch.setattr(fixtures_mod, "read_json", slow_load)
+    load_fixture_packs(roots, concurrency=2)
+    assert 1 <= peak <= 2
+
+
+def test_merge_rejects_duplicate_targets(tmp_path: Path) -> None:
+    root = _write_packs(tmp_path, 1)[0]
+    pack = load_fixture_pack(root)
+    with pytest.raises(ValueError, match="Duplicate target_id"):
+        merge_fixture_packs([pack, pack])
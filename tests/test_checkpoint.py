@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import assess_fixture_pack, build_coverage_aggregator
+from msb.scoring import checkpoint as ckpt
+from msb.scoring.assess import finding_penalty, posture_score_from_penalty
+from msb.scoring.profile import default_scoring_profile
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+class _Evicted(Exception):
+    pass
+
+
+def _evict_after(monkeypatch: pytest.MonkeyPatch, saves: int) -> None:
+    real = ckpt._write_state
+    calls = {"n": 0}
+
+    def write_state(path: Path, state: dict[str, object]) -> None:
+        if calls["n"] == saves:
+            raise _Evicted
+        calls["n"] += 1
+        real(path, state)
+
+    monkeypatch.setattr(ckpt, "_write_state", write_state)
+
+
+def test_resumed_run_matches_uninterrupted_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    assert len(pack.findings) > 4
+
+    uninterrupted, coverage = ckpt.assess_with_checkpoints(
+        pack, tmp_path / "a", fingerprint="fp", every=2
+    )
+    plain = assess_fixture_pack(pack)
+    expected = plain.model_dump(mode="json")
+    actual = uninterrupted.model_dump(mode="json")
+    expected.pop("assessed_at")
+    actual.pop("assessed_at")
+    assert actual == expected
+    plain_coverage = build_coverage_aggregator(plain.mapped_findings, plain.targets)
+    assert coverage.to_pivot_table() == plain_coverage.to_pivot_table()
+
+    with monkeypatch.context() as m:
+        _evict_after(m, saves=1)
+        with pytest.raises(_Evicted):
+            ckpt.assess_with_checkpoints(pack, tmp_path / "b", fingerprint="fp", every=2)
+    # Partial output written after the last checkpoint must not leak into the result.
+    with (tmp_path / "b" / ckpt.MAPPED_FILE).open("ab") as log:
+        log.write(b'{"truncated": ')
+
+    resumed, resumed_coverage = ckpt.assess_with_checkpoints(
+        pack, tmp_path / "b", fingerprint="fp", every=2
+    )
+    resumed_json = resumed.model_dump(mode="json")
+    resumed_json.pop("assessed_at")
+    assert resumed_json == actual
+    assert resumed_coverage.to_pivot_table() == coverage.to_pivot_table()
+    assert not list((tmp_path / "b").iterdir())
+
+
+def test_checkpoint_for_other_inputs_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    before = load_fixture_pack(FIXTURES / "before")
+    after = load_fixture_pack(FIXTURES / "after")
+    with monkeypatch.context() as m:
+        _evict_after(m, saves=1)
+        with pytest.raises(_Evicted):
+            ckpt.assess_with_checkpoints(before, tmp_path, fingerprint="before", every=2)
+
+    summary, _ = ckpt.assess_with_checkpoints(after, tmp_path, fingerprint="after", every=2)
+    assert summary.org == assess_fixture_pack(after).org
+
+
+def test_fingerprint_covers_file_contents_and_options(tmp_path: Path) -> None:
+    path = tmp_path / "findings.json"
+    path.write_text("[]", encoding="utf-8")
+    base = ckpt.fingerprint_inputs([path], scoring_mode="raw")
+    assert ckpt.fingerprint_inputs([path], scoring_mode="raw") == base
+    assert ckpt.fingerprint_inputs([path], scoring_mode="correlated") != base
+    path.write_text("[ ]", encoding="utf-8")
+    assert ckpt.fingerprint_inputs([path], scoring_mode="raw") != base
+
+
+def test_penalties_are_summed_target_by_target_in_pack_order() -> None:
+    # Float sums depend on order: scores must match a per-target walk of the pack exactly.
+    pack = load_fixture_pack(FIXTURES / "before")
+    summary = assess_fixture_pack(pack)
+    by_id = {mf.finding.finding_id: mf for mf in summary.mapped_findings}
+    profile = default_scoring_profile()
+    org_domain: dict[str, float] = {}
+    for target in pack.targets:
+        for f in pack.findings:
+            if f.target_id == target.target_id:
+                mf = by_id[f.finding_id]
+                org_domain[mf.domain] = org_domain.get(mf.domain, 0.0) + finding_penalty(
+                    mf, profile
+                )
+    assert summary.org.posture_score == posture_score_from_penalty(sum(org_domain.values()))
+    assert summary.org.posture_score == 57.5
+    assert [mf.finding.finding_id for mf in summary.mapped_findings] == sorted(
+        by_id, key=lambda fid: (by_id[fid].finding.target_id, fid)
+    )
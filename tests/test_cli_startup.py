@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import msb
+
+# Cumulative `python -X importtime` budget for `import msb.cli` (typer included). Importing the
+# CLI eagerly pulled in pydantic models, Jinja2 and rich at ~250ms; lazy wiring keeps it ~70ms.
+STARTUP_BUDGET_MS = 150.0
+HEAVY_MODULES = ("pydantic", "jinja2", "rich", "msb.models", "msb.reporting", "msb.scoring")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    src = str(Path(msb.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_cli_import_does_not_load_heavy_dependencies() -> None:
+    proc = _run(
+        f"import sys, msb.cli; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert proc.stdout.strip() == ""
+
+
+def test_cli_import_time_within_budget() -> None:
+    # Best of three to keep the check stable on noisy CI runners.
+    best_us = min(
+        _cumulative_import_us(_run("import msb.cli", "-X", "importtime").stderr, "msb.cli")
+        for _ in range(3)
+    )
+    assert best_us / 1000.0 <= STARTUP_BUDGET_MS
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from msb.io.columnar import write_backlog_parquet, write_mapped_findings_parquet
+from msb.io.fixtures import load_fixture_pack
+from msb.prioritization import backlog_and_roadmap_tables, build_backlog_records
+from msb.scoring import assess_fixture_pack
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_mapped_findings_are_typed_and_written_in_row_groups(tmp_path: Path) -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    assert write_mapped_findings_parquet(tmp_path, summary.mapped_findings, row_group_size=4) == 6
+
+    findings = pq.ParquetFile(tmp_path / "mapped_findings.parquet")
+    assert findings.metadata.num_row_groups == 2
+    schema = findings.schema_arrow
+    assert schema.field("risk_score").type == pa.float64()
+    assert pa.types.is_dictionary(schema.field("domain").type)
+    assert pa.types.is_timestamp(schema.field("detected_at").type)
+
+    table = pq.read_table(
+        tmp_path / "mapped_findings.parquet", columns=["finding_id", "risk_score"]
+    )
+    assert table.column_names == ["finding_id", "risk_score"]
+    assert table.column("risk_score").to_pylist() == [
+        mf.risk_score for mf in summary.mapped_findings
+    ]
+
+    controls = pq.read_table(tmp_path / "finding_controls.parquet")
+    assert controls.num_rows == sum(len(mf.controls) for mf in summary.mapped_findings)
+    assert pa.types.is_dictionary(controls.schema.field("control_id").type)
+
+
+def test_backlog_parquet_keeps_csv_order_with_numeric_scores(tmp_path: Path) -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    records = build_backlog_records(summary.mapped_findings)
+    backlog, _ = backlog_and_roadmap_tables(records)
+    write_backlog_parquet(tmp_path / "backlog.parquet", records)
+
+    table = pq.read_table(tmp_path / "backlog.parquet")
+    csv_col = backlog.headers.index("priority_score")
+    assert table.column("item_id").to_pylist() == [row[0] for row in backlog.rows]
+    assert [f"{v:.3f}" for v in table.column("priority_score").to_pylist()] == [
+        row[csv_col] for row in backlog.rows
+    ]
+    assert table.schema.field("quick_win").type == pa.bool_()
+    assert table.column("quick_win").to_pylist() == [
+        row[backlog.headers.index("quick_win")] == "yes" for row in backlog.rows
+    ]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import gzip
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.io.artifacts import (
+    find_artifact,
+    open_text,
+    read_json,
+    read_text,
+    with_codec_suffix,
+    write_csv,
+    write_json,
+)
+from msb.io.fixtures import load_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _codecs() -> list[str]:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return ["gzip"]
+    return ["gzip", "zstd"]
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_json_and_csv_round_trip_through_codec(tmp_path: Path, codec: str) -> None:
+    obj = {"b": [1, 2.5, None], "a": "ünïcode"}
+    json_path = with_codec_suffix(tmp_path / "summary.json", codec)
+    write_json(json_path, obj)
+    assert read_json(json_path) == obj
+
+    csv_path = with_codec_suffix(tmp_path / "table.csv", codec)
+    write_csv(csv_path, [["x,y", "1"], ["z", "2"]], ["name", "value"], level=1)
+    assert read_text(csv_path) == 'name,value\n"x,y",1\nz,2\n'
+
+    # Plain readers see compressed bytes, not the text.
+    assert json_path.read_bytes()[:1] != b"{"
+
+
+def test_gzip_output_is_deterministic_and_honours_explicit_codec(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    write_json(a, {"k": 1}, compression="gzip")
+    write_json(b, {"k": 1}, compression="gzip")
+    assert a.read_bytes() == b.read_bytes()
+    assert gzip.decompress(a.read_bytes()) == b'{\n  "k": 1\n}\n'
+    # Reading sniffs magic bytes, so the misleading name does not matter.
+    assert read_json(a) == {"k": 1}
+
+
+def test_with_codec_suffix_and_find_artifact(tmp_path: Path) -> None:
+    assert with_codec_suffix(tmp_path / "x.csv", None) == tmp_path / "x.csv"
+    assert with_codec_suffix(tmp_path / "x.csv.gz", "gzip") == tmp_path / "x.csv.gz"
+    with pytest.raises(ValueError, match="Unknown compression"):
+        with_codec_suffix(tmp_path / "x.csv", "brotli")
+    with (
+        pytest.raises(ValueError, match="Unknown compression"),
+        open_text(tmp_path / "x.csv", "w", compression="brotli"),
+    ):
+        pass
+
+    assert find_artifact(tmp_path / "x.csv") == tmp_path / "x.csv"
+    write_text_path = tmp_path / "x.csv.gz"
+    write_csv(write_text_path, [], ["h"])
+    assert find_artifact(tmp_path / "x.csv") == write_text_path
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_fixture_pack_loads_from_compressed_files(tmp_path: Path, codec: str) -> None:
+    pack_dir = tmp_path / "pack"
+    pack_dir.mkdir()
+    for name in ("targets.json", "findings.json"):
+        write_json(with_codec_suffix(pack_dir / name, codec), read_json(FIXTURES / "before" / name))
+    assert load_fixture_pack(pack_dir) == load_fixture_pack(FIXTURES / "before")
+
+
+def test_cli_pipeline_reads_its_own_compressed_outputs(tmp_path: Path) -> None:
+    runner = CliRunner()
+    for side in ("before", "after"):
+        shutil.copytree(FIXTURES / side, tmp_path / "fx" / side)
+        pack = tmp_path / "fx" / side
+        for name in ("targets.json", "findings.json"):
+            write_json(pack / f"{name}.gz", read_json(pack / name))
+            (pack / name).unlink()
+        result = runner.invoke(
+            app,
+            ["assess", "--input", str(pack), "--out", str(tmp_path / side), "--compress", "gzip"],
+        )
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / side / "summary.json.gz").exists()
+        assert not (tmp_path / side / "summary.json").exists()
+
+    cmp = tmp_path / "cmp"
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            "--before",
+            str(tmp_path / "before" / "summary.json.gz"),
+            "--after",
+            str(tmp_path / "after" / "summary.json.gz"),
+            "--out",
+            str(cmp),
+            "--compress",
+            "gzip",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    plan = runner.invoke(
+        app,
+        [
+            "plan",
+            "--input",
+            str(tmp_path / "after" / "summary.json.gz"),
+            "--out",
+            str(cmp),
+            "--compress",
+            "gzip",
+        ],
+    )
+    assert plan.exit_code == 0, plan.output
+    assert (cmp / "remediation_backlog.csv.gz").exists()
+    report = runner.invoke(app, ["report", "--input", str(cmp), "--out", str(tmp_path / "rep")])
+    assert report.exit_code == 0, report.output
+    assert "F-006" in (tmp_path / "rep" / "report.md").read_text(encoding="utf-8")
+
+    bad = runner.invoke(
+        app,
+        [
+            "compare",
+            "--before",
+            str(tmp_path / "before" / "summary.json.gz"),
+            "--after",
+            str(tmp_path / "after" / "summary.json.gz"),
+            "--out",
+            str(cmp),
+            "--compress",
+            "lz4",
+        ],
+    )
+    assert bad.exit_code == 2
+    assert "--compress" in bad.output
+
+
+@pytest.mark.parametrize(
+    ("flags", "message"),
+    [
+        (["--compress", "gzip", "--compress-level", "12"], "gzip level must be 1-9"),
+        (["--compress", "zstd", "--compress-level", "0"], "zstd level must be 1-22"),
+        (["--compress-level", "3"], "requires --compress"),
+    ],
+)
+def test_cli_rejects_invalid_compress_levels(
+    tmp_path: Path, flags: list[str], message: str
+) -> None:
+    out = tmp_path / "out"
+    result = CliRunner().invoke(
+        app, ["assess", "--input", str(FIXTURES / "before"), "--out", str(out), *flags]
+    )
+    assert result.exit_code == 2
+    assert "--compress-level" in result.output and message in result.output
+    assert not out.exists() or not any(out.iterdir())
+
+
+def test_failed_write_keeps_the_previous_artifact(tmp_path: Path) -> None:
+    path = tmp_path / "summary.json.gz"
+    write_json(path, {"v": 1})
+    with pytest.raises(ValueError, match="level"):
+        write_json(path, {"v": 2}, level=12)
+    with pytest.raises(TypeError):
+        write_json(path, {"v": object()})
+    assert read_json(path) == {"v": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["summary.json.gz"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from msb.io.fixtures import FixturePack, load_fixture_pack
+from msb.models import ScoringMode
+from msb.scoring import assess_fixture_pack, finding_signature
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _replicated_pack(copies: int) -> FixturePack:
+    """The `before` pack cloned onto `copies` targets per original target."""
+    base = load_fixture_pack(FIXTURES / "before")
+    targets = []
+    findings = []
+    for i in range(copies):
+        for t in base.targets:
+            targets.append(t.model_copy(update={"target_id": f"{t.target_id}-{i}"}))
+        for f in base.findings:
+            findings.append(
+                f.model_copy(
+                    update={
+                        "target_id": f"{f.target_id}-{i}",
+                        "finding_id": f"{f.finding_id}-{i}",
+                        # Instance-specific numbers must not split the cluster.
+                        "title": f"{f.title} (account {100000 + i})",
+                    }
+                )
+            )
+    return FixturePack(targets=targets, findings=findings)
+
+
+def test_signature_ignores_case_whitespace_and_digits() -> None:
+    finding = load_fixture_pack(FIXTURES / "before").findings[0]
+    noisy = finding.model_copy(update={"title": "  " + finding.title.upper() + "  42 "})
+    plain = finding.model_copy(update={"title": finding.title + " 7"})
+    assert finding_signature(noisy) == finding_signature(plain)
+
+    other = finding.model_copy(update={"evidence": {"signal": "something_else=true"}})
+    assert finding_signature(other) != finding_signature(finding)
+
+
+def test_correlated_mode_charges_repeated_findings_once() -> None:
+    base = load_fixture_pack(FIXTURES / "before")
+    pack = _replicated_pack(5)
+
+    raw = assess_fixture_pack(pack)
+    correlated = assess_fixture_pack(pack, scoring_mode=ScoringMode.correlated)
+
+    assert raw.scoring_mode == ScoringMode.raw
+    assert raw.correlated_findings == []
+    assert correlated.scoring_mode == ScoringMode.correlated
+    assert len(correlated.correlated_findings) == len(base.findings)
+    for cluster in correlated.correlated_findings:
+        assert len(cluster.target_ids) == 5
+        assert len(cluster.finding_ids) == 5
+        assert cluster.canonical_finding_id in cluster.finding_ids
+
+    # Per-target scores are unaffected; the org score matches a single copy of the estate.
+    assert [t.posture_score for t in raw.targets] == [t.posture_score for t in correlated.targets]
+    assert correlated.org.posture_score > raw.org.posture_score
+    single = assess_fixture_pack(base)
+    assert abs(correlated.org.posture_score - single.org.posture_score) < 1e-9
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import CoverageAggregator, assess_fixture_pack, build_coverage_aggregator
+
+
+def test_sharded_coverage_merges_to_single_pass_result() -> None:
+    root = Path(__file__).resolve().parents[1]
+    assessment = assess_fixture_pack(load_fixture_pack(root / "fixtures" / "before"))
+    mapped = assessment.mapped_findings
+
+    single = build_coverage_aggregator(mapped, assessment.targets)
+
+    merged = CoverageAggregator()
+    for shard in (mapped[:2], mapped[2:4], mapped[4:]):
+        merged.merge(build_coverage_aggregator(shard, assessment.targets))
+
+    assert merged.to_table() == single.to_table()
+    assert merged.to_pivot_table() == single.to_pivot_table()
+
+
+def test_pivot_breakdowns_sum_to_org_totals() -> None:
+    root = Path(__file__).resolve().parents[1]
+    assessment = assess_fixture_pack(load_fixture_pack(root / "fixtures" / "after"))
+    pivot = build_coverage_aggregator(
+        assessment.mapped_findings, assessment.targets
+    ).to_pivot_table()
+
+    assert pivot.headers[:3] == ["framework", "control_theme", "finding_count"]
+    for dimension in ("provider", "environment", "target"):
+        cols = [i for i, h in enumerate(pivot.headers) if h.startswith(f"{dimension}:")]
+        assert cols
+        for row in pivot.rows:
+            assert sum(int(row[i]) for i in cols) == int(row[2])
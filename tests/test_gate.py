@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.gate import GateExit, evaluate_gate, parse_condition
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import assess_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_gate_values_match_full_assessment() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    target = summary.targets[0]
+    domain = summary.org.domain_maturity[0]
+    conditions = [
+        parse_condition("org.posture >= 0"),
+        parse_condition(f"target.{target.target_id}.posture >= 0"),
+        parse_condition(f"domain.{domain.domain}.posture >= 0"),
+        parse_condition("count.total >= 0"),
+        parse_condition("count.severity.high >= 0"),
+    ]
+    result = evaluate_gate(FIXTURES / "before", conditions)
+    assert result.passed and not result.early_exit
+    values = [r.value for r in result.conditions]
+    high = sum(1 for mf in summary.mapped_findings if mf.finding.severity.value == "high")
+    assert values == pytest.approx(
+        [
+            summary.org.posture_score,
+            target.posture_score,
+            domain.posture_0_to_100,
+            len(summary.mapped_findings),
+            high,
+        ]
+    )
+
+
+def test_gate_stops_at_first_certain_failure() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    result = evaluate_gate(
+        FIXTURES / "before",
+        [parse_condition("count.total < 2"), parse_condition("org.posture >= 10")],
+    )
+    assert not result.passed and result.early_exit
+    assert result.findings_scanned == 2 < len(pack.findings)
+    assert [r.passed for r in result.conditions] == [False, None]
+
+    full = evaluate_gate(FIXTURES / "before", [parse_condition("count.total < 2")], fail_fast=False)
+    assert full.findings_scanned == len(pack.findings) and not full.early_exit
+
+
+def test_certainty_follows_monotonic_direction() -> None:
+    posture = parse_condition("org.posture == 50")
+    assert posture.certainly_fails(49.0) and not posture.certainly_fails(51.0)
+    count = parse_condition("count.severity.critical <= 0")
+    assert count.certainly_fails(1.0) and not count.certainly_holds(0.0)
+    assert parse_condition("count.total >= 3").certainly_holds(3.0)
+    assert not parse_condition("org.posture <= 50").can_fail_early
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["org.posture >= ", "domain.Nope.posture > 1", "count.severity.urgent == 0", "x.y == 1"],
+)
+def test_invalid_conditions_are_rejected(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_condition(text)
+
+
+def test_cli_exit_codes() -> None:
+    runner = CliRunner()
+    base = ["gate", "--input", str(FIXTURES / "after")]
+    passed = runner.invoke(app, [*base, "-r", "org.posture >= 70", "--json"])
+    assert passed.exit_code == GateExit.passed
+    assert json.loads(passed.stdout)["passed"] is True
+
+    failed = runner.invoke(app, [*base, "-r", "count.severity.high == 0"])
+    assert failed.exit_code == GateExit.failed
+    assert runner.invoke(app, [*base, "-r", "org.score > 1"]).exit_code == GateExit.usage_error
+    unknown = runner.invoke(app, [*base, "-r", "target.nope.posture > 1"])
+    assert unknown.exit_code == GateExit.input_error
+
+
+def test_gate_threshold_at_the_exact_org_score() -> None:
+    # The pack interleaves targets; the gate must still add penalties in assessment order.
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    threshold = summary.org.posture_score
+    domain = summary.org.domain_maturity[0]
+    result = evaluate_gate(
+        FIXTURES / "before",
+        [
+            parse_condition(f"org.posture >= {threshold}"),
+            parse_condition(f"domain.{domain.domain}.posture >= {domain.posture_0_to_100}"),
+        ],
+    )
+    assert result.passed
+    assert [r.value for r in result.conditions] == [threshold, domain.posture_0_to_100]
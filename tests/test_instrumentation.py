@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import logging
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import assess_fixture_pack, build_coverage_aggregator
+from msb.utils.instrumentation import span, start_collecting, stop_collecting
+from msb.utils.logging import _JsonFormatter
+
+
+def test_span_event_is_emitted_as_structured_json(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO, logger="msb.perf"), span("unit", stage_kind="test") as s:
+        s.records = 10
+
+    record = next(r for r in caplog.records if r.name == "msb.perf")
+    payload = json.loads(_JsonFormatter().format(record))
+    event = payload["event"]
+    assert event["span"] == "unit"
+    assert event["records"] == 10
+    assert event["stage_kind"] == "test"
+    assert event["seconds"] >= 0.0
+    assert "records_per_s" in event
+
+
+def test_pipeline_stages_are_collected() -> None:
+    root = Path(__file__).resolve().parents[1]
+    collector = start_collecting()
+    try:
+        pack = load_fixture_pack(root / "fixtures" / "before")
+        assessment = assess_fixture_pack(pack)
+        build_coverage_aggregator(assessment.mapped_findings, assessment.targets)
+    finally:
+        stop_collecting()
+
+    names = [s.name for s in collector.spans]
+    assert names == ["load", "validate", "map", "score", "coverage"]
+    assert all(s.records == len(pack.findings) for s in collector.spans if s.name != "load")
+    assert len(collector.summary_rows()) == len(names)
+
+
+def test_nested_span_keeps_the_enclosing_traced_peak() -> None:
+    tracemalloc.start()
+    try:
+        with span("outer") as outer:
+            block = bytearray(8 * 1024 * 1024)
+            del block
+            with span("inner") as inner:
+                pass
+    finally:
+        tracemalloc.stop()
+
+    assert inner.traced_peak_mb is not None
+    assert outer.traced_peak_mb is not None and outer.traced_peak_mb >= 8
+
+
+def test_span_keeps_the_traced_peak_read_outside_any_span() -> None:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        block = bytearray(16 * 1024 * 1024)
+        del block
+        with span("after the transient"):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak >= 16 * 1024 * 1024
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from pathlib import Path
 
-from msb.mappings import map_finding
+from msb.io.fixtures import load_fixture_pack
+from msb.mappings import (
+    Framework,
+    map_finding,
+    map_finding_controls,
+    register_framework,
+    resolve_frameworks,
+    unregister_framework,
+)
 from msb.models import Effort, Finding, FindingCategory, Rating, RecommendedAction, Severity
+from msb.scoring import assess_fixture_pack, compute_controls_coverage
 
 
 def test_map_finding_iam_contains_expected_themes() -> None:
@@ -39,3 +49,31 @@ def test_map_finding_iam_contains_expected_themes() -> None:
     assert any(m.function == "Protect" for m in nist)
     assert any("PR.AC" in m.category for m in nist)
     assert any(m.theme_id == "A.5" for m in iso)
+
+
+def test_registered_framework_is_mapped_and_counted_in_coverage() -> None:
+    root = Path(__file__).resolve().parents[1]
+    register_framework(
+        Framework(
+            key="unit",
+            label="Unit Framework",
+            load=lambda: (
+                {"IAM": [{"control_id": "U-1", "control_name": "Access", "rationale": "x"}]},
+                [{"control_id": "U-0", "control_name": "Other", "rationale": "x"}],
+            ),
+        )
+    )
+    try:
+        pack = load_fixture_pack(root / "fixtures" / "before")
+        iam = next(f for f in pack.findings if f.category == FindingCategory.iam)
+        controls = map_finding_controls(iam, resolve_frameworks(["nist_csf", "unit"]))
+        assert {c.framework for c in controls} == {"nist_csf", "unit"}
+        assert [c.control_id for c in controls if c.framework == "unit"] == ["U-1"]
+
+        assessment = assess_fixture_pack(pack)
+        rows = compute_controls_coverage(assessment.mapped_findings).rows
+        unit_rows = {r[1]: int(r[2]) for r in rows if r[0] == "Unit Framework"}
+        assert sum(unit_rows.values()) == len(assessment.mapped_findings)
+        assert "U-1 | Access" in unit_rows
+    finally:
+        unregister_framework("unit")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from msb.io.fixtures import load_fixture_pack
+from msb.mappings import MappingRule, compile_rules, default_rule_set
+from msb.models import ControlMapping, Finding, FindingCategory
+
+
+def _brute_force(rules: list[MappingRule], finding: Finding) -> list[str]:
+    return [
+        r.rule_id
+        for r in rules
+        if r.category == finding.category
+        and set(r.tags) <= set(finding.tags)
+        and all(k in finding.evidence for k in r.evidence_keys)
+        and all(finding.evidence.get(k) == v for k, v in r.evidence.items())
+    ]
+
+
+def test_compiled_rules_match_brute_force_evaluation() -> None:
+    root = Path(__file__).resolve().parents[1]
+    base = load_fixture_pack(root / "fixtures" / "before").findings[0]
+    rng = random.Random(7)
+    tags = [f"t{i}" for i in range(12)]
+    values = ["on", "off", "partial"]
+    categories = list(FindingCategory)
+
+    rules = [
+        MappingRule(
+            rule_id=f"R-{i}",
+            category=rng.choice(categories),
+            tags=rng.sample(tags, rng.randint(0, 3)),
+            evidence={f"k{j}": rng.choice(values) for j in rng.sample(range(4), rng.randint(0, 1))},
+            evidence_keys=[f"k{j}" for j in rng.sample(range(4), rng.randint(0, 1))],
+            controls=[
+                ControlMapping(
+                    framework="nist_csf", control_id="Protect", control_name=f"C{i}", rationale="x"
+                )
+            ],
+        )
+        for i in range(500)
+    ]
+    compiled = compile_rules(rules)
+    assert len(compiled) == 500
+
+    for _ in range(300):
+        finding = base.model_copy(
+            update={
+                "category": rng.choice(categories),
+                "tags": rng.sample(tags, rng.randint(0, 6)),
+                "evidence": {
+                    f"k{j}": rng.choice(values) for j in rng.sample(range(4), rng.randint(0, 4))
+                },
+            }
+        )
+        assert [r.rule_id for r in compiled.match(finding)] == _brute_force(rules, finding)
+
+
+def test_packaged_rules_refine_mapping_by_tags_and_evidence() -> None:
+    root = Path(__file__).resolve().parents[1]
+    findings = {f.finding_id: f for f in load_fixture_pack(root / "fixtures" / "before").findings}
+    rules = default_rule_set()
+
+    iam = next(f for f in findings.values() if f.category == FindingCategory.iam)
+    assert {r.rule_id for r in rules.match(iam)} == {"iam-mfa", "iam-privileged"}
+
+    kms = next(f for f in findings.values() if f.category == FindingCategory.data_protection)
+    assert [r.rule_id for r in rules.match(kms)] == ["kms-rotation-off"]
+    assert rules.match(kms.model_copy(update={"evidence": {"signal": "rotation=on"}})) == []
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from msb.compare import compare_partitioned_summaries, compare_summaries
+from msb.io.fixtures import load_fixture_pack
+from msb.io.partitioned import (
+    read_partitioned_summary,
+    read_summary_index,
+    read_target_shards,
+    write_partitioned_summary,
+)
+from msb.models import AssessmentSummary
+from msb.scoring import assess_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _assess(name: str) -> AssessmentSummary:
+    return assess_fixture_pack(load_fixture_pack(FIXTURES / name))
+
+
+def test_partitioned_round_trip_and_selective_reads(tmp_path: Path) -> None:
+    summary = _assess("before")
+    index = write_partitioned_summary(tmp_path, summary)
+    assert [r.target_id for r in index.targets] == [t.target_id for t in summary.targets]
+    assert read_summary_index(tmp_path) == index
+
+    full = read_partitioned_summary(tmp_path)
+    assert sorted(full.mapped_findings, key=lambda mf: mf.finding.finding_id) == sorted(
+        summary.mapped_findings, key=lambda mf: mf.finding.finding_id
+    )
+    assert full.model_dump(exclude={"mapped_findings"}) == summary.model_dump(
+        exclude={"mapped_findings"}
+    )
+
+    wanted = summary.targets[1].target_id
+    # Other shards are never opened: deleting them must not matter.
+    for ref in index.targets:
+        if ref.target_id != wanted:
+            (tmp_path / ref.path).unlink()
+    (shard,) = read_target_shards(tmp_path, [wanted])
+    assert shard.target == summary.targets[1]
+    assert {mf.finding.target_id for mf in shard.mapped_findings} <= {wanted}
+
+    with pytest.raises(ValueError, match="Unknown target_id"):
+        list(read_target_shards(tmp_path, ["nope"]))
+
+
+def test_partitioned_compare_matches_monolithic_and_drills_down(tmp_path: Path) -> None:
+    before, after = _assess("before"), _assess("after")
+    write_partitioned_summary(tmp_path / "b", before)
+    write_partitioned_summary(tmp_path / "a", after)
+
+    target = before.targets[0].target_id
+    result = compare_partitioned_summaries(tmp_path / "b", tmp_path / "a", targets=[target])
+    expected = compare_summaries(before.model_dump(mode="json"), after.model_dump(mode="json"))
+    assert result["org"] == expected["org"]
+
+    rows = {r["target_id"]: r for r in result["targets"]}
+    for t in before.targets:
+        a = next(x for x in after.targets if x.target_id == t.target_id)
+        assert rows[t.target_id]["delta"] == pytest.approx(a.posture_score - t.posture_score)
+
+    detail = result["target_detail"][target]
+    b_ids = {
+        mf.finding.finding_id for mf in before.mapped_findings if mf.finding.target_id == target
+    }
+    a_ids = {
+        mf.finding.finding_id for mf in after.mapped_findings if mf.finding.target_id == target
+    }
+    assert [f["finding_id"] for f in detail["resolved_findings"]] == sorted(b_ids - a_ids)
+    assert [f["finding_id"] for f in detail["new_findings"]] == sorted(a_ids - b_ids)
+
+
+def test_unchanged_targets_are_detected_from_the_index(tmp_path: Path) -> None:
+    summary = _assess("before")
+    write_partitioned_summary(tmp_path / "one", summary)
+    write_partitioned_summary(tmp_path / "two", summary)
+    result = compare_partitioned_summaries(tmp_path / "one", tmp_path / "two")
+    assert not any(r["changed"] for r in result["targets"])
+    assert "target_detail" not in result
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
 
+from typer.testing import CliRunner
+
+from msb.cli import app
 from msb.models import (
     Effort,
     Finding,
@@ -13,7 +19,17 @@ from msb.models import (
     RecommendedAction,
     Severity,
 )
-from msb.prioritization import build_backlog_and_roadmap
+from msb.prioritization import (
+    RoadmapBuilder,
+    backlog_and_roadmap_tables,
+    build_backlog_and_roadmap,
+    build_backlog_records,
+    iter_backlog_rows,
+    spill_backlog_records,
+)
+from msb.scoring import assess_fixture_pack
+from msb.synthetic import SyntheticPackConfig, generate_fixture_pack
+from msb.utils.extsort import ExternalSorter
 
 
 def _mapped_finding(
@@ -73,3 +89,82 @@ def test_prioritization_orders_by_priority_score_then_stable_id() -> None:
     assert item_ids[0] in {"F-1:A", "F-3:A"}
     assert item_ids[1] in {"F-1:A", "F-3:A"}
     assert item_ids[0] < item_ids[1]
+
+
+def test_external_sort_matches_in_memory_sort_with_ties(tmp_path: Path) -> None:
+    records = [
+        {"item_id": f"I-{i % 7}", "priority_score": float(i % 5) / 3, "n": i} for i in range(500)
+    ]
+
+    def key(r: dict[str, Any]) -> tuple[float, str]:
+        return -r["priority_score"], r["item_id"]
+
+    # A tiny budget and fan-in force many runs and a multi-pass merge.
+    with ExternalSorter(key, memory_budget=2048, tmp_dir=tmp_path, fan_in=3) as sorter:
+        sorter.extend(records)
+        assert sorter.runs > 3
+        spilled = sorter.spilled_runs
+        assert list(sorter) == sorted(records, key=key)
+        assert list(sorter) == sorted(records, key=key)
+        # Merging leaves at most fan_in runs on disk but does not change what was spilled.
+        assert sorter.runs <= 3
+        assert sorter.spilled_runs in {spilled, spilled + 1}
+        assert sorter.spilled_runs > 3
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spilled_backlog_is_identical_to_in_memory_backlog(tmp_path: Path) -> None:
+    pack = generate_fixture_pack(SyntheticPackConfig(targets=5, findings_per_target=40, seed=2))
+    mapped = assess_fixture_pack(pack).mapped_findings
+    backlog, roadmap = backlog_and_roadmap_tables(build_backlog_records(mapped))
+
+    with spill_backlog_records(mapped, memory_budget=16_384, spill_dir=tmp_path) as records:
+        assert records.runs > 1
+        spilled_roadmap = RoadmapBuilder()
+        assert list(iter_backlog_rows(records, spilled_roadmap)) == backlog.rows
+    assert spilled_roadmap.table() == roadmap
+
+
+def test_cli_plan_spills_to_disk(tmp_path: Path) -> None:
+    summary = tmp_path / "summary.json"
+    # About 2,400 backlog items: well past one 1 MB sort run.
+    pack = generate_fixture_pack(SyntheticPackConfig(targets=3, findings_per_target=400, seed=4))
+    summary.write_text(assess_fixture_pack(pack).model_dump_json(), encoding="utf-8")
+    runner = CliRunner()
+    base = ["plan", "--input", str(summary)]
+    assert runner.invoke(app, [*base, "--out", str(tmp_path / "a")]).exit_code == 0
+    result = runner.invoke(
+        app,
+        [
+            *base,
+            "--out",
+            str(tmp_path / "b"),
+            "--sort-memory-mb",
+            "1",
+            "--spill-dir",
+            str(tmp_path / "s"),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    runs = re.search(r"(\d+)\s+sorted\s+runs\s+spilled", result.output)
+    assert runs is not None and int(runs.group(1)) > 1, result.output
+    for name in ("remediation_backlog.csv", "roadmap.csv"):
+        assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+    assert list((tmp_path / "s").iterdir()) == []
+
+    # Rejected before the summary is read, so a bad --input is never reached.
+    result = runner.invoke(
+        app,
+        [
+            "plan",
+            "--input",
+            str(tmp_path / "a" / "roadmap.csv"),
+            "--out",
+            str(tmp_path / "c"),
+            "--spill-dir",
+            str(tmp_path),
+        ],
+    )
+    assert result.exit_code == 2
+    assert "--sort-memory-mb" in result.output
+    assert not (tmp_path / "c").exists()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+from msb.io.fixtures import load_fixture_pack
+from msb.scoring import assess_fixture_pack
+from msb.utils.profiling import finish_profiling, note_output_dir, start_profiling
+
+
+def test_profile_session_writes_pstats_and_collapsed_stacks(tmp_path: Path) -> None:
+    root = Path(__file__).resolve().parents[1]
+    start_profiling(sample_interval=0.001)
+    note_output_dir(tmp_path)
+    for _ in range(20):
+        assess_fixture_pack(load_fixture_pack(root / "fixtures" / "before"))
+    session = finish_profiling()
+
+    assert session is not None
+    assert session.output_dir == tmp_path
+    pstats_path, collapsed_path = session.write(tmp_path, "msb-unit.profile")
+
+    stats = pstats.Stats(str(pstats_path))
+    assert any(func == "assess_fixture_pack" for (_, _, func) in stats.stats)  # type: ignore[attr-defined]
+
+    lines = collapsed_path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        _, count = line.rsplit(" ", 1)
+        assert int(count) >= 1
+    assert any("test_profiling.py:" in line for line in lines)
+
+    hot = session.hot_functions(5)
+    assert len(hot) == 5
+    assert hot[0].self_seconds >= hot[-1].self_seconds
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.compare import compare_summaries
+from msb.io.fixtures import load_fixture_pack
+from msb.io.partitioned import read_partitioned_summary, write_partitioned_summary
+from msb.models import AssessmentSummary
+from msb.reporting import render_markdown_report
+from msb.scoring import RollupAggregate, assess_fixture_pack, parse_rollup
+from msb.scoring.assess import posture_score_from_penalty
+from msb.scoring.rollup import UNLABELLED
+from msb.synthetic import SyntheticPackConfig, generate_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+SPECS = [
+    parse_rollup("provider/environment"),
+    parse_rollup("owner"),
+    parse_rollup("label.business_unit/label.account"),
+]
+
+
+def _assess(targets: int = 24, seed: int = 0) -> AssessmentSummary:
+    pack = generate_fixture_pack(
+        SyntheticPackConfig(targets=targets, findings_per_target=5, seed=seed)
+    )
+    return assess_fixture_pack(pack, rollups=SPECS)
+
+
+def test_parse_rollup_validates_levels() -> None:
+    assert parse_rollup("label.bu / label.account").levels == ("label.bu", "label.account")
+    for bad in ("team", "label.", "provider/provider", ""):
+        with pytest.raises(ValueError):
+            parse_rollup(bad)
+
+
+def test_every_level_is_the_merge_of_its_children() -> None:
+    summary = _assess()
+    assert [r.name for r in summary.rollups] == [s.name for s in SPECS]
+    by_target = {t.target_id: t for t in summary.targets}
+    for rollup in summary.rollups:
+        groups = {tuple(g.path): g for g in rollup.groups}
+        assert [g.path for g in rollup.groups] == sorted(g.path for g in rollup.groups)
+        for path, group in groups.items():
+            children = [g for p, g in groups.items() if len(p) == len(path) + 1 and p[:-1] == path]
+            if not children:
+                continue
+            merged = RollupAggregate()
+            for child in children:
+                merged.merge(RollupAggregate.from_group(child))
+            assert merged.finding_count == group.finding_count
+            assert merged.target_count == group.target_count
+            assert merged.penalty == pytest.approx(group.penalty)
+            assert merged.min_target_posture == group.min_target_posture
+
+        top = [g for p, g in groups.items() if len(p) == 1]
+        assert sum(g.target_count for g in top) == len(by_target)
+        assert sum(g.finding_count for g in top) == len(summary.mapped_findings)
+        # In raw mode the top level re-merges into the org score.
+        org = RollupAggregate()
+        for g in top:
+            org.merge(RollupAggregate.from_group(g))
+        assert posture_score_from_penalty(org.penalty) == pytest.approx(summary.org.posture_score)
+
+    provider = summary.rollups[0]
+    aws = next(g for g in provider.groups if g.path == ["aws"])
+    aws_targets = [t for t in summary.targets if t.provider.value == "aws"]
+    assert aws.target_count == len(aws_targets)
+    assert aws.min_target_posture == min(t.posture_score for t in aws_targets)
+    assert aws.posture_sum == pytest.approx(sum(t.posture_score for t in aws_targets))
+
+
+def test_missing_labels_group_as_unlabelled() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    summary = assess_fixture_pack(pack, rollups=[parse_rollup("label.business_unit")])
+    [group] = summary.rollups[0].groups
+    assert group.path == [UNLABELLED]
+    assert group.target_count == len(pack.targets)
+
+
+def test_compare_and_report_drill_down_from_stored_rollups(tmp_path: Path) -> None:
+    before, after = _assess(seed=0), _assess(seed=1)
+    # Rollups survive the partitioned layout, so either form can be compared.
+    write_partitioned_summary(tmp_path / "before", before)
+    assert read_partitioned_summary(tmp_path / "before").rollups == before.rollups
+
+    comparison = compare_summaries(before.model_dump(mode="json"), after.model_dump(mode="json"))
+    rollups = {r["name"]: r for r in comparison["rollups"]}
+    assert set(rollups) == {s.name for s in SPECS}
+    rows = rollups["provider/environment"]["groups"]
+    aws_prod = next(r for r in rows if r["path"] == ["aws", "prod"])
+    assert aws_prod["level"] == "environment"
+    b = next(g for g in before.rollups[0].groups if g.path == ["aws", "prod"])
+    a = next(g for g in after.rollups[0].groups if g.path == ["aws", "prod"])
+    assert aws_prod["delta"] == pytest.approx(a.posture_score - b.posture_score)
+    assert aws_prod["mean_target_after"] == pytest.approx(a.posture_sum / a.target_count)
+
+    md = render_markdown_report(
+        title="t",
+        author=None,
+        compare_obj=comparison,
+        remediation_backlog_csv_path=tmp_path / "missing.csv",
+        roadmap_csv_path=tmp_path / "missing.csv",
+        controls_coverage_csv_path=tmp_path / "missing.csv",
+    )
+    assert "### provider/environment" in md
+    assert "| aws / prod |" in md
+
+    plain = compare_summaries(
+        assess_fixture_pack(load_fixture_pack(FIXTURES / "before")).model_dump(mode="json"),
+        assess_fixture_pack(load_fixture_pack(FIXTURES / "after")).model_dump(mode="json"),
+    )
+    assert "rollups" not in plain
+
+
+def test_cli_assess_rejects_unknown_rollup_level(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        app,
+        [
+            "assess",
+            "--input",
+            str(FIXTURES / "before"),
+            "--out",
+            str(tmp_path),
+            "--rollup",
+            "team",
+        ],
+    )
+    assert result.exit_code == 2
+    assert "Unknown rollup level" in result.output
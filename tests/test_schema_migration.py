@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from msb.io import schema
+from msb.io.fixtures import load_fixture_pack
+from msb.io.jsonstream import iter_json_array
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+@pytest.fixture
+def legacy_schema(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # A hypothetical 0.9 format that named the asset list "assets" and had no tags.
+    def upgrade(obj: dict[str, Any]) -> dict[str, Any]:
+        out = {k: v for k, v in obj.items() if k != "assets"}
+        out["affected_assets"] = obj["assets"]
+        out.setdefault("tags", [])
+        return out
+
+    monkeypatch.setattr(schema, "_UPGRADES", {"0.9": (schema.CURRENT_FINDING_SCHEMA, upgrade)})
+    yield
+
+
+def _downgrade(obj: dict[str, Any]) -> dict[str, Any]:
+    out = {k: v for k, v in obj.items() if k not in ("affected_assets", "tags")}
+    out["assets"] = obj["affected_assets"]
+    out["schema_version"] = "0.9"
+    return out
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_json_array_matches_json_loads(chunk_size: int) -> None:
+    text = (FIXTURES / "before" / "findings.json").read_text(encoding="utf-8")
+    doc = json.loads(text)
+    streamed = list(iter_json_array(io.StringIO(text), "findings", chunk_size=chunk_size))
+    assert streamed == doc["findings"]
+
+    other = '{"meta": {"n": [1, 2]}, "findings": [1, 22, 333.5, -4e2, true, null]}'
+    assert list(iter_json_array(io.StringIO(other), chunk_size=chunk_size)) == [
+        1, 22, 333.5, -4e2, True, None,
+    ]  # fmt: skip
+    assert list(iter_json_array(io.StringIO(" [ ] "), None, chunk_size=chunk_size)) == []
+
+
+def test_iter_json_array_rejects_malformed_input() -> None:
+    with pytest.raises(ValueError, match="no 'findings' member"):
+        list(iter_json_array(io.StringIO('{"targets": []}')))
+    with pytest.raises(ValueError, match="end of JSON"):
+        list(iter_json_array(io.StringIO('{"findings": [1, 2'), chunk_size=3))
+    with pytest.raises(ValueError, match="Expected ','"):
+        list(iter_json_array(io.StringIO('{"findings": [1 2]}')))
+
+
+def test_migrate_streams_legacy_records_to_current_schema(
+    tmp_path: Path, legacy_schema: None
+) -> None:
+    current = json.loads((FIXTURES / "before" / "findings.json").read_text(encoding="utf-8"))
+    legacy = tmp_path / "findings.json"
+    legacy.write_text(
+        json.dumps({"findings": [_downgrade(f) for f in current["findings"]]}), encoding="utf-8"
+    )
+
+    stats = schema.migrate_findings_file(legacy, legacy, chunk_size=64)
+    assert (stats.records, stats.upgraded) == (len(current["findings"]), len(current["findings"]))
+    migrated = json.loads(legacy.read_text(encoding="utf-8"))["findings"]
+    assert [f["affected_assets"] for f in migrated] == [
+        f["affected_assets"] for f in current["findings"]
+    ]
+    assert {f["schema_version"] for f in migrated} == {schema.CURRENT_FINDING_SCHEMA}
+    assert not list(tmp_path.glob("*.migrating"))
+
+
+def test_loader_upgrades_legacy_records_on_the_fly(tmp_path: Path, legacy_schema: None) -> None:
+    current = json.loads((FIXTURES / "before" / "findings.json").read_text(encoding="utf-8"))
+    (tmp_path / "targets.json").write_bytes((FIXTURES / "before" / "targets.json").read_bytes())
+    (tmp_path / "findings.json").write_text(
+        json.dumps({"findings": [_downgrade(f) for f in current["findings"]]}), encoding="utf-8"
+    )
+    pack = load_fixture_pack(tmp_path)
+    expected = load_fixture_pack(FIXTURES / "before")
+    assert [f.affected_assets for f in pack.findings] == [
+        f.affected_assets for f in expected.findings
+    ]
+
+
+def test_unknown_schema_version_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"Unsupported finding schema_version '0\.1'"):
+        schema.upgrade_finding({"schema_version": "0.1", "finding_id": "F-1"})
+    src = tmp_path / "findings.json"
+    src.write_text('{"findings": [{"schema_version": "0.1"}]}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        schema.migrate_findings_file(src, tmp_path / "out.json")
+    assert not (tmp_path / "out.json").exists()
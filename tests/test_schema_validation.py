@@ -5,7 +5,14 @@ from pathlib import Path
 
 import pytest
 
-from msb.io.fixtures import load_fixture_pack
+from msb.io.fixtures import (
+    FixtureValidationError,
+    load_fixture_pack,
+    validate_finding_records,
+    validate_findings_json,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
 
 
 def test_fixture_pack_rejects_unknown_target_id(tmp_path: Path) -> None:
@@ -68,3 +75,32 @@ def test_fixture_pack_rejects_unknown_target_id(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="unknown target_id"):
         load_fixture_pack(root)
+
+
+@pytest.mark.parametrize("side", ["before", "after"])
+def test_json_fast_path_matches_record_by_record_validation(side: str) -> None:
+    text = (FIXTURES / side / "findings.json").read_text(encoding="utf-8")
+    assert validate_findings_json(text) == validate_finding_records(json.loads(text)["findings"])
+
+
+def test_invalid_findings_are_reported_together_with_indices(tmp_path: Path) -> None:
+    root = tmp_path / "pack"
+    root.mkdir()
+    (root / "targets.json").write_bytes((FIXTURES / "before" / "targets.json").read_bytes())
+    doc = json.loads((FIXTURES / "before" / "findings.json").read_text(encoding="utf-8"))
+    doc["findings"][1]["severity"] = "catastrophic"
+    del doc["findings"][3]["title"]
+    (root / "findings.json").write_text(json.dumps(doc), encoding="utf-8")
+
+    with pytest.raises(FixtureValidationError) as info:
+        load_fixture_pack(root)
+    err = info.value
+    assert err.total == len(doc["findings"])
+    assert [e.index for e in err.errors] == [1, 3]
+    assert [e.finding_id for e in err.errors] == [
+        doc["findings"][1]["finding_id"],
+        doc["findings"][3]["finding_id"],
+    ]
+    assert "severity" in err.errors[0].message
+    assert "title: Field required" in err.errors[1].message
+    assert str(err).startswith(f"2 of {err.total} findings failed validation: #1 (")
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.compare import compare_summaries
+from msb.io.fixtures import load_fixture_pack
+from msb.models import Effort, FindingCategory, Rating, Severity
+from msb.prioritization import build_backlog_and_roadmap
+from msb.scoring import (
+    ScoringProfile,
+    assess_fixture_pack,
+    compile_scoring_profile,
+    default_scoring_profile,
+    load_scoring_profile,
+)
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_compiled_table_matches_weight_product() -> None:
+    compiled = default_scoring_profile()
+    profile = compiled.profile
+    finding = load_fixture_pack(FIXTURES / "before").findings[0]
+    for sev, lik, imp, cat in itertools.product(Severity, Rating, Rating, FindingCategory):
+        f = finding.model_copy(
+            update={"severity": sev, "likelihood": lik, "impact": imp, "category": cat}
+        )
+        expected = (
+            profile.severity_weights[sev]
+            * profile.likelihood_weights[lik]
+            * profile.impact_weights[imp]
+            * profile.category_weights[cat]
+        )
+        assert compiled.risk(f) == expected
+    assert compiled.effort(Effort.medium) == 3
+
+
+def test_profile_file_overrides_defaults_and_is_validated(tmp_path: Path) -> None:
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps({"posture_normalization": 900}), encoding="utf-8")
+    compiled = load_scoring_profile(path)
+    assert compiled.posture_normalization == 900.0
+    assert compiled.profile.dependency_factor == 0.92
+    assert compiled.digest != default_scoring_profile().digest
+
+    with pytest.raises(ValidationError, match="missing"):
+        ScoringProfile.model_validate({"severity_weights": {"low": 1.0}})
+    with pytest.raises(ValidationError, match="Phase thresholds"):
+        ScoringProfile.model_validate({"phases": {"phase2_min_risk": 99}})
+
+
+def test_summary_records_profile_digest_and_compare_checks_it() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    lenient = compile_scoring_profile(ScoringProfile(posture_normalization=900.0))
+
+    default = assess_fixture_pack(pack)
+    custom = assess_fixture_pack(pack, profile=lenient)
+    assert default.scoring_profile == default_scoring_profile().digest
+    assert custom.scoring_profile == lenient.digest
+    assert custom.org.posture_score > default.org.posture_score
+
+    before = default.model_dump(mode="json")
+    after = custom.model_dump(mode="json")
+    assert compare_summaries(before, after)["scoring_profile"]["consistent"] is False
+    with pytest.raises(ValueError, match="scored with profile"):
+        compare_summaries(before, after, scoring_profile=lenient.digest)
+
+
+@pytest.mark.parametrize("extra", [[], ["--sort-memory-mb", "1"]])
+def test_cli_plan_rejects_a_summary_scored_with_another_profile(
+    tmp_path: Path, extra: list[str]
+) -> None:
+    profile_path = tmp_path / "profile.json"
+    profile_path.write_text(json.dumps({"blast_radius_factor": 0.2}), encoding="utf-8")
+    custom = load_scoring_profile(profile_path)
+    summary = tmp_path / "summary.json"
+    summary.write_text(
+        assess_fixture_pack(
+            load_fixture_pack(FIXTURES / "before"), profile=custom
+        ).model_dump_json(),
+        encoding="utf-8",
+    )
+    runner = CliRunner()
+    base = ["plan", "--input", str(summary), "--out", str(tmp_path / "out"), *extra]
+
+    result = runner.invoke(app, base)
+    assert result.exit_code == 2
+    assert "scored with profile" in result.output
+    assert not (tmp_path / "out" / "remediation_backlog.csv").exists()
+
+    result = runner.invoke(app, [*base, "--scoring-profile", str(profile_path)])
+    assert result.exit_code == 0, result.output
+
+
+def test_planner_uses_profile_thresholds() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "after"))
+    strict = compile_scoring_profile(
+        ScoringProfile.model_validate(
+            {"phases": {"immediate_min_risk": 0, "phase1_min_risk": 0, "phase2_min_risk": 0}}
+        )
+    )
+    backlog, _ = build_backlog_and_roadmap(summary.mapped_findings, strict)
+    phase_col = backlog.headers.index("phase")
+    effort_col = backlog.headers.index("effort")
+    for row in backlog.rows:
+        expected = "Phase 0 (Immediate)" if row[effort_col] == "S" else "Phase 1 (0-30 days)"
+        assert row[phase_col] == expected
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from msb.server import AssessmentService, RequestError, create_server, server_address
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+@pytest.fixture()
+def base_url() -> Iterator[str]:
+    server = create_server(port=0, workers=2, backlog=2, input_root=FIXTURES)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server_address(server)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _call(url: str, payload: dict[str, Any] | None = None) -> tuple[int, dict[str, Any]]:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_serve_runs_pipeline_and_reports_metrics(base_url: str) -> None:
+    status, before = _call(f"{base_url}/assess", {"input": str(FIXTURES / "before")})
+    assert status == 200
+    _, after = _call(f"{base_url}/assess", {"input": str(FIXTURES / "after")})
+    assert before["controls_coverage"]["headers"][0] == "framework"
+
+    _, comparison = _call(
+        f"{base_url}/compare", {"before": before["summary"], "after": after["summary"]}
+    )
+    assert comparison["org"]["posture"]["delta"] > 0
+
+    _, plan = _call(f"{base_url}/plan", {"summary": after["summary"]})
+    _, report = _call(
+        f"{base_url}/report",
+        {"compare": comparison, **plan, "controls_coverage": after["controls_coverage"]},
+    )
+    assert report["markdown"].startswith("# ")
+    assert "<html" in report["html"]
+
+    status, err = _call(f"{base_url}/compare", {"before": {}})
+    assert status == 400
+    assert "after" in err["error"]
+    status, _ = _call(f"{base_url}/compare", {"before": [], "after": []})
+    assert status == 400
+
+    _, metrics = _call(f"{base_url}/metrics")
+    assert metrics["requests"] == 7
+    assert metrics["endpoints"]["/assess"]["requests"] == 2
+    assert metrics["endpoints"]["/compare"]["errors"] == 2
+    assert metrics["endpoints"]["/assess"]["p95_ms"] is not None
+
+
+def test_path_inputs_stay_inside_the_input_root(base_url: str, tmp_path: Path) -> None:
+    status, _ = _call(f"{base_url}/assess", {"input": "before"})
+    assert status == 200
+    for outside in ("../src", str(tmp_path), "before/../../README.md"):
+        status, err = _call(f"{base_url}/assess", {"input": outside})
+        assert status == 400
+        assert "outside the server's input root" in err["error"]
+
+    with urllib.request.urlopen(f"{base_url}/healthz", timeout=30) as resp:
+        assert resp.headers["Connection"] == "close"
+
+
+def test_path_inputs_are_refused_without_an_input_root() -> None:
+    service = AssessmentService()
+    with pytest.raises(RequestError, match="disabled"):
+        service.assess({"input": str(FIXTURES / "before")})
+
+
+def test_unix_socket_replaces_only_a_stale_socket(tmp_path: Path) -> None:
+    path = tmp_path / "msb.sock"
+    path.write_text("not a socket", encoding="utf-8")
+    with pytest.raises(ValueError, match="not a socket"):
+        create_server(unix_socket=path)
+    assert path.read_text(encoding="utf-8") == "not a socket"
+
+    path.unlink()
+    create_server(unix_socket=path).server_close()
+    assert path.is_socket()
+    server = create_server(unix_socket=path)
+    server.server_close()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from msb.cli import app
+from msb.io.fixtures import load_fixture_pack
+from msb.models import ScoringMode
+from msb.prioritization import build_backlog_and_roadmap
+from msb.scoring import PostureSimulator, assess_fixture_pack
+from msb.scoring.profile import PHASES
+from msb.synthetic import SyntheticPackConfig, generate_fixture_pack
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_baseline_matches_assessment_and_removals_only_touch_changed_targets() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    sim = PostureSimulator(summary)
+
+    baseline = sim.baseline()
+    assert baseline.org_posture == pytest.approx(summary.org.posture_score)
+    assert baseline.target_posture == {}
+    for dm in summary.org.domain_maturity:
+        assert baseline.domain_posture[dm.domain] == pytest.approx(dm.posture_0_to_100)
+
+    first = summary.mapped_findings[0].finding
+    result = sim.simulate(remove=[first.finding_id])
+    assert result.findings_changed == 1
+    assert list(result.target_posture) == [first.target_id]
+    assert result.org_posture > baseline.org_posture
+
+    everything = sim.simulate(remove=[mf.finding.finding_id for mf in summary.mapped_findings])
+    assert everything.org_posture == pytest.approx(100.0)
+
+
+def test_completing_every_action_equals_removing_the_finding() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    sim = PostureSimulator(summary)
+    finding = summary.mapped_findings[0].finding
+    items = [f"{finding.finding_id}:{a.action_id}" for a in finding.recommended_actions]
+
+    removed = sim.simulate(remove=[finding.finding_id])
+    completed = sim.simulate(complete=items)
+    assert completed.org_posture == pytest.approx(removed.org_posture)
+
+
+def test_phase_items_follow_the_backlog() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "after"))
+    backlog, _ = build_backlog_and_roadmap(summary.mapped_findings)
+    phase_col = backlog.headers.index("phase")
+    sim = PostureSimulator(summary)
+
+    for phase in PHASES:
+        expected = sorted(r[0] for r in backlog.rows if r[phase_col] == phase)
+        assert sorted(sim.items_in_phases([phase])) == expected
+
+    projected = sim.simulate(complete=sim.items_in_phases(PHASES[:2]))
+    assert projected.org_posture >= sim.baseline().org_posture
+
+
+def test_rejects_unsupported_summaries_and_unknown_ids() -> None:
+    pack = load_fixture_pack(FIXTURES / "before")
+    with pytest.raises(ValueError, match="raw scoring mode"):
+        PostureSimulator(assess_fixture_pack(pack, scoring_mode=ScoringMode.correlated))
+
+    sim = PostureSimulator(assess_fixture_pack(pack))
+    with pytest.raises(ValueError, match="Unknown finding_id"):
+        sim.simulate(remove=["F-nope"])
+    with pytest.raises(ValueError, match="Unknown backlog item"):
+        sim.simulate(complete=["F-nope:A-1"])
+    with pytest.raises(ValueError, match="Unknown phase"):
+        sim.items_in_phases(["Phase 9"])
+
+
+def test_repeated_items_count_once() -> None:
+    pack = generate_fixture_pack(SyntheticPackConfig(targets=2, findings_per_target=5))
+    summary = assess_fixture_pack(pack)
+    sim = PostureSimulator(summary)
+    finding = summary.mapped_findings[0].finding
+    assert len(finding.recommended_actions) > 1
+    item = f"{finding.finding_id}:{finding.recommended_actions[0].action_id}"
+    once = sim.simulate(complete=[item])
+    assert sim.simulate(complete=[item, item]) == once
+    assert once.org_posture < sim.simulate(remove=[finding.finding_id]).org_posture
+
+
+@pytest.mark.parametrize("phases", [[-1], [4], ["0"]])
+def test_cli_rejects_out_of_range_scenario_phases(tmp_path: Path, phases: list[object]) -> None:
+    summary = tmp_path / "summary.json"
+    summary.write_text(
+        assess_fixture_pack(load_fixture_pack(FIXTURES / "before")).model_dump_json(),
+        encoding="utf-8",
+    )
+    scenarios = tmp_path / "scenarios.json"
+    scenarios.write_text(json.dumps([{"name": "bad", "phases": phases}]), encoding="utf-8")
+    result = CliRunner().invoke(
+        app, ["simulate", "--input", str(summary), "--scenarios", str(scenarios)]
+    )
+    assert result.exit_code == 2
+    assert "phases must be 0-3" in result.output
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from msb.io.fixtures import load_fixture_pack
+from msb.models import Provider
+from msb.synthetic import SyntheticPackConfig, generate_fixture_pack, write_synthetic_pack
+
+
+def test_synthetic_pack_is_valid_and_deterministic(tmp_path: Path) -> None:
+    config = SyntheticPackConfig(
+        targets=7,
+        findings_per_target=13,
+        actions_per_finding=3,
+        assets_per_target=5,
+        assets_per_finding=2,
+        provider_mix={Provider.aws: 1.0, Provider.gcp: 1.0},
+        seed=42,
+    )
+    write_synthetic_pack(tmp_path / "pack", config)
+    pack = load_fixture_pack(tmp_path / "pack")
+
+    assert len(pack.targets) == 7
+    assert len(pack.findings) == config.finding_count == 91
+    assert {t.provider for t in pack.targets} <= {Provider.aws, Provider.gcp}
+    assets = {a.asset_id for t in pack.targets for a in t.assets}
+    for f in pack.findings:
+        assert len(f.recommended_actions) == 3
+        assert 1 <= len(f.affected_assets) <= 2
+        assert set(f.affected_assets) <= assets
+
+    assert pack == generate_fixture_pack(config)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from msb.io.fixtures import load_fixture_pack
+from msb.models import Rating
+from msb.scoring import assess_fixture_pack, default_scoring_profile, estimate_posture_uncertainty
+from msb.scoring.assess import posture_score_from_penalty
+from msb.scoring.uncertainty import _sample_triangular, rating_bounds
+
+np = pytest.importorskip("numpy")
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def test_rating_bounds_span_halfway_to_neighbours() -> None:
+    bounds = rating_bounds({Rating.low: 1.0, Rating.medium: 2.0, Rating.high: 3.0})
+    assert bounds == [(0.75, 1.0, 1.5), (1.5, 2.0, 2.5), (2.5, 3.0, 3.75)]
+
+
+def test_bands_match_per_draw_reference_computation() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "before"))
+    draws = 300
+    result = estimate_posture_uncertainty(summary, draws=draws, confidence=0.8, seed=7)
+
+    # Recompute the org score draw by draw, finding by finding, with the same samples.
+    profile = default_scoring_profile()
+    weights = profile.profile
+    rng = np.random.default_rng(7)
+    lik = _sample_triangular(rng, rating_bounds(weights.likelihood_weights), draws)
+    imp = _sample_triangular(rng, rating_bounds(weights.impact_weights), draws)
+    ratings = list(Rating)
+    postures = []
+    for d in range(draws):
+        penalty = 0.0
+        for mf in summary.mapped_findings:
+            f = mf.finding
+            penalty += (
+                weights.severity_weights[f.severity]
+                * lik[d, ratings.index(f.likelihood)]
+                * imp[d, ratings.index(f.impact)]
+                * weights.category_weights[f.category]
+                * profile.blast_multiplier(mf.blast_radius or 0.0)
+            )
+        postures.append(posture_score_from_penalty(penalty))
+
+    lower, median, upper = np.quantile(postures, [0.1, 0.5, 0.9])
+    assert result.org.lower == pytest.approx(lower)
+    assert result.org.median == pytest.approx(median)
+    assert result.org.upper == pytest.approx(upper)
+    assert result.org.lower <= summary.org.posture_score <= result.org.upper
+
+
+def test_bands_are_seeded_and_cover_every_target_and_domain() -> None:
+    summary = assess_fixture_pack(load_fixture_pack(FIXTURES / "after"))
+    a = estimate_posture_uncertainty(summary, draws=500, seed=1)
+    b = estimate_posture_uncertainty(summary, draws=500, seed=1)
+    assert a == b
+    assert set(a.targets) == {t.target_id for t in summary.targets}
+    assert set(a.domains) == {d.domain for d in summary.org.domain_maturity}
+    for band in [a.org, *a.targets.values(), *a.domains.values()]:
+        assert 0.0 <= band.lower <= band.median <= band.upper <= 100.0
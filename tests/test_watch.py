@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from jinja2 import FileSystemLoader
+from typer.testing import CliRunner
+
+import msb.reporting.render
+from msb.cli import app
+from msb.reporting.render import html_template
+from msb.watch import TEMPLATE_DIR, PollingWatcher, WatchPipeline
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+def _touch(path: Path, bump_ns: int = 10**9) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+def test_poll_reports_changed_groups_only(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+    watcher = PollingWatcher({"a": [tmp_path / "a"], "b": [tmp_path / "b.json"]})
+    assert watcher.poll() == set()
+
+    _touch(tmp_path / "b.json")
+    assert watcher.poll() == {"b"}
+    (tmp_path / "a" / "new.json").write_text("{}", encoding="utf-8")
+    assert watcher.poll() == {"a"}
+    (tmp_path / "a" / "x.json").unlink()
+    assert watcher.poll() == {"a"}
+    assert watcher.poll() == set()
+
+
+def test_wait_debounces_bursts_of_changes(tmp_path: Path) -> None:
+    path = tmp_path / "f.json"
+    path.write_text("{}", encoding="utf-8")
+    now = [0.0]
+    edits = iter([1, 2, 3])  # more writes land during the 2nd and 3rd sleeps
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+        step = next(edits, None)
+        if step is not None and step > 1:
+            _touch(path, step * 10**9)
+
+    watcher = PollingWatcher(
+        {"f": [path]}, interval=0.1, debounce=0.25, clock=lambda: now[0], sleep=sleep
+    )
+    _touch(path)
+    assert watcher.wait() == {"f"}
+    # The last write came during the 3rd sleep; three more sleeps reach the quiet period.
+    assert now[0] == pytest.approx(0.1 * 3 + 0.1 * 3)
+    assert watcher.poll() == set()
+
+
+def test_pipeline_reruns_only_affected_stages(tmp_path: Path) -> None:
+    fixtures = tmp_path / "fixtures"
+    shutil.copytree(FIXTURES / "before", fixtures / "before")
+    shutil.copytree(FIXTURES / "after", fixtures / "after")
+    out = tmp_path / "out"
+    pipeline = WatchPipeline(fixtures, out)
+
+    assert pipeline.run() == ["load", "assess", "compare", "report"]
+    assert (out / "report" / "report.html").exists()
+    assert pipeline.run() == []
+    assert pipeline.run({"templates"}) == ["report"]
+
+    before_json = out / "before" / "summary.json"
+    findings_path = fixtures / "after" / "findings.json"
+    doc = json.loads(findings_path.read_text(encoding="utf-8"))
+    doc["findings"] = doc["findings"][:-1]
+    findings_path.write_text(json.dumps(doc), encoding="utf-8")
+    before_mtime = before_json.stat().st_mtime_ns
+    assert pipeline.run({"after"}) == ["load", "assess", "compare", "report"]
+    assert before_json.stat().st_mtime_ns == before_mtime
+    after = json.loads((out / "after" / "summary.json").read_text(encoding="utf-8"))
+    assert len(after["mapped_findings"]) == len(doc["findings"])
+
+
+def test_pipeline_retries_after_a_bad_edit(tmp_path: Path) -> None:
+    fixtures = tmp_path / "fixtures"
+    shutil.copytree(FIXTURES / "before", fixtures / "before")
+    shutil.copytree(FIXTURES / "after", fixtures / "after")
+    pipeline = WatchPipeline(fixtures, tmp_path / "out")
+    pipeline.run()
+
+    findings_path = fixtures / "before" / "findings.json"
+    good = findings_path.read_text(encoding="utf-8")
+    findings_path.write_text(good[: len(good) // 2], encoding="utf-8")
+    with pytest.raises(ValueError):
+        pipeline.run({"before"})
+    findings_path.write_text(good, encoding="utf-8")
+    assert pipeline.run({"before"}) == ["load", "assess", "compare", "report"]
+
+
+def test_cli_watch_survives_broken_templates_and_fixtures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fixtures = tmp_path / "fixtures"
+    shutil.copytree(FIXTURES / "before", fixtures / "before")
+    shutil.copytree(FIXTURES / "after", fixtures / "after")
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATE_DIR, templates)
+    monkeypatch.setattr(
+        msb.reporting.render, "PackageLoader", lambda *_: FileSystemLoader(templates)
+    )
+
+    template = templates / "report.html.j2"
+    findings = fixtures / "before" / "findings.json"
+    good_template = template.read_text(encoding="utf-8")
+    good_findings = findings.read_text(encoding="utf-8")
+
+    def break_template() -> set[str]:
+        template.write_text("{% if %}", encoding="utf-8")
+        return {"templates"}
+
+    def break_findings() -> set[str]:
+        template.write_text(good_template, encoding="utf-8")
+        findings.write_text("{}", encoding="utf-8")
+        return {"before"}
+
+    def fix_findings() -> set[str]:
+        findings.write_text(good_findings, encoding="utf-8")
+        return {"before"}
+
+    def stop() -> set[str]:
+        raise KeyboardInterrupt
+
+    edits = iter([break_template, break_findings, fix_findings, stop])
+    monkeypatch.setattr(PollingWatcher, "wait", lambda self: next(edits)())
+    html_template.cache_clear()
+    try:
+        result = CliRunner().invoke(
+            app, ["watch", "--fixtures", str(fixtures), "--out", str(tmp_path / "out")]
+        )
+    finally:
+        html_template.cache_clear()
+
+    assert result.exit_code == 0, result.output
+    assert "TemplateSyntaxError" in result.output
+    assert "KeyError" in result.output
+    assert "[1] before, templates: load -> assess -> compare -> report" in result.output
+    assert "Stopped watching." in result.output